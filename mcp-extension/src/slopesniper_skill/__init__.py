@@ -27,42 +27,67 @@ Example:
 # Beta versions use 0.x.x (0.MINOR.PATCH)
 __version__ = "0.3.41"
 
-from .tools import (
-    export_wallet,
-    get_portfolio_pnl,
-    # Onboarding
-    get_status,
-    get_strategy,
-    get_trade_history,
-    get_watchlist,
-    list_strategies,
-    # PnL tracking
-    pnl_export,
-    pnl_init,
-    pnl_positions,
-    pnl_reset,
-    pnl_stats,
-    pnl_with_baseline,
-    quick_trade,
-    record_trade,
-    remove_from_watchlist,
-    # Scanner
-    scan_opportunities,
-    # Strategies
-    set_strategy,
-    setup_wallet,
-    solana_check_token,
-    # Core trading tools
-    solana_get_price,
-    solana_get_wallet,
-    solana_quote,
-    solana_resolve_token,
-    solana_search_token,
-    solana_swap_confirm,
-    watch_token,
-)
-from .tools.config import PolicyConfig, get_policy_config
-from .tools.policy import KNOWN_SAFE_MINTS, PolicyResult, check_policy
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .tools import (
+        export_wallet,
+        get_portfolio_pnl,
+        # Onboarding
+        get_status,
+        get_strategy,
+        get_trade_history,
+        get_watchlist,
+        list_strategies,
+        # PnL tracking
+        pnl_export,
+        pnl_init,
+        pnl_positions,
+        pnl_reset,
+        pnl_stats,
+        pnl_with_baseline,
+        quick_trade,
+        record_trade,
+        remove_from_watchlist,
+        # Scanner
+        scan_opportunities,
+        # Strategies
+        set_strategy,
+        setup_wallet,
+        solana_check_token,
+        # Core trading tools
+        solana_get_price,
+        solana_get_wallet,
+        solana_quote,
+        solana_resolve_token,
+        solana_search_token,
+        solana_swap_confirm,
+        watch_token,
+    )
+    from .tools.config import PolicyConfig, get_policy_config
+    from .tools.policy import KNOWN_SAFE_MINTS, PolicyResult, check_policy
+
+# Public names are resolved on first access (PEP 562) so that importing a
+# light submodule such as slopesniper_skill.cli doesn't drag in aiohttp,
+# solders and every tool module up front.
+_LAZY_SUBMODULES = {
+    "PolicyConfig": ".tools.config",
+    "get_policy_config": ".tools.config",
+    "check_policy": ".tools.policy",
+    "PolicyResult": ".tools.policy",
+    "KNOWN_SAFE_MINTS": ".tools.policy",
+}
+
+
+def __getattr__(name: str):
+    if name not in __all__ or name == "__version__":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(_LAZY_SUBMODULES.get(name, ".tools"), __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
 
 __all__ = [
     # Version
@@ -107,3 +132,7 @@ __all__ = [
     "PolicyResult",
     "KNOWN_SAFE_MINTS",
 ]
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
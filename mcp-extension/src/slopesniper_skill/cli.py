@@ -51,6 +51,7 @@ Auto-sell targets:
     slopesniper target remove <id>      Cancel a target
     slopesniper watch <token> --mcap <value> [--sell all] [--interval 5]
     slopesniper daemon start [--interval 15]
+    slopesniper daemon run [--interval 15]
     slopesniper daemon stop
     slopesniper daemon status
 
@@ -61,14 +62,141 @@ Global flags:
 
 from __future__ import annotations
 
-import asyncio
+import contextlib
 import json
+import os
 import sys
+from collections.abc import Coroutine, Iterator
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, TypeVar
+
+# Already loaded with the package, so this is free (unlike the tool imports)
+from . import __version__
+
+T = TypeVar("T")
+
+# Set by main() for --quiet: scripted, JSON-only use
+_QUIET = False
+
+# Latest-version lookup (shared by `version --check` and `update`)
+RAW_GITHUB_HOST = "raw.githubusercontent.com"
+PYPROJECT_PATH = "/BAGWATCHER/SlopeSniper/main/mcp-extension/pyproject.toml"
+CHANGELOG_PATH = "/BAGWATCHER/SlopeSniper/main/CHANGELOG.md"
+VERSION_CHECK_FILE = Path.home() / ".slopesniper" / "version_check.json"
+VERSION_CHECK_TTL_SECONDS = 3600
+RESOLVER_CACHE_FILE = Path.home() / ".slopesniper" / "resolver_cache.json"
+RESOLVER_CACHE_TTL_SECONDS = 24 * 3600
+
+# Package spec used by `update` (--refresh/--no-cache-dir bust the git cache)
+INSTALL_SPEC = "slopesniper-mcp @ git+https://github.com/BAGWATCHER/SlopeSniper.git#subdirectory=mcp-extension"
+# A hung installer (e.g. stuck git fetch) moves on to the next one after this
+INSTALL_TIMEOUT_SECONDS = 300
+
+# Start of the `version = "x.y.z"` line in our pyproject.toml
+_VERSION_KEY = b'version = "'
+# The version sits at the top of the [project] table; give up past this
+VERSION_SCAN_MAX_BYTES = 16 * 1024
+
+
+try:
+    import orjson
+except ImportError:  # Optional - falls back to stdlib json
+    orjson = None
+else:
+    _ORJSON_OPTIONS = (
+        orjson.OPT_INDENT_2
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_APPEND_NEWLINE
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+
+def _encode_json(data: dict) -> bytes:
+    """Encode data as indented JSON bytes with a trailing newline."""
+    if orjson is not None:
+        try:
+            # Passthrough options route datetimes/dataclasses to default=str,
+            # matching what the stdlib path prints
+            return orjson.dumps(data, default=str, option=_ORJSON_OPTIONS)
+        except TypeError:
+            pass  # e.g. ints wider than 64 bits - let stdlib handle it
+    return (json.dumps(data, indent=2, default=str) + "\n").encode()
+
+
+def _run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run an async command to completion.
+
+    asyncio is imported here rather than at module level so sync commands
+    (history, config, version, ...) never pay for it. uvloop is used when
+    installed (it isn't available on Windows).
+    """
+    import asyncio
+
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+    return asyncio.run(coro)
+
+
+def _print_lines(*lines: str) -> None:
+    """Print a block of lines with a single write (one syscall on a TTY)."""
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_json(data: dict) -> None:
     """Print data as formatted JSON."""
-    print(json.dumps(data, indent=2, default=str))
+    payload = _encode_json(data)
+    out = getattr(sys.stdout, "buffer", None)
+    if out is None:
+        sys.stdout.write(payload.decode())
+        return
+    # Flush pending text first so output stays in order with earlier print()s,
+    # then hand the bytes straight to the fd - one syscall, no buffer copy
+    sys.stdout.flush()
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        out.write(payload)  # Redirected to an in-memory stream (e.g. tests)
+        return
+    view = memoryview(payload)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+# Sections of the `status` output that are straight copies from one of the
+# fetched dicts: output key -> (source, source key, default)
+_STATUS_SCHEMA = {
+    "wallet": (
+        ("configured", "status", "wallet_configured", False),
+        ("address", "status", "wallet_address", None),
+        ("sol_balance", "wallet", "sol_balance", None),
+        ("sol_value_usd", "wallet", "sol_value_usd", None),
+        ("tokens", "wallet", "tokens", ()),
+    ),
+    "strategy": (
+        ("name", "strategy", "name", None),
+        ("max_trade_usd", "strategy", "max_trade_usd", None),
+        ("auto_execute_under_usd", "strategy", "auto_execute_under_usd", None),
+        ("slippage_bps", "strategy", "slippage_bps", None),
+        ("require_rugcheck", "strategy", "require_rugcheck", None),
+    ),
+    "config": (
+        ("jupiter_api_key", "config", "jupiter_api_key_status", None),
+        ("rpc", "config", "rpc", None),
+    ),
+}
+
+
+def _project(sources: dict[str, dict], spec: tuple) -> dict:
+    """Build one output section from a _STATUS_SCHEMA spec."""
+    return {key: sources[src].get(src_key, default) for key, src, src_key, default in spec}
 
 
 async def cmd_status() -> None:
@@ -77,10 +205,23 @@ async def cmd_status() -> None:
     from .tools.config import get_config_status
     from .tools.targets import get_active_targets
 
-    # Get all status info
-    status = await get_status()
-    wallet = await solana_get_wallet() if status.get("wallet_configured") else {}
-    strategy = await get_strategy()
+    import asyncio
+
+    # Fetch status, wallet and strategy concurrently. get_status() runs first
+    # and creates the wallet (synchronously) on first run, so the wallet
+    # lookup started alongside it already sees it.
+    fetched = await asyncio.gather(
+        get_status(), solana_get_wallet(), get_strategy(), return_exceptions=True
+    )
+    # A failed lookup leaves its section empty instead of failing the command
+    errors = {}
+    for i, name in enumerate(("status", "wallet", "strategy")):
+        if isinstance(fetched[i], Exception):
+            errors[name] = str(fetched[i])
+            fetched[i] = {}
+    status, wallet, strategy = fetched
+    if not status.get("wallet_configured"):
+        wallet = {}
     config = get_config_status()
 
     # Get monitoring info (targets + daemon)
@@ -108,69 +249,63 @@ async def cmd_status() -> None:
     except Exception:
         daemon_running = False
 
-    result = {
-        "wallet": {
-            "configured": status.get("wallet_configured", False),
-            "address": status.get("wallet_address"),
-            "sol_balance": wallet.get("sol_balance"),
-            "sol_value_usd": wallet.get("sol_value_usd"),
-            "tokens": wallet.get("tokens", []),
-        },
-        "strategy": {
-            "name": strategy.get("name"),
-            "max_trade_usd": strategy.get("max_trade_usd"),
-            "auto_execute_under_usd": strategy.get("auto_execute_under_usd"),
-            "slippage_bps": strategy.get("slippage_bps"),
-            "require_rugcheck": strategy.get("require_rugcheck"),
-        },
-        "config": {
-            "jupiter_api_key": config.get("jupiter_api_key_status"),
-            "rpc": config.get("rpc"),
-        },
+    sources = {"status": status, "wallet": wallet, "strategy": strategy, "config": config}
+    result = {section: _project(sources, spec) for section, spec in _STATUS_SCHEMA.items()}
+    result.update({
         "monitoring": {
             "daemon_running": daemon_running,
             "active_targets": len(targets_summary),
             "targets": targets_summary,
         },
         "ready_to_trade": status.get("ready_to_trade", False),
-    }
+    })
+    if errors:
+        result["errors"] = errors
     print_json(result)
 
 
-def cmd_setup(import_key: str | None = None) -> None:
+async def cmd_setup(import_key: str | None = None) -> None:
     """Interactive wallet setup with confirmation."""
+    import hmac
+
     from .tools.config import load_local_wallet
     from .tools.onboarding import create_wallet_explicit, setup_wallet
 
     # Check if wallet already exists
     existing = load_local_wallet()
     if existing and not import_key:
-        print("")
-        print("Wallet already configured!")
-        print(f"  Address: {existing['address']}")
-        print("")
-        print("To import a different wallet (current will be backed up):")
-        print("  slopesniper setup --import-key YOUR_PRIVATE_KEY")
-        print("")
-        print("To view/export your current key:")
-        print("  slopesniper export")
-        print("")
+        _print_lines(
+            "",
+            "Wallet already configured!",
+            f"  Address: {existing['address']}",
+            "",
+            "To import a different wallet (current will be backed up):",
+            "  slopesniper setup --import-key YOUR_PRIVATE_KEY",
+            "",
+            "To view/export your current key:",
+            "  slopesniper export",
+            "",
+        )
         return
 
-    print("")
-    print("=" * 60)
-    print("  SlopeSniper Wallet Setup")
-    print("=" * 60)
-    print("")
+    _print_lines(
+        "",
+        "=" * 60,
+        "  SlopeSniper Wallet Setup",
+        "=" * 60,
+        "",
+    )
 
     if import_key:
         # Import existing private key
-        result = asyncio.run(setup_wallet(private_key=import_key))
+        result = await setup_wallet(private_key=import_key)
         if result.get("success"):
-            print("Wallet imported successfully!")
-            print(f"  Address: {result['wallet_address']}")
-            print("")
-            print("Send SOL to this address to start trading.")
+            _print_lines(
+                "Wallet imported successfully!",
+                f"  Address: {result['wallet_address']}",
+                "",
+                "Send SOL to this address to start trading.",
+            )
         else:
             print(f"Error: {result.get('error')}")
             if result.get("hint"):
@@ -179,64 +314,70 @@ def cmd_setup(import_key: str | None = None) -> None:
         return
 
     # New wallet creation - get user confirmation
-    print("This will create a new Solana trading wallet.")
-    print("")
-    print("IMPORTANT:")
-    print("  - You will receive a PRIVATE KEY")
-    print("  - Anyone with this key can access your funds")
-    print("  - You MUST save it securely - it cannot be recovered")
-    print("")
+    _print_lines(
+        "This will create a new Solana trading wallet.",
+        "",
+        "IMPORTANT:",
+        "  - You will receive a PRIVATE KEY",
+        "  - Anyone with this key can access your funds",
+        "  - You MUST save it securely - it cannot be recovered",
+        "",
+    )
 
     try:
         confirm = input("Create new wallet? (yes/no): ").strip().lower()
         if confirm != "yes":
-            print("")
-            print("Setup cancelled.")
+            _print_lines("", "Setup cancelled.")
             return
     except (EOFError, KeyboardInterrupt):
         print("\nSetup cancelled.")
         return
 
     # Generate wallet
-    result = asyncio.run(create_wallet_explicit())
+    result = await create_wallet_explicit()
 
     # Display with emphasis
-    print("")
-    print("=" * 60)
-    print("  WALLET CREATED - SAVE YOUR PRIVATE KEY NOW!")
-    print("=" * 60)
-    print("")
-    print(f"  Address: {result['address']}")
-    print("")
-    print("  Private Key:")
-    print(f"  {result['private_key']}")
-    print("")
-    print("=" * 60)
-    print("")
+    _print_lines(
+        "",
+        "=" * 60,
+        "  WALLET CREATED - SAVE YOUR PRIVATE KEY NOW!",
+        "=" * 60,
+        "",
+        f"  Address: {result['address']}",
+        "",
+        "  Private Key:",
+        f"  {result['private_key']}",
+        "",
+        "=" * 60,
+        "",
+    )
 
     # Require confirmation they saved it
     try:
-        print("To confirm you saved your key, type your wallet address:")
+        print("To confirm you saved your key, type the last 6 characters of your address:")
         user_addr = input("> ").strip()
-        if user_addr != result["address"]:
-            print("")
-            print("WARNING: Address doesn't match!")
-            print(f"Your address is: {result['address']}")
-            print("Make sure you saved your private key correctly.")
-            print("")
+        if not hmac.compare_digest(user_addr.encode(), result["address"][-6:].encode()):
+            _print_lines(
+                "",
+                "WARNING: Address doesn't match!",
+                f"Your address is: {result['address']}",
+                "Make sure you saved your private key correctly.",
+                "",
+            )
             return
     except (EOFError, KeyboardInterrupt):
-        print("\nPlease make sure you saved your private key!")
-        print("")
+        _print_lines("\nPlease make sure you saved your private key!", "")
         return
 
-    print("")
-    print("Setup complete! Send SOL to your address to start trading.")
-    print("")
-    print("Next steps:")
-    print("  slopesniper status   - Check balance")
-    print("  slopesniper export   - Backup key anytime")
-    print("")
+    _print_lines(
+        "",
+        "Setup complete! Send SOL to your address to start trading.",
+        "",
+        "Next steps:",
+        "  slopesniper status   - Check balance",
+        "  slopesniper export   - Backup key anytime",
+        "",
+    )
 
 
 async def cmd_wallet() -> None:
@@ -324,8 +465,9 @@ def cmd_history(limit: int = 20) -> None:
     """Show trade history."""
     from . import get_trade_history
 
-    result = get_trade_history(limit=limit)
-    print_json({"trades": result, "count": len(result)})
+    trades = get_trade_history(limit=limit)
+    # count goes first so consumers can read it before the (long) trades list
+    print_json({"count": len(trades), "trades": trades})
 
 
 async def cmd_price(token: str) -> None:
@@ -411,32 +553,55 @@ async def cmd_scan(filter_type: str = "all") -> None:
     print_json(result)
 
 
+# Config keys are matched with '-' and ' ' normalized to '_'
+_CONFIG_KEY_TRANS = str.maketrans("- ", "__")
+
+# `config --set` key aliases -> handler(config_module, value)
+_CONFIG_SET_HANDLERS = {
+    **dict.fromkeys(
+        ("jupiter_key", "jupiter_api_key", "jup_key", "jup"),
+        lambda cfg, value: cfg.set_jupiter_api_key(value),
+    ),
+    # For provider, we need a second value - assume custom URL
+    **dict.fromkeys(
+        ("rpc_provider", "rpc_type"),
+        lambda cfg, value: cfg.set_rpc_config(value, value),
+    ),
+    **dict.fromkeys(
+        ("rpc_url", "rpc", "solana_rpc"),
+        lambda cfg, value: cfg.set_rpc_config("custom", value),
+    ),
+    "helius": lambda cfg, value: cfg.set_rpc_config("helius", value),
+    "quicknode": lambda cfg, value: cfg.set_rpc_config("quicknode", value),
+    "alchemy": lambda cfg, value: cfg.set_rpc_config("alchemy", value),
+}
+
+# `config --clear` key aliases -> handler(config_module)
+_CONFIG_CLEAR_HANDLERS = {
+    **dict.fromkeys(
+        ("rpc", "rpc_url", "rpc_provider"),
+        lambda cfg: cfg.clear_rpc_config(),
+    ),
+    **dict.fromkeys(
+        ("jupiter", "jupiter_key", "jupiter_api_key", "jup", "jup_key"),
+        lambda cfg: cfg.clear_jupiter_api_key(),
+    ),
+}
+
+
 def cmd_config(
     set_key: str | None = None,
     set_value: str | None = None,
     clear_key: str | None = None,
 ) -> None:
     """View or update configuration."""
-    from .tools.config import (
-        clear_jupiter_api_key,
-        clear_rpc_config,
-        get_config_status,
-        set_jupiter_api_key,
-        set_rpc_config,
-    )
+    from .tools import config as cfg
 
     if set_key and set_value:
-        key_lower = set_key.lower().replace("-", "_").replace(" ", "_")
-
-        if key_lower in ("jupiter_key", "jupiter_api_key", "jup_key", "jup"):
-            result = set_jupiter_api_key(set_value)
-        elif key_lower in ("rpc_provider", "rpc_type"):
-            # For provider, we need a second value - assume custom URL
-            result = set_rpc_config(set_value, set_value)
-        elif key_lower in ("rpc_url", "rpc", "solana_rpc"):
-            result = set_rpc_config("custom", set_value)
-        elif key_lower in ("helius", "quicknode", "alchemy"):
-            result = set_rpc_config(key_lower, set_value)
+        key_lower = set_key.lower().translate(_CONFIG_KEY_TRANS)
+        handler = _CONFIG_SET_HANDLERS.get(key_lower)
+        if handler:
+            result = handler(cfg, set_value)
         else:
             result = {
                 "error": f"Unknown config key: {set_key}",
@@ -445,18 +610,15 @@ def cmd_config(
         print_json(result)
 
     elif clear_key:
-        key_lower = clear_key.lower().replace("-", "_").replace(" ", "_")
-        if key_lower in ("rpc", "rpc_url", "rpc_provider"):
-            result = clear_rpc_config()
-            print_json(result)
-        elif key_lower in ("jupiter", "jupiter_key", "jupiter_api_key", "jup", "jup_key"):
-            result = clear_jupiter_api_key()
-            print_json(result)
+        key_lower = clear_key.lower().translate(_CONFIG_KEY_TRANS)
+        clear_handler = _CONFIG_CLEAR_HANDLERS.get(key_lower)
+        if clear_handler:
+            print_json(clear_handler(cfg))
         else:
             print_json({"error": f"Cannot clear: {clear_key}", "clearable": ["rpc", "jupiter-key"]})
 
     else:
-        result = get_config_status()
+        result = cfg.get_config_status()
         print_json(result)
 
 
@@ -474,8 +636,6 @@ def cmd_health(diagnose: bool = False) -> None:
     - RPC configuration status
     - Overall system health
     """
-    from . import __version__
-
     from .tools.config import (
         get_config_status,
         get_wallet_integrity_status,
@@ -514,11 +674,14 @@ def cmd_health(diagnose: bool = False) -> None:
     # Add warning if wallet mismatch detected
     if not sync_status["is_synced"]:
         result["WARNING"] = sync_status["warning"]
-        result["fix_options"] = [
-            "1. To use the LOCAL wallet: unset SOLANA_PRIVATE_KEY environment variable",
-            "2. To sync ENV to LOCAL: slopesniper setup --import-key $SOLANA_PRIVATE_KEY",
-            "3. To see which wallet is active: check 'active_source' above",
-        ]
+        # Human-oriented remediation text; scripts running --quiet only
+        # need the machine-readable fields above
+        if not _QUIET:
+            result["fix_options"] = [
+                "1. To use the LOCAL wallet: unset SOLANA_PRIVATE_KEY environment variable",
+                "2. To sync ENV to LOCAL: slopesniper setup --import-key $SOLANA_PRIVATE_KEY",
+                "3. To see which wallet is active: check 'active_source' above",
+            ]
 
     # Run comprehensive diagnostics if requested
     if diagnose:
@@ -552,10 +715,131 @@ def cmd_restore(timestamp: str) -> None:
     print_json(result)
 
 
+def _scan_version(data: bytes) -> str | None:
+    """Pull the version out of a pyproject.toml body (None if it has none)."""
+    if data.startswith(_VERSION_KEY):
+        start = len(_VERSION_KEY)
+    else:
+        start = data.find(b"\n" + _VERSION_KEY)
+        if start < 0:
+            return None
+        start += len(_VERSION_KEY) + 1
+    end = data.find(b'"', start)
+    return data[start:end].decode() if end >= 0 else None
+
+
+def _read_version(body: Any) -> str | None:
+    """Read a pyproject.toml stream until its version line turns up."""
+    buf = bytearray()
+    while len(buf) < VERSION_SCAN_MAX_BYTES:
+        chunk = body.read(512)
+        if not chunk:
+            break
+        buf.extend(chunk)
+        version = _scan_version(buf)
+        if version:
+            return version
+    return None
+
+
+@contextlib.contextmanager
+def _raw_github_stream(path: str, headers: dict | None = None) -> Iterator[tuple[Any, Any]]:
+    """
+    Open a raw.githubusercontent.com path for streaming.
+
+    Goes through the shared HTTP helper, which keeps one keep-alive
+    connection per host (so `update`'s two fetches share a handshake),
+    follows redirects, and uses urlopen behind a proxy. The response is
+    closed, or drained back into the pool, when the block exits.
+
+    Args:
+        path: Path of the file to fetch
+        headers: Extra request headers
+
+    Yields:
+        Tuple of (readable body, gunzipped when the server compressed it,
+        response headers)
+
+    Raises:
+        urllib.error.HTTPError: Non-2xx response, including 304
+    """
+    from .utils import http_stream
+
+    with http_stream(
+        f"https://{RAW_GITHUB_HOST}{path}",
+        headers={"User-Agent": "SlopeSniper", "Accept-Encoding": "gzip", **(headers or {})},
+    ) as (resp, resp_headers):
+        if resp_headers.get("Content-Encoding") != "gzip":
+            yield resp, resp_headers
+            return
+
+        import gzip
+
+        with gzip.GzipFile(fileobj=resp) as body:
+            yield body, resp_headers
+
+
+def _fetch_latest_version(use_cache: bool = True) -> str | None:
+    """
+    Get the latest released version from GitHub.
+
+    The result is cached in VERSION_CHECK_FILE for an hour so scripted
+    `version --check` calls don't hit GitHub every time. Once the TTL
+    expires, the stored ETag lets GitHub answer with a cheap 304.
+
+    Args:
+        use_cache: If False, always ask GitHub (the answer is still cached)
+
+    Returns:
+        Latest version string, or None if it couldn't be parsed
+    """
+    import time
+    import urllib.error
+
+    cache: dict = {}
+    try:
+        cache = json.loads(VERSION_CHECK_FILE.read_text())
+    except Exception:
+        pass
+
+    if (
+        use_cache
+        and cache.get("latest")
+        and time.time() - cache.get("checked_at", 0) < VERSION_CHECK_TTL_SECONDS
+    ):
+        return cache["latest"]
+
+    headers = {"User-Agent": "SlopeSniper"}
+    if cache.get("latest") and cache.get("etag"):
+        headers["If-None-Match"] = cache["etag"]
+
+    try:
+        with _raw_github_stream(PYPROJECT_PATH, headers) as (body, resp_headers):
+            latest = _read_version(body)
+    except urllib.error.HTTPError as e:
+        if e.code != 304 or not cache.get("latest"):
+            raise
+        # Not Modified - our cached version is still current
+        latest = cache["latest"]
+        etag = cache.get("etag")
+    else:
+        etag = resp_headers.get("ETag")
+    if not latest:
+        return None
+
+    try:
+        VERSION_CHECK_FILE.parent.mkdir(parents=True, exist_ok=True)
+        VERSION_CHECK_FILE.write_text(
+            json.dumps({"latest": latest, "etag": etag, "checked_at": time.time()})
+        )
+    except Exception:
+        pass  # Non-critical
+
+    return latest
+
+
 def cmd_version(check_latest: bool = False) -> None:
     """Show current version and optionally check for updates."""
-    from . import __version__
-
     result = {
         "version": __version__,
         "package": "slopesniper-mcp",
@@ -565,34 +849,75 @@ def cmd_version(check_latest: bool = False) -> None:
 
     if check_latest:
         try:
-            import re
-            import urllib.request
-
-            # Fetch pyproject.toml from GitHub to get latest version
-            url = "https://raw.githubusercontent.com/BAGWATCHER/SlopeSniper/main/mcp-extension/pyproject.toml"
-            req = urllib.request.Request(url, headers={"User-Agent": "SlopeSniper"})
-            with urllib.request.urlopen(req, timeout=5) as resp:
-                content = resp.read().decode()
-                match = re.search(r'version\s*=\s*"([^"]+)"', content)
-                if match:
-                    latest = match.group(1)
-                    result["latest_version"] = latest
-                    result["update_available"] = latest != __version__
-                    if latest != __version__:
-                        result["update_command"] = "slopesniper update"
+            latest = _fetch_latest_version()
+            if latest:
+                result["latest_version"] = latest
+                result["update_available"] = latest != __version__
+                if latest != __version__:
+                    result["update_command"] = "slopesniper update"
         except Exception:
             result["latest_version"] = "unknown (couldn't check)"
 
     print_json(result)
 
 
+def _read_changelog_summary(resp, max_lines: int = 15) -> list[str]:
+    """
+    Pull the newest release section out of a CHANGELOG.md response.
+
+    The response is read in chunks and scanned for "## [" headings with
+    str.find, so only the headings are inspected and reading stops once the
+    heading after our section arrives - the rest of the file is never
+    downloaded or split.
+
+    Args:
+        resp: File-like HTTP response positioned at the start of the file
+        max_lines: Maximum number of non-blank lines to return
+
+    Returns:
+        The "## [x.y.z]" heading followed by the section's non-blank lines
+    """
+    import codecs
+
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    text = "\n"  # Lets a heading on the very first line match "\n## ["
+    pos = 0  # Where to resume the heading search
+    start = end = -1
+    while end < 0:
+        chunk = resp.read(4096)
+        text += decoder.decode(chunk, final=not chunk)
+        if not chunk:
+            text += "\n"  # Terminate a heading on the last line
+        while end < 0:
+            heading = text.find("\n## [", pos)
+            eol = text.find("\n", heading + 1) if heading >= 0 else -1
+            if eol < 0:
+                break  # Need more data to see the whole heading line
+            pos = eol
+            if start >= 0:
+                end = heading  # Next heading ends our section
+            elif "Unreleased" not in text[heading:eol]:
+                start = heading + 1
+        if not chunk:
+            break
+
+    if start < 0:
+        return []
+    section = text[start:end] if end >= 0 else text[start:]
+    return [line for line in section.split("\n") if line.strip()][:max_lines]
+
+
+@lru_cache(maxsize=None)
+def _which(name: str) -> str | None:
+    """shutil.which(), cached - PATH doesn't change during a CLI run."""
+    import shutil
+
+    return shutil.which(name)
+
+
 def cmd_update() -> None:
     """Update to latest version from GitHub."""
-    import re
     import subprocess
-    import urllib.request
-
-    from . import __version__
 
     old_version = __version__
 
@@ -600,75 +925,51 @@ def cmd_update() -> None:
     print(f"Current version: {old_version}")
     print("")
 
-    success = False
-    method = ""
+    # Decide which installers exist up front instead of forking each one
+    # and waiting for FileNotFoundError
+    uv_path = _which("uv")
+    pip_path = _which("pip")
 
-    # Try uv tool first (preferred for CLI tools)
-    try:
-        result = subprocess.run(
-            [
-                "uv",
-                "tool",
-                "install",
-                "slopesniper-mcp @ git+https://github.com/BAGWATCHER/SlopeSniper.git#subdirectory=mcp-extension",
-                "--force",
-                "--refresh",  # Bust git cache
-            ],
-            capture_output=True,
-            text=True,
+    attempts: list[tuple[str, list[str]]] = []
+    if uv_path:
+        # Try uv tool first (preferred for CLI tools)
+        attempts.append(
+            ("uv tool", [uv_path, "tool", "install", INSTALL_SPEC, "--force", "--refresh"])
+        )
+        # Fallback to uv pip
+        attempts.append(
+            ("uv pip", [uv_path, "pip", "install", "--force-reinstall", "--refresh", INSTALL_SPEC])
+        )
+    if pip_path:
+        # Final fallback to pip (--no-cache-dir busts pip cache)
+        attempts.append(
+            ("pip", [pip_path, "install", "--force-reinstall", "--no-cache-dir", INSTALL_SPEC])
         )
-        if result.returncode == 0:
-            success = True
-            method = "uv tool"
-    except FileNotFoundError:
-        pass
-
-    # Fallback to uv pip
-    if not success:
-        try:
-            result = subprocess.run(
-                [
-                    "uv",
-                    "pip",
-                    "install",
-                    "--force-reinstall",
-                    "--refresh",  # Bust git cache
-                    "slopesniper-mcp @ git+https://github.com/BAGWATCHER/SlopeSniper.git#subdirectory=mcp-extension",
-                ],
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode == 0:
-                success = True
-                method = "uv pip"
-        except FileNotFoundError:
-            pass
 
-    # Final fallback to pip
-    if not success:
+    success = False
+    method = ""
+    for name, install_cmd in attempts:
+        # Only the exit status matters, so don't pipe (and buffer) the output
         try:
             result = subprocess.run(
-                [
-                    "pip",
-                    "install",
-                    "--force-reinstall",
-                    "--no-cache-dir",  # Bust pip cache
-                    "slopesniper-mcp @ git+https://github.com/BAGWATCHER/SlopeSniper.git#subdirectory=mcp-extension",
-                ],
-                capture_output=True,
-                text=True,
+                install_cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=False,
+                timeout=INSTALL_TIMEOUT_SECONDS,
             )
-            if result.returncode == 0:
-                success = True
-                method = "pip"
-        except FileNotFoundError:
-            pass
+        except subprocess.TimeoutExpired:
+            continue
+        if result.returncode == 0:
+            success = True
+            method = name
+            break
 
     if not success:
         print_json(
             {
                 "error": "Update failed",
-                "suggestion": "Try manually: uv tool install 'slopesniper-mcp @ git+https://github.com/BAGWATCHER/SlopeSniper.git#subdirectory=mcp-extension' --force",
+                "suggestion": f"Try manually: uv tool install '{INSTALL_SPEC}' --force",
             }
         )
         return
@@ -676,38 +977,15 @@ def cmd_update() -> None:
     # Fetch new version from GitHub
     new_version = "unknown"
     changelog_summary = []
+    # Both files come from the same host; the second fetch reuses the
+    # first one's pooled connection
     try:
-        # Get version
-        version_url = "https://raw.githubusercontent.com/BAGWATCHER/SlopeSniper/main/mcp-extension/pyproject.toml"
-        req = urllib.request.Request(version_url, headers={"User-Agent": "SlopeSniper"})
-        with urllib.request.urlopen(req, timeout=5) as resp:
-            content = resp.read().decode()
-            match = re.search(r'version\s*=\s*"([^"]+)"', content)
-            if match:
-                new_version = match.group(1)
-
-        # Get recent changelog
-        changelog_url = "https://raw.githubusercontent.com/BAGWATCHER/SlopeSniper/main/CHANGELOG.md"
-        req = urllib.request.Request(changelog_url, headers={"User-Agent": "SlopeSniper"})
-        with urllib.request.urlopen(req, timeout=5) as resp:
-            changelog = resp.read().decode()
-            # Extract first version section (after [Unreleased])
-            lines = changelog.split("\n")
-            in_section = False
-            section_count = 0
-            for line in lines:
-                if line.startswith("## [") and "Unreleased" not in line:
-                    if section_count == 0:
-                        in_section = True
-                        changelog_summary.append(line)
-                        section_count += 1
-                    else:
-                        break
-                elif in_section:
-                    if line.startswith("## ["):
-                        break
-                    if line.strip():
-                        changelog_summary.append(line)
+        # Get version (bypass the cache - we just installed a new one)
+        new_version = _fetch_latest_version(use_cache=False) or new_version
+
+        # Get recent changelog, streamed so reading stops after our section
+        with _raw_github_stream(CHANGELOG_PATH) as (body, _):
+            changelog_summary = _read_changelog_summary(body)
     except Exception:
         pass
 
@@ -722,7 +1000,7 @@ def cmd_update() -> None:
     if changelog_summary:
         print("What's new:")
         print("-" * 50)
-        for line in changelog_summary[:15]:  # Limit to 15 lines
+        for line in changelog_summary:
             print(line)
         print("-" * 50)
         print("")
@@ -738,60 +1016,64 @@ def cmd_uninstall(keep_data: bool = False, confirm: bool = False) -> None:
 
     from .tools.config import SLOPESNIPER_DIR
 
-    print("")
-    print("=" * 50)
-    print("  SlopeSniper Uninstall")
-    print("=" * 50)
-    print("")
+    _print_lines(
+        "",
+        "=" * 50,
+        "  SlopeSniper Uninstall",
+        "=" * 50,
+        "",
+    )
 
     # Check for wallet
     wallet_exists = (SLOPESNIPER_DIR / "wallet.enc").exists()
 
     if wallet_exists:
-        print("WARNING: You have a wallet configured!")
-        print("")
+        _print_lines("WARNING: You have a wallet configured!", "")
         # Try to show the address
         try:
             from .tools.config import load_local_wallet
 
             wallet = load_local_wallet()
             if wallet:
-                print(f"  Wallet address: {wallet['address']}")
-                print("")
+                _print_lines(f"  Wallet address: {wallet['address']}", "")
         except Exception:
             pass
 
-        print("IMPORTANT: Before uninstalling, make sure you have:")
-        print("  1. Exported your private key: slopesniper export")
-        print("  2. Saved it in a secure location")
-        print("  3. Transferred any remaining funds")
-        print("")
-        print("If you lose your private key, YOUR FUNDS WILL BE LOST FOREVER.")
-        print("")
+        _print_lines(
+            "IMPORTANT: Before uninstalling, make sure you have:",
+            "  1. Exported your private key: slopesniper export",
+            "  2. Saved it in a secure location",
+            "  3. Transferred any remaining funds",
+            "",
+            "If you lose your private key, YOUR FUNDS WILL BE LOST FOREVER.",
+            "",
+        )
 
     if not confirm:
-        print("To proceed with uninstall, add --confirm flag:")
-        print("")
-        print("  slopesniper uninstall --confirm            # Remove everything")
-        print("  slopesniper uninstall --confirm --keep-data  # Keep wallet/config")
-        print("")
+        _print_lines(
+            "To proceed with uninstall, add --confirm flag:",
+            "",
+            "  slopesniper uninstall --confirm            # Remove everything",
+            "  slopesniper uninstall --confirm --keep-data  # Keep wallet/config",
+            "",
+        )
         return
 
     # Double-check if wallet exists and not keeping data
     if wallet_exists and not keep_data:
-        print("=" * 50)
-        print("  FINAL WARNING: WALLET WILL BE DELETED")
-        print("=" * 50)
-        print("")
+        _print_lines(
+            "=" * 50,
+            "  FINAL WARNING: WALLET WILL BE DELETED",
+            "=" * 50,
+            "",
+        )
         try:
             response = input("Type 'DELETE MY WALLET' to confirm: ")
             if response.strip() != "DELETE MY WALLET":
-                print("")
-                print("Uninstall cancelled.")
+                _print_lines("", "Uninstall cancelled.")
                 return
         except (EOFError, KeyboardInterrupt):
-            print("")
-            print("Uninstall cancelled.")
+            _print_lines("", "Uninstall cancelled.")
             return
 
     # Remove CLI tool
@@ -801,7 +1083,9 @@ def cmd_uninstall(keep_data: bool = False, confirm: bool = False) -> None:
     # Try uv tool uninstall
     try:
         result = subprocess.run(
-            ["uv", "tool", "uninstall", "slopesniper-mcp"], capture_output=True, text=True
+            ["uv", "tool", "uninstall", "slopesniper-mcp"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
         if result.returncode == 0:
             success = True
@@ -813,7 +1097,9 @@ def cmd_uninstall(keep_data: bool = False, confirm: bool = False) -> None:
     if not success:
         try:
             result = subprocess.run(
-                ["pip", "uninstall", "-y", "slopesniper-mcp"], capture_output=True, text=True
+                ["pip", "uninstall", "-y", "slopesniper-mcp"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
             if result.returncode == 0:
                 success = True
@@ -829,8 +1115,10 @@ def cmd_uninstall(keep_data: bool = False, confirm: bool = False) -> None:
     # Handle data directory
     if SLOPESNIPER_DIR.exists():
         if keep_data:
-            print(f"Keeping data directory: {SLOPESNIPER_DIR}")
-            print("Your wallet and config are preserved.")
+            _print_lines(
+                f"Keeping data directory: {SLOPESNIPER_DIR}",
+                "Your wallet and config are preserved.",
+            )
         else:
             print(f"Removing data directory: {SLOPESNIPER_DIR}")
             try:
@@ -839,11 +1127,13 @@ def cmd_uninstall(keep_data: bool = False, confirm: bool = False) -> None:
             except Exception as e:
                 print(f"   Error: {e}")
 
-    print("")
-    print("=" * 50)
-    print("  Uninstall complete!")
-    print("=" * 50)
-    print("")
+    _print_lines(
+        "",
+        "=" * 50,
+        "  Uninstall complete!",
+        "=" * 50,
+        "",
+    )
 
 
 def cmd_contribute(
@@ -893,7 +1183,7 @@ async def cmd_target_add(
     sell: str = "all",
 ) -> None:
     """Add a new sell target."""
-    from .tools import add_target, resolve_token
+    from .tools import add_target
 
     # Determine target type and value
     if mcap is not None:
@@ -923,7 +1213,10 @@ async def cmd_target_add(
         return
 
     # Resolve token to mint address
-    resolved = await resolve_token(token)
+    try:
+        resolved = await _resolve_token(token)
+    finally:
+        await _jupiter_client().close()
     if not resolved.get("mint"):
         print_json({"error": f"Could not resolve token: {token}"})
         return
@@ -944,6 +1237,8 @@ async def cmd_target_add(
         entry_price=entry_price,
         entry_mcap=entry_mcap,
     )
+    if result.get("success"):
+        _wake_daemon()
 
     print_json(result)
 
@@ -970,9 +1265,200 @@ async def cmd_target_remove(target_id: int) -> None:
     from .tools import remove_target
 
     result = remove_target(target_id)
+    if result.get("success"):
+        _wake_daemon()
     print_json(result)
 
 
+def _wake_daemon() -> None:
+    """Have a running daemon pick up a target change now, not next tick."""
+    try:
+        from .daemon import wake_daemon
+
+        wake_daemon()
+    except Exception:
+        pass  # Non-critical - the daemon reloads targets on its own
+
+
+@lru_cache(maxsize=1)
+def _jupiter_client():
+    """
+    Get the process-wide JupiterDataClient.
+
+    The SDK stays a lazy import (it pulls in aiohttp), but once loaded the
+    same client - its resolved API key and its keep-alive connection pool -
+    is reused by every caller. Callers close() it when their loop ends; the
+    pool is reopened on next use.
+    """
+    from .sdk import JupiterDataClient
+    from .tools.config import get_jupiter_api_key
+
+    return JupiterDataClient(api_key=get_jupiter_api_key(), keep_alive=True)
+
+
+# Circulating supply barely moves between watch ticks, so mcap targets only
+# need a fresh price each tick - supply is re-fetched hourly
+TOKEN_INFO_TTL_SECONDS = 3600
+_token_info_cache: dict[str, tuple[float, dict]] = {}
+
+
+async def _cached_token_info(client, mint: str) -> dict | None:
+    """
+    Get token info for a mint, reusing a recent lookup.
+
+    Only results that carry circSupply are cached, since that is what
+    callers derive mcap from; anything else is fetched fresh every time.
+
+    Args:
+        client: JupiterDataClient to fetch with
+        mint: Token mint address
+
+    Returns:
+        Token info dict or None if not found
+    """
+    import time
+
+    cached = _token_info_cache.get(mint)
+    if cached and time.monotonic() - cached[0] < TOKEN_INFO_TTL_SECONDS:
+        return cached[1]
+
+    info = await client.get_token_info(mint)
+    if info and info.get("circSupply"):
+        _token_info_cache[mint] = (time.monotonic(), info)
+    return info
+
+
+# Floor between trade-triggered polls, so a busy token cannot drive one
+# Jupiter request per trade
+WAKE_MIN_GAP_SECONDS = 1.0
+
+
+async def _trade_wakeups(mint: str, wake) -> None:
+    """
+    Set `wake` whenever PumpPortal streams a trade on `mint`.
+
+    Trades carry no USD price, so they only tell the watch loop to poll
+    now instead of sleeping out its interval. Any connection failure ends
+    the task quietly and the loop keeps its plain polling schedule.
+
+    Args:
+        mint: pump.fun token mint address
+        wake: asyncio.Event the watch loop sleeps on
+    """
+    import asyncio
+
+    try:
+        from .sdk import PumpFunClient
+
+        pump = PumpFunClient()
+        while True:
+            # The stream ends after `timeout` seconds without a trade
+            async for _ in pump.stream_token_trades(mint, timeout=300):
+                wake.set()
+            await asyncio.sleep(5)
+    except Exception:
+        pass  # Non-critical - polling continues without push
+
+
+# How often the watch loop re-snapshots the wallet position it sells from
+HOLDINGS_REFRESH_SECONDS = 60
+
+
+async def _wallet_holdings() -> dict[str, dict]:
+    """Get the configured wallet's token holdings keyed by mint."""
+    from .tools import solana_get_wallet
+
+    wallet = await solana_get_wallet()
+    return {t.get("mint"): t for t in wallet.get("tokens", [])}
+
+
+_resolver_cache: dict | None = None
+
+
+def _load_resolver_cache() -> dict:
+    """Get the resolver cache, reading RESOLVER_CACHE_FILE on first use."""
+    global _resolver_cache
+    if _resolver_cache is None:
+        try:
+            _resolver_cache = json.loads(RESOLVER_CACHE_FILE.read_text())
+        except Exception:
+            _resolver_cache = {}
+    return _resolver_cache
+
+
+def _resolver_cache_get(key: str) -> dict | None:
+    """Get a cached {mint, symbol} for a token, if it hasn't expired."""
+    import time
+
+    entry = _load_resolver_cache().get(key)
+    if entry and time.time() - entry.get("at", 0) < RESOLVER_CACHE_TTL_SECONDS:
+        return entry
+    return None
+
+
+def _resolver_cache_put(key: str, mint: str, symbol: str) -> None:
+    """Cache a token's mint/symbol in memory and on disk."""
+    import time
+
+    from .utils import atomic_write
+
+    cache = _load_resolver_cache()
+    cache[key] = {"mint": mint, "symbol": symbol, "at": time.time()}
+    try:
+        RESOLVER_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(RESOLVER_CACHE_FILE, json.dumps(cache).encode())
+    except Exception:
+        pass  # Non-critical
+
+
+async def _resolve_token(token: str) -> dict[str, Any]:
+    """
+    Resolve a symbol or mint to its mint, symbol, live price and mcap.
+
+    The symbol -> mint mapping doesn't change, so it is cached for a day
+    (RESOLVER_CACHE_FILE) and repeat calls skip the search request. Price
+    and mcap are always fetched live.
+
+    Args:
+        token: Token symbol, name or mint address
+
+    Returns:
+        Dict with mint, symbol, price_usd and mcap (empty if not found)
+    """
+    import asyncio
+
+    # Mint addresses are case-sensitive; symbols are not
+    key = token if len(token) >= 32 else token.upper()
+    cached = _resolver_cache_get(key)
+    if cached:
+        mint, symbol = cached["mint"], cached["symbol"]
+    else:
+        from .tools import solana_resolve_token
+
+        found = await solana_resolve_token(token)
+        mint = found.get("mint")
+        if not mint:
+            return {}
+        symbol = found.get("symbol") or token
+        _resolver_cache_put(key, mint, symbol)
+
+    client = _jupiter_client()
+    prices, info = await asyncio.gather(
+        client.get_prices([mint]), _cached_token_info(client, mint), return_exceptions=True
+    )
+    price_usd = 0.0
+    if not isinstance(prices, Exception):
+        price_usd = prices.get(mint, {}).get("usdPrice") or 0.0
+    mcap = None
+    if info and not isinstance(info, Exception):
+        if info.get("circSupply") and price_usd:
+            mcap = info["circSupply"] * price_usd
+        else:
+            mcap = info.get("mcap")
+
+    return {"mint": mint, "symbol": symbol, "price_usd": price_usd, "mcap": mcap}
+
+
 async def cmd_watch_foreground(
     token: str,
     mcap: float | None = None,
@@ -985,36 +1471,43 @@ async def cmd_watch_foreground(
     """
     Foreground watch mode - monitors token until target hit.
 
-    Blocks until target is reached or Ctrl+C is pressed.
+    Blocks until target is reached or Ctrl+C is pressed. An interval of 0
+    (or less) is a tight-loop test mode: polls run back to back, yielding
+    to the event loop between ticks without arming a timer.
     """
+    import asyncio
     import time
 
-    from .tools import resolve_token
-    from .tools.config import get_jupiter_api_key
-
     # Determine target type and value
     if mcap is not None:
         target_type = "mcap"
         target_value = mcap
         condition = f"mcap >= ${mcap:,.0f}"
+        target_str = f" / ${mcap:,.0f}"
     elif price is not None:
         target_type = "price"
         target_value = price
         condition = f"price >= ${price:.8g}"
+        target_str = f" / ${price:.8g}"
     elif pct_gain is not None:
         target_type = "pct_gain"
         target_value = pct_gain
         condition = f"+{pct_gain:.1f}% gain"
+        target_str = f" / {pct_gain:+.1f}%"
     elif trailing is not None:
         target_type = "trailing_stop"
         target_value = trailing
         condition = f"-{trailing:.1f}% from peak"
+        target_str = f" / {trailing:.1f}%"
     else:
         print("Error: Must specify one of: --mcap, --price, --pct-gain, --trailing")
         return
 
-    # Resolve token
-    resolved = await resolve_token(token)
+    # Resolve token (the pool is reopened once the loop starts polling)
+    try:
+        resolved = await _resolve_token(token)
+    finally:
+        await _jupiter_client().close()
     if not resolved.get("mint"):
         print(f"Error: Could not resolve token: {token}")
         return
@@ -1025,85 +1518,183 @@ async def cmd_watch_foreground(
     entry_mcap = resolved.get("mcap")
     peak_price = entry_price
 
-    print("")
-    print("=" * 60)
-    print(f"  Watching {symbol} ({mint[:8]}...)")
-    print(f"  Target: {condition}")
-    print(f"  Sell: {sell}")
-    print(f"  Interval: {interval}s")
-    print("=" * 60)
-    print("")
-    print("Press Ctrl+C to cancel")
-    print("")
-
-    from ..sdk import JupiterDataClient
+    _print_lines(
+        "",
+        "=" * 60,
+        f"  Watching {symbol} ({mint[:8]}...)",
+        f"  Target: {condition}",
+        f"  Sell: {sell}",
+        f"  Interval: {interval}s",
+        "=" * 60,
+        "",
+        "Press Ctrl+C to cancel",
+        "",
+    )
 
-    client = JupiterDataClient(api_key=get_jupiter_api_key())
+    client = _jupiter_client()
+
+    # Poll at `interval` while the price moves; back off while it is flat.
+    # With interval 0, asyncio.sleep(0) takes its bare-yield fast path and
+    # the backoff stays pinned at 0
+    interval = max(interval, 0)
+    max_interval = max(60, interval * 8) if interval else 0
+    sleep_for = interval
+    last_price = None
+    supply = None
+    # Loop-invariant lookups, bound once
+    strftime = time.strftime
+    monotonic = time.monotonic
+    write = sys.stdout.write
+    get_prices = client.get_prices
+    mints = [mint]
+
+    # pump.fun mints also get a trade stream that cuts the sleep short
+    wake = asyncio.Event()
+    stream_task = None
+    if mint.endswith("pump"):
+        stream_task = asyncio.create_task(_trade_wakeups(mint, wake))
+
+    # Partial sells are sized from the wallet position. Keep a snapshot of
+    # it warm so a trigger doesn't have to wait on a full wallet fetch
+    holdings_task = None
+    holdings_at = monotonic()
+    if sell.lower() != "all":
+        holdings_task = asyncio.create_task(_wallet_holdings())
 
     try:
         while True:
+            timestamp = strftime("%H:%M:%S")
             try:
-                # Fetch current price
-                prices = await client.get_prices([mint])
+                # Fetch current price, plus token info for mcap targets. Both
+                # requests go out together; a failed info lookup only costs
+                # this tick's mcap, not the price. While the estimated mcap
+                # (known supply x last price) is under 80% of the target the
+                # info lookup is skipped and the estimate is used instead
+                info = None
+                if target_type == "mcap" and (
+                    supply is None
+                    or not last_price
+                    or supply * last_price >= 0.8 * target_value
+                ):
+                    prices, info = await asyncio.gather(
+                        get_prices(mints),
+                        _cached_token_info(client, mint),
+                        return_exceptions=True,
+                    )
+                    if isinstance(prices, Exception):
+                        raise prices
+                    if isinstance(info, Exception):
+                        info = None
+                else:
+                    prices = await get_prices(mints)
                 price_data = prices.get(mint, {})
                 current_price = price_data.get("usdPrice", 0)
 
-                # Get mcap if needed
+                # Get mcap if needed (supply x live price). Supply comes from
+                # circSupply, or is implied by the info's own mcap/price
                 current_mcap = None
                 if target_type == "mcap":
-                    info = await client.get_token_info(mint)
-                    current_mcap = info.get("mcap") if info else None
+                    if info:
+                        if info.get("circSupply"):
+                            supply = info["circSupply"]
+                        elif info.get("mcap") and info.get("usdPrice"):
+                            supply = info["mcap"] / info["usdPrice"]
+                    if supply and current_price:
+                        current_mcap = supply * current_price
+                    elif info:
+                        current_mcap = info.get("mcap")
 
                 # Update peak for trailing stop
                 if target_type == "trailing_stop" and current_price > peak_price:
                     peak_price = current_price
 
                 # Check condition
+                # progress: how close the price is to the trigger (1.0 = hit)
                 triggered = False
+                progress = 0.0
                 if target_type == "mcap" and current_mcap:
                     triggered = current_mcap >= target_value
-                    status = f"mcap: ${current_mcap:,.0f} / ${target_value:,.0f}"
+                    if target_value > 0:
+                        progress = current_mcap / target_value
+                    status = f"mcap: ${current_mcap:,.0f}{target_str}"
                 elif target_type == "price":
                     triggered = current_price >= target_value
-                    status = f"price: ${current_price:.8g} / ${target_value:.8g}"
+                    if target_value > 0:
+                        progress = current_price / target_value
+                    status = f"price: ${current_price:.8g}{target_str}"
                 elif target_type == "pct_gain" and entry_price > 0:
                     pct = ((current_price - entry_price) / entry_price) * 100
                     triggered = pct >= target_value
-                    status = f"gain: {pct:+.1f}% / {target_value:+.1f}%"
+                    trigger_price = entry_price * (1 + target_value / 100)
+                    if trigger_price > 0:
+                        progress = current_price / trigger_price
+                    status = f"gain: {pct:+.1f}%{target_str}"
                 elif target_type == "trailing_stop" and peak_price > 0:
                     drop = ((peak_price - current_price) / peak_price) * 100
                     triggered = drop >= target_value
-                    status = f"drop: {drop:.1f}% / {target_value:.1f}% (peak: ${peak_price:.8g})"
+                    if current_price > 0:
+                        progress = peak_price * (1 - target_value / 100) / current_price
+                    status = f"drop: {drop:.1f}%{target_str} (peak: ${peak_price:.8g})"
                 else:
                     status = f"price: ${current_price:.8g}"
 
-                timestamp = time.strftime("%H:%M:%S")
-                print(f"[{timestamp}] {status}")
+                # Flat (<0.1% move) and not within 5% of the trigger: stretch
+                # the next sleep. Any movement or proximity snaps it back
+                if (
+                    last_price
+                    and abs(current_price - last_price) / last_price < 0.001
+                    and progress < 0.95
+                ):
+                    sleep_for = min(sleep_for * 1.5, max_interval)
+                else:
+                    sleep_for = interval
+                last_price = current_price
+
+                # Re-snapshot the position periodically, and every tick once
+                # the trigger is within 5%. Not on the trigger tick itself:
+                # the sell below reads the snapshot already taken
+                if (
+                    holdings_task is not None
+                    and not triggered
+                    and holdings_task.done()
+                    and (
+                        progress >= 0.95
+                        or monotonic() - holdings_at >= HOLDINGS_REFRESH_SECONDS
+                    )
+                ):
+                    holdings_task = asyncio.create_task(_wallet_holdings())
+                    holdings_at = monotonic()
+
+                write(f"[{timestamp}] {status}\n")
 
                 if triggered:
-                    print("")
-                    print("=" * 60)
-                    print(f"  TARGET HIT!")
-                    print("=" * 60)
-                    print("")
-                    print(f"Executing sell ({sell})...")
+                    _print_lines(
+                        "",
+                        "=" * 60,
+                        "  TARGET HIT!",
+                        "=" * 60,
+                        "",
+                        f"Executing sell ({sell})...",
+                    )
 
                     from .tools import quick_trade
 
                     if sell.lower() == "all":
                         result = await quick_trade("sell", mint, "all")
                     else:
-                        # Calculate sell amount
-                        from .tools import parse_sell_amount, solana_get_wallet
-
-                        wallet = await solana_get_wallet()
-                        tokens = wallet.get("tokens", [])
-                        holdings = next(
-                            (t for t in tokens if t.get("mint") == mint), None
-                        )
+                        # Calculate sell amount from the warm snapshot (or the
+                        # one still in flight); fetch fresh only if it failed
+                        from .tools import parse_sell_amount
+
+                        try:
+                            holdings_by_mint = await holdings_task
+                        except Exception:
+                            holdings_by_mint = await _wallet_holdings()
+                        holdings = holdings_by_mint.get(mint)
                         if holdings:
                             token_amt = holdings.get("amount", 0)
-                            value_usd = holdings.get("value_usd", 0)
+                            # Value at the trigger price, not the snapshot's
+                            value_usd = token_amt * current_price
                             sell_tokens = parse_sell_amount(sell, value_usd, token_amt)
                             sell_usd = sell_tokens * current_price
                             result = await quick_trade("sell", mint, sell_usd)
@@ -1113,16 +1704,35 @@ async def cmd_watch_foreground(
                     print_json(result)
                     return
 
-            except KeyboardInterrupt:
-                raise
             except Exception as e:
-                print(f"[{time.strftime('%H:%M:%S')}] Error: {e}")
+                # Network/API errors only; Ctrl+C and cancellation are not
+                # Exception subclasses and reach the outer handler directly
+                write(f"[{timestamp}] Error: {e}\n")
 
-            time.sleep(interval)
+            if stream_task is None or sleep_for <= WAKE_MIN_GAP_SECONDS:
+                await asyncio.sleep(sleep_for)
+            else:
+                # Sleep out the interval unless a trade lands first, but
+                # never poll sooner than WAKE_MIN_GAP_SECONDS after this tick
+                wake.clear()
+                await asyncio.sleep(WAKE_MIN_GAP_SECONDS)
+                if not wake.is_set():
+                    try:
+                        await asyncio.wait_for(wake.wait(), sleep_for - WAKE_MIN_GAP_SECONDS)
+                    except asyncio.TimeoutError:
+                        pass
 
-    except KeyboardInterrupt:
-        print("")
-        print("Watch cancelled.")
+    # On 3.11+ asyncio.run() turns Ctrl+C into cancellation of this task
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        _print_lines("", "Watch cancelled.")
+    finally:
+        background = [t for t in (stream_task, holdings_task) if t is not None]
+        for task in background:
+            task.cancel()
+        # Wait for them to unwind so the trade stream closes its websocket
+        # before the loop shuts down
+        await asyncio.gather(*background, return_exceptions=True)
+        await client.close()
 
 
 def print_help() -> None:
@@ -1130,367 +1740,465 @@ def print_help() -> None:
     print(__doc__)
 
 
-def main() -> None:
-    """CLI entry point."""
-    args = sys.argv[1:]
+# ============================================================================
+# Command Dispatch
+# ============================================================================
+# Each runner receives the full argv (minus global flags) with args[0] being
+# the command name, and is looked up once in COMMANDS instead of walking an
+# if/elif chain.
 
-    # Check for --quiet flag (suppresses ALL logging)
-    quiet = "--quiet" in args or "-q" in args
-    if quiet:
-        args = [a for a in args if a not in ("--quiet", "-q")]
-        import logging
 
-        logging.disable(logging.CRITICAL)
-        import warnings
+def _parse_flags(
+    args: list[str], value_flags: frozenset[str] = frozenset()
+) -> tuple[list[str], dict[str, str | bool]]:
+    """
+    Split command arguments into positionals and flags in a single pass.
 
-        warnings.filterwarnings("ignore")
+    Args:
+        args: Arguments following the command name
+        value_flags: Flags that take the next argument as their value
 
-    # Check for --verbose flag (enables INFO logging for debugging)
-    verbose = "--verbose" in args or "-v" in args
-    if verbose:
-        args = [a for a in args if a not in ("--verbose", "-v")]
-        import os
+    Returns:
+        Tuple of (positionals, flags) where flags maps each flag seen to its
+        value, or True for switches. A value flag with nothing after it is
+        ignored and the first occurrence of a repeated flag wins.
+    """
+    positionals: list[str] = []
+    flags: dict[str, str | bool] = {}
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg in value_flags:
+            if i + 1 < len(args):
+                flags.setdefault(arg, args[i + 1])
+            i += 2
+            continue
+        if arg.startswith("-"):
+            flags.setdefault(arg, True)
+        else:
+            positionals.append(arg)
+        i += 1
+    return positionals, flags
 
-        os.environ["SLOPESNIPER_LOG_LEVEL"] = "INFO"
 
-    if not args or args[0] in ("-h", "--help", "help"):
-        print_help()
-        return
+def _run_setup(args: list[str]) -> None:
+    _, flags = _parse_flags(args[1:], frozenset({"--import-key"}))
+    _run_async(cmd_setup(import_key=flags.get("--import-key")))
 
-    cmd = args[0].lower()
 
-    try:
-        if cmd == "setup":
-            import_key = None
-            if "--import-key" in args:
-                idx = args.index("--import-key")
-                if idx + 1 < len(args):
-                    import_key = args[idx + 1]
-            cmd_setup(import_key=import_key)
-
-        elif cmd == "status":
-            asyncio.run(cmd_status())
-
-        elif cmd == "wallet":
-            asyncio.run(cmd_wallet())
-
-        elif cmd == "export":
-            list_backups = "--list-backups" in args or "-l" in args
-            backup_timestamp = None
-            if "--backup" in args:
-                idx = args.index("--backup")
-                if idx + 1 < len(args):
-                    backup_timestamp = args[idx + 1]
-            asyncio.run(cmd_export(list_backups=list_backups, backup_timestamp=backup_timestamp))
-
-        elif cmd == "pnl":
-            # Parse pnl subcommands: pnl [init|stats|positions|export|reset]
-            subcommand = args[1] if len(args) > 1 and not args[1].startswith("-") else None
-            starting_value = None
-            format_type = "json"
-
-            # Parse flags
-            for i, arg in enumerate(args):
-                if arg == "--starting-value" and i + 1 < len(args):
-                    try:
-                        starting_value = float(args[i + 1])
-                    except ValueError:
-                        pass
-                elif arg == "--format" and i + 1 < len(args):
-                    format_type = args[i + 1]
+def _run_export(args: list[str]) -> None:
+    _, flags = _parse_flags(args[1:], frozenset({"--backup"}))
+    list_backups = "--list-backups" in flags or "-l" in flags
+    _run_async(cmd_export(list_backups=list_backups, backup_timestamp=flags.get("--backup")))
 
-            asyncio.run(cmd_pnl(subcommand, starting_value, format_type))
 
-        elif cmd == "history":
-            limit = int(args[1]) if len(args) > 1 else 20
-            cmd_history(limit)
+def _run_pnl(args: list[str]) -> None:
+    # Parse pnl subcommands: pnl [init|stats|positions|export|reset]
+    positionals, flags = _parse_flags(args[1:], frozenset({"--starting-value", "--format"}))
+    subcommand = positionals[0] if positionals else None
+    format_type = flags.get("--format", "json")
 
-        elif cmd == "price":
-            if len(args) < 2:
-                print("Error: price requires <token>")
-                sys.exit(1)
-            asyncio.run(cmd_price(args[1]))
+    starting_value = None
+    if "--starting-value" in flags:
+        try:
+            starting_value = float(flags["--starting-value"])
+        except ValueError:
+            pass
 
-        elif cmd == "buy":
-            if len(args) < 3:
-                print("Error: buy requires <token> <usd_amount>")
-                sys.exit(1)
-            asyncio.run(cmd_buy(args[1], float(args[2])))
+    _run_async(cmd_pnl(subcommand, starting_value, format_type))
 
-        elif cmd == "sell":
-            if len(args) < 3:
-                print("Error: sell requires <token> <usd_amount>")
-                sys.exit(1)
-            asyncio.run(cmd_sell(args[1], float(args[2])))
 
-        elif cmd == "check":
-            if len(args) < 2:
-                print("Error: check requires <token>")
-                sys.exit(1)
-            asyncio.run(cmd_check(args[1]))
+def _run_history(args: list[str]) -> None:
+    limit = int(args[1]) if len(args) > 1 else 20
+    cmd_history(limit)
 
-        elif cmd == "search":
-            if len(args) < 2:
-                print("Error: search requires <query>")
-                sys.exit(1)
-            asyncio.run(cmd_search(args[1]))
 
-        elif cmd == "resolve":
-            if len(args) < 2:
-                print("Error: resolve requires <token>")
-                sys.exit(1)
-            asyncio.run(cmd_resolve(args[1]))
-
-        elif cmd == "strategy":
-            # Parse strategy flags: [name] [--slippage BPS] [--max-trade USD]
-            name = None
-            slippage_bps = None
-            max_trade_usd = None
-
-            i = 1
-            while i < len(args):
-                arg = args[i]
-                if arg in ("--slippage", "-s") and i + 1 < len(args):
-                    try:
-                        slippage_bps = int(args[i + 1])
-                    except ValueError:
-                        print(f"Error: slippage must be an integer (basis points)")
-                        sys.exit(1)
-                    i += 2
-                elif arg in ("--max-trade", "-m") and i + 1 < len(args):
-                    try:
-                        max_trade_usd = float(args[i + 1])
-                    except ValueError:
-                        print(f"Error: max-trade must be a number (USD)")
-                        sys.exit(1)
-                    i += 2
-                elif not arg.startswith("-"):
-                    name = arg
-                    i += 1
-                else:
-                    i += 1
-
-            asyncio.run(cmd_strategy(name, slippage_bps, max_trade_usd))
-
-        elif cmd == "scan":
-            filter_type = args[1] if len(args) > 1 else "all"
-            asyncio.run(cmd_scan(filter_type))
-
-        elif cmd == "config":
-            # Parse config flags: --set KEY VALUE or --clear KEY
-            set_key = None
-            set_value = None
-            clear_key = None
-
-            i = 1  # Skip 'config'
-            while i < len(args):
-                arg = args[i]
-                if arg == "--set" and i + 2 < len(args):
-                    set_key = args[i + 1]
-                    set_value = args[i + 2]
-                    i += 3
-                elif arg == "--clear" and i + 1 < len(args):
-                    clear_key = args[i + 1]
-                    i += 2
-                # Legacy support
-                elif arg == "--set-jupiter-key" and i + 1 < len(args):
-                    set_key = "jupiter-key"
-                    set_value = args[i + 1]
-                    i += 2
-                elif arg == "--set-rpc" and i + 2 < len(args):
-                    set_key = args[i + 1]  # provider name
-                    set_value = args[i + 2]
-                    i += 3
-                elif arg == "--clear-rpc":
-                    clear_key = "rpc"
-                    i += 1
-                else:
-                    i += 1
+def _require(args: list[str], count: int, usage: str) -> None:
+    """Exit with a usage error unless args has at least count entries."""
+    if len(args) < count:
+        print(f"Error: {args[0].lower()} requires {usage}")
+        sys.exit(1)
+
+
+def _run_price(args: list[str]) -> None:
+    _require(args, 2, "<token>")
+    _run_async(cmd_price(args[1]))
+
+
+def _run_buy(args: list[str]) -> None:
+    _require(args, 3, "<token> <usd_amount>")
+    _run_async(cmd_buy(args[1], float(args[2])))
+
+
+def _run_sell(args: list[str]) -> None:
+    _require(args, 3, "<token> <usd_amount>")
+    _run_async(cmd_sell(args[1], float(args[2])))
+
+
+def _run_check(args: list[str]) -> None:
+    _require(args, 2, "<token>")
+    _run_async(cmd_check(args[1]))
+
+
+def _run_search(args: list[str]) -> None:
+    _require(args, 2, "<query>")
+    _run_async(cmd_search(args[1]))
+
 
-            cmd_config(set_key=set_key, set_value=set_value, clear_key=clear_key)
+def _run_resolve(args: list[str]) -> None:
+    _require(args, 2, "<token>")
+    _run_async(cmd_resolve(args[1]))
 
-        elif cmd == "health":
-            diagnose = "--diagnose" in args or "-d" in args
-            cmd_health(diagnose=diagnose)
 
-        elif cmd == "restore":
-            if len(args) < 2:
-                print_json({"error": "Missing timestamp", "usage": "slopesniper restore TIMESTAMP"})
+def _run_strategy(args: list[str]) -> None:
+    # Parse strategy flags: [name] [--slippage BPS] [--max-trade USD]
+    name = None
+    slippage_bps = None
+    max_trade_usd = None
+
+    i = 1
+    while i < len(args):
+        arg = args[i]
+        if arg in ("--slippage", "-s") and i + 1 < len(args):
+            try:
+                slippage_bps = int(args[i + 1])
+            except ValueError:
+                print(f"Error: slippage must be an integer (basis points)")
                 sys.exit(1)
-            cmd_restore(args[1])
-
-        elif cmd == "version":
-            check_latest = "--check" in args or "-c" in args
-            cmd_version(check_latest=check_latest)
-
-        elif cmd == "update":
-            cmd_update()
-
-        elif cmd == "contribute":
-            enable = "--enable" in args
-            disable = "--disable" in args
-            cmd_contribute(enable=enable, disable=disable)
-
-        elif cmd == "uninstall":
-            confirm = "--confirm" in args or "-y" in args
-            keep_data = "--keep-data" in args
-            cmd_uninstall(keep_data=keep_data, confirm=confirm)
-
-        # ================================================================
-        # Auto-sell Target Commands
-        # ================================================================
-        elif cmd == "target":
-            if len(args) < 2:
-                print_json({
-                    "error": "Missing subcommand",
-                    "usage": [
-                        "slopesniper target add TOKEN --mcap VALUE --sell all",
-                        "slopesniper target list [--all]",
-                        "slopesniper target remove ID",
-                    ],
-                })
+            i += 2
+        elif arg in ("--max-trade", "-m") and i + 1 < len(args):
+            try:
+                max_trade_usd = float(args[i + 1])
+            except ValueError:
+                print(f"Error: max-trade must be a number (USD)")
                 sys.exit(1)
+            i += 2
+        elif not arg.startswith("-"):
+            name = arg
+            i += 1
+        else:
+            i += 1
+
+    _run_async(cmd_strategy(name, slippage_bps, max_trade_usd))
+
+
+def _run_scan(args: list[str]) -> None:
+    filter_type = args[1] if len(args) > 1 else "all"
+    _run_async(cmd_scan(filter_type))
+
+
+def _run_config(args: list[str]) -> None:
+    # Parse config flags: --set KEY VALUE or --clear KEY
+    set_key = None
+    set_value = None
+    clear_key = None
+
+    i = 1  # Skip 'config'
+    while i < len(args):
+        arg = args[i]
+        if arg == "--set" and i + 2 < len(args):
+            set_key = args[i + 1]
+            set_value = args[i + 2]
+            i += 3
+        elif arg == "--clear" and i + 1 < len(args):
+            clear_key = args[i + 1]
+            i += 2
+        # Legacy support
+        elif arg == "--set-jupiter-key" and i + 1 < len(args):
+            set_key = "jupiter-key"
+            set_value = args[i + 1]
+            i += 2
+        elif arg == "--set-rpc" and i + 2 < len(args):
+            set_key = args[i + 1]  # provider name
+            set_value = args[i + 2]
+            i += 3
+        elif arg == "--clear-rpc":
+            clear_key = "rpc"
+            i += 1
+        else:
+            i += 1
 
-            subcmd = args[1].lower()
-
-            if subcmd == "add":
-                if len(args) < 3:
-                    print_json({"error": "Missing token", "usage": "slopesniper target add TOKEN --mcap VALUE"})
-                    sys.exit(1)
-
-                token = args[2]
-                mcap = price = pct_gain = trailing = None
-                sell = "all"
-
-                i = 3
-                while i < len(args):
-                    arg = args[i]
-                    if arg == "--mcap" and i + 1 < len(args):
-                        mcap = float(args[i + 1])
-                        i += 2
-                    elif arg == "--price" and i + 1 < len(args):
-                        price = float(args[i + 1])
-                        i += 2
-                    elif arg in ("--pct-gain", "--pct", "--gain") and i + 1 < len(args):
-                        pct_gain = float(args[i + 1])
-                        i += 2
-                    elif arg in ("--trailing", "--trail") and i + 1 < len(args):
-                        trailing = float(args[i + 1])
-                        i += 2
-                    elif arg == "--sell" and i + 1 < len(args):
-                        sell = args[i + 1]
-                        i += 2
-                    else:
-                        i += 1
+    cmd_config(set_key=set_key, set_value=set_value, clear_key=clear_key)
 
-                asyncio.run(cmd_target_add(token, mcap, price, pct_gain, trailing, sell))
 
-            elif subcmd == "list":
-                show_all = "--all" in args or "-a" in args
-                asyncio.run(cmd_target_list(show_all))
+def _run_health(args: list[str]) -> None:
+    flags = frozenset(args)
+    cmd_health(diagnose="--diagnose" in flags or "-d" in flags)
 
-            elif subcmd == "remove":
-                if len(args) < 3:
-                    print_json({"error": "Missing target ID", "usage": "slopesniper target remove ID"})
-                    sys.exit(1)
-                try:
-                    target_id = int(args[2])
-                except ValueError:
-                    print_json({"error": "Target ID must be a number"})
-                    sys.exit(1)
-                asyncio.run(cmd_target_remove(target_id))
 
-            else:
-                print_json({"error": f"Unknown target subcommand: {subcmd}"})
-                sys.exit(1)
+def _run_restore(args: list[str]) -> None:
+    if len(args) < 2:
+        print_json({"error": "Missing timestamp", "usage": "slopesniper restore TIMESTAMP"})
+        sys.exit(1)
+    cmd_restore(args[1])
 
-        elif cmd == "watch":
-            if len(args) < 2:
-                print_json({"error": "Missing token", "usage": "slopesniper watch TOKEN --mcap VALUE"})
-                sys.exit(1)
 
-            token = args[1]
-            mcap = price = pct_gain = trailing = None
-            sell = "all"
-            interval = 5
-
-            i = 2
-            while i < len(args):
-                arg = args[i]
-                if arg == "--mcap" and i + 1 < len(args):
-                    mcap = float(args[i + 1])
-                    i += 2
-                elif arg == "--price" and i + 1 < len(args):
-                    price = float(args[i + 1])
-                    i += 2
-                elif arg in ("--pct-gain", "--pct", "--gain") and i + 1 < len(args):
-                    pct_gain = float(args[i + 1])
-                    i += 2
-                elif arg in ("--trailing", "--trail") and i + 1 < len(args):
-                    trailing = float(args[i + 1])
-                    i += 2
-                elif arg == "--sell" and i + 1 < len(args):
-                    sell = args[i + 1]
-                    i += 2
-                elif arg in ("--interval", "-i") and i + 1 < len(args):
-                    interval = int(args[i + 1])
-                    i += 2
-                else:
-                    i += 1
+def _run_version(args: list[str]) -> None:
+    flags = frozenset(args)
+    cmd_version(check_latest="--check" in flags or "-c" in flags)
 
-            asyncio.run(cmd_watch_foreground(token, mcap, price, pct_gain, trailing, sell, interval))
 
-        elif cmd == "daemon":
-            if len(args) < 2:
-                print_json({
-                    "error": "Missing subcommand",
-                    "usage": ["slopesniper daemon start", "slopesniper daemon stop", "slopesniper daemon status"],
-                })
-                sys.exit(1)
+def _run_contribute(args: list[str]) -> None:
+    flags = frozenset(args)
+    cmd_contribute(enable="--enable" in flags, disable="--disable" in flags)
 
-            subcmd = args[1].lower()
-
-            if subcmd == "start":
-                interval = 15
-                if "--interval" in args:
-                    idx = args.index("--interval")
-                    if idx + 1 < len(args):
-                        interval = int(args[idx + 1])
-                from .daemon import start_daemon
-                result = start_daemon(interval)
-                print_json(result)
-
-            elif subcmd == "stop":
-                from .daemon import stop_daemon
-                result = stop_daemon()
-                print_json(result)
-
-            elif subcmd == "status":
-                from .daemon import get_daemon_status
-                result = get_daemon_status()
-                print_json(result)
-
-            elif subcmd == "logs":
-                tail = 50
-                if "--tail" in args:
-                    idx = args.index("--tail")
-                    if idx + 1 < len(args):
-                        tail = int(args[idx + 1])
-                from .daemon import get_daemon_logs
-                result = get_daemon_logs(tail)
-                print_json(result)
 
-            else:
-                print_json({"error": f"Unknown daemon subcommand: {subcmd}"})
-                sys.exit(1)
+def _run_uninstall(args: list[str]) -> None:
+    flags = frozenset(args)
+    confirm = "--confirm" in flags or "-y" in flags
+    keep_data = "--keep-data" in flags
+    cmd_uninstall(keep_data=keep_data, confirm=confirm)
 
-        else:
-            print(f"Unknown command: {cmd}")
-            print_help()
-            sys.exit(1)
 
+# ================================================================
+# Auto-sell Target Commands
+# ================================================================
+
+
+def _target_options(args: list[str], watch: bool = False):
+    """
+    Parse `TOKEN [--mcap|--price|--pct-gain|--trailing VALUE] [--sell AMOUNT]`.
+
+    Shared by `target add` and `watch`. Unknown arguments are ignored, and
+    a missing token or bad value raises argparse.ArgumentError (reported as
+    a JSON error) instead of printing usage and exiting.
+
+    Args:
+        args: Arguments starting at the token
+        watch: Also accept --interval/-i (seconds between polls)
+
+    Returns:
+        argparse.Namespace with token, mcap, price, pct_gain, trailing,
+        sell and (for watch) interval
+    """
+    import argparse
+
+    class Parser(argparse.ArgumentParser):
+        def error(self, message: str):
+            # exit_on_error=False doesn't cover missing arguments
+            raise argparse.ArgumentError(None, message)
+
+    parser = Parser(add_help=False, allow_abbrev=False, exit_on_error=False)
+    parser.add_argument("token")
+    parser.add_argument("--mcap", type=float)
+    parser.add_argument("--price", type=float)
+    parser.add_argument("--pct-gain", "--pct", "--gain", dest="pct_gain", type=float)
+    parser.add_argument("--trailing", "--trail", type=float)
+    parser.add_argument("--sell", default="all")
+    if watch:
+        parser.add_argument("--interval", "-i", type=int, default=5)
+    opts, _ = parser.parse_known_args(args)
+    return opts
+
+
+def _run_target_add(args: list[str]) -> None:
+    if len(args) < 3:
+        print_json({"error": "Missing token", "usage": "slopesniper target add TOKEN --mcap VALUE"})
+        sys.exit(1)
+
+    opts = _target_options(args[2:])
+    _run_async(
+        cmd_target_add(
+            opts.token, opts.mcap, opts.price, opts.pct_gain, opts.trailing, opts.sell
+        )
+    )
+
+
+def _run_target_list(args: list[str]) -> None:
+    flags = frozenset(args)
+    _run_async(cmd_target_list("--all" in flags or "-a" in flags))
+
+
+def _run_target_remove(args: list[str]) -> None:
+    if len(args) < 3:
+        print_json({"error": "Missing target ID", "usage": "slopesniper target remove ID"})
+        sys.exit(1)
+    try:
+        target_id = int(args[2])
+    except ValueError:
+        print_json({"error": "Target ID must be a number"})
+        sys.exit(1)
+    _run_async(cmd_target_remove(target_id))
+
+
+TARGET_COMMANDS = {
+    "add": _run_target_add,
+    "list": _run_target_list,
+    "remove": _run_target_remove,
+}
+
+
+def _run_target(args: list[str]) -> None:
+    if len(args) < 2:
+        print_json({
+            "error": "Missing subcommand",
+            "usage": [
+                "slopesniper target add TOKEN --mcap VALUE --sell all",
+                "slopesniper target list [--all]",
+                "slopesniper target remove ID",
+            ],
+        })
+        sys.exit(1)
+
+    subcmd = args[1].lower()
+    runner = TARGET_COMMANDS.get(subcmd)
+    if runner is None:
+        print_json({"error": f"Unknown target subcommand: {subcmd}"})
+        sys.exit(1)
+    runner(args)
+
+
+def _run_watch(args: list[str]) -> None:
+    if len(args) < 2:
+        print_json({"error": "Missing token", "usage": "slopesniper watch TOKEN --mcap VALUE"})
+        sys.exit(1)
+
+    opts = _target_options(args[1:], watch=True)
+    _run_async(
+        cmd_watch_foreground(
+            opts.token,
+            opts.mcap,
+            opts.price,
+            opts.pct_gain,
+            opts.trailing,
+            opts.sell,
+            opts.interval,
+        )
+    )
+
+
+def _run_daemon_start(args: list[str]) -> None:
+    _, flags = _parse_flags(args[2:], frozenset({"--interval"}))
+    interval = int(flags.get("--interval", 15))
+    from .daemon import start_daemon
+
+    print_json(start_daemon(interval))
+
+
+def _run_daemon_run(args: list[str]) -> None:
+    _, flags = _parse_flags(args[2:], frozenset({"--interval"}))
+    interval = int(flags.get("--interval", 15))
+    from .daemon import run_foreground
+
+    print_json(run_foreground(interval))
+
+
+def _run_daemon_stop(args: list[str]) -> None:
+    from .daemon import stop_daemon
+
+    print_json(stop_daemon())
+
+
+def _run_daemon_status(args: list[str]) -> None:
+    from .daemon import get_daemon_status
+
+    print_json(get_daemon_status())
+
+
+def _run_daemon_logs(args: list[str]) -> None:
+    _, flags = _parse_flags(args[2:], frozenset({"--tail"}))
+    tail = int(flags.get("--tail", 50))
+    from .daemon import get_daemon_logs
+
+    print_json(get_daemon_logs(tail))
+
+
+DAEMON_COMMANDS = {
+    "start": _run_daemon_start,
+    "run": _run_daemon_run,
+    "stop": _run_daemon_stop,
+    "status": _run_daemon_status,
+    "logs": _run_daemon_logs,
+}
+
+
+def _run_daemon(args: list[str]) -> None:
+    if len(args) < 2:
+        print_json({
+            "error": "Missing subcommand",
+            "usage": ["slopesniper daemon start", "slopesniper daemon stop", "slopesniper daemon status"],
+        })
+        sys.exit(1)
+
+    subcmd = args[1].lower()
+    runner = DAEMON_COMMANDS.get(subcmd)
+    if runner is None:
+        print_json({"error": f"Unknown daemon subcommand: {subcmd}"})
+        sys.exit(1)
+    runner(args)
+
+
+COMMANDS = {
+    "setup": _run_setup,
+    "status": lambda args: _run_async(cmd_status()),
+    "wallet": lambda args: _run_async(cmd_wallet()),
+    "export": _run_export,
+    "pnl": _run_pnl,
+    "history": _run_history,
+    "price": _run_price,
+    "buy": _run_buy,
+    "sell": _run_sell,
+    "check": _run_check,
+    "search": _run_search,
+    "resolve": _run_resolve,
+    "strategy": _run_strategy,
+    "scan": _run_scan,
+    "config": _run_config,
+    "health": _run_health,
+    "restore": _run_restore,
+    "version": _run_version,
+    "update": lambda args: cmd_update(),
+    "contribute": _run_contribute,
+    "uninstall": _run_uninstall,
+    "target": _run_target,
+    "watch": _run_watch,
+    "daemon": _run_daemon,
+}
+
+
+_GLOBAL_FLAGS = frozenset({"--quiet", "-q", "--verbose", "-v"})
+
+
+def main() -> None:
+    """CLI entry point."""
+    args = sys.argv[1:]
+
+    global _QUIET
+
+    # Strip global flags anywhere in argv in a single pass
+    global_flags = {a for a in args if a in _GLOBAL_FLAGS}
+    if global_flags:
+        args = [a for a in args if a not in _GLOBAL_FLAGS]
+
+    # --quiet suppresses ALL logging
+    if "--quiet" in global_flags or "-q" in global_flags:
+        _QUIET = True
+        import logging
+
+        logging.disable(logging.CRITICAL)
+        import warnings
+
+        warnings.filterwarnings("ignore")
+
+    # --verbose enables INFO logging for debugging
+    if "--verbose" in global_flags or "-v" in global_flags:
+        os.environ["SLOPESNIPER_LOG_LEVEL"] = "INFO"
+
+    if not args or args[0] in ("-h", "--help", "help"):
+        print_help()
+        return
+
+    cmd = args[0].lower()
+    runner = COMMANDS.get(cmd)
+    if runner is None:
+        print(f"Unknown command: {cmd}")
+        print_help()
+        sys.exit(1)
+
+    try:
+        runner(args)
     except Exception as e:
-        print(json.dumps({"error": str(e)}))
+        print_json({"error": str(e)})
         sys.exit(1)
 
 
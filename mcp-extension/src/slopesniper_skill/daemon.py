@@ -6,6 +6,7 @@ when conditions are met.
 
 Usage:
     slopesniper daemon start    # Start the daemon
+    slopesniper daemon run      # Run it in the foreground (Ctrl+C to stop)
     slopesniper daemon stop     # Stop the daemon
     slopesniper daemon status   # Check daemon status
 """
@@ -20,17 +21,36 @@ import sys
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from .tools.config import SLOPESNIPER_DIR
+from .utils import atomic_write
+
+if TYPE_CHECKING:
+    from .tools.targets import SellTarget
 
 # Daemon files
 PID_FILE = SLOPESNIPER_DIR / "daemon.pid"
 LOG_FILE = SLOPESNIPER_DIR / "daemon.log"
+# Rotate the log at this size, keeping this many old files (daemon.log.1 ...)
+LOG_MAX_BYTES = 5_000_000
+LOG_BACKUP_COUNT = 3
+# PID of a running daemon that handles SIGUSR1 as "check now". Older daemons
+# don't write it, and SIGUSR1's default action would kill them
+WAKE_FILE = SLOPESNIPER_DIR / "daemon.wake"
+# flock()ed by the running daemon for its whole lifetime, so a second one
+# can't start between another's PID check and PID write. Never removed
+LOCK_FILE = SLOPESNIPER_DIR / "daemon.lock"
 
 # Default polling interval (seconds)
 DEFAULT_POLL_INTERVAL = 15
 
+# Max sells in flight at once when many targets trigger together
+DEFAULT_MAX_CONCURRENT_SELLS = 8
+
+# Re-read active targets at least this often even if the DB looks unchanged
+TARGETS_CACHE_TTL_SECONDS = 60
+
 
 def _setup_logger() -> logging.Logger:
     """Configure daemon logging."""
@@ -40,9 +60,11 @@ def _setup_logger() -> logging.Logger:
     # Remove existing handlers
     logger.handlers = []
 
-    # File handler
+    # File handler - rotated so a long-running daemon can't fill the disk
+    from logging.handlers import RotatingFileHandler
+
     SLOPESNIPER_DIR.mkdir(parents=True, exist_ok=True)
-    fh = logging.FileHandler(LOG_FILE)
+    fh = RotatingFileHandler(LOG_FILE, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT)
     fh.setLevel(logging.DEBUG)
 
     # Format
@@ -59,41 +81,120 @@ def _setup_logger() -> logging.Logger:
 class SlopeSniperDaemon:
     """Background daemon for target monitoring."""
 
-    def __init__(self, poll_interval: int = DEFAULT_POLL_INTERVAL):
+    def __init__(
+        self,
+        poll_interval: int = DEFAULT_POLL_INTERVAL,
+        max_concurrent_sells: int = DEFAULT_MAX_CONCURRENT_SELLS,
+    ):
         self.poll_interval = poll_interval
         self.running = False
         self.logger = _setup_logger()
 
+        # Bound once rather than imported per cycle/target; kept out of module
+        # scope so `daemon status/stop` don't load the trading stack
+        from .tools import targets
+
+        self._targets = targets
+        self._sell_sem = asyncio.Semaphore(max_concurrent_sells)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wake: asyncio.Event | None = None
+        self._integrity_check: asyncio.Task | None = None
+
+        # Active targets by id, reloaded when config.db changes on disk
+        # (e.g. `slopesniper target add` from another process) or the TTL
+        # runs out. The daemon's own writes update the cached objects, which
+        # are discarded if the write fails
+        self._targets_cache: dict[int, SellTarget] = {}
+        self._targets_loaded_at = 0.0
+        self._targets_db_mtime: int | None = None
+
     async def run(self) -> None:
         """Main daemon loop."""
         self.running = True
+        self._wake = asyncio.Event()
         self.logger.info(f"Daemon started (interval: {self.poll_interval}s)")
 
+        # Integrity check in a worker thread: its manifest fetch can stall on
+        # DNS/TCP for seconds, and targets keep being polled meanwhile. The
+        # task is kept referenced so it isn't garbage collected mid-flight
+        from .integrity import _run_startup_check
+
+        self._integrity_check = asyncio.create_task(asyncio.to_thread(_run_startup_check))
+
+        # Schedule cycles against fixed monotonic deadlines, so the period
+        # stays poll_interval however long each cycle takes
+        loop = self._loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+
+        # Handle signals on the loop so they wake the sleep below at once
+        handlers = [(signal.SIGTERM, self.stop), (signal.SIGINT, self.stop)]
+        if hasattr(signal, "SIGUSR1"):
+            handlers.append((signal.SIGUSR1, self.wake))
+        for sig, handler in handlers:
+            try:
+                loop.add_signal_handler(sig, handler)
+            except (NotImplementedError, RuntimeError):
+                pass  # No loop signal support (Windows / not main thread)
+            else:
+                if sig == getattr(signal, "SIGUSR1", None):
+                    try:
+                        atomic_write(WAKE_FILE, str(os.getpid()).encode())
+                    except OSError as e:
+                        # wake_daemon() won't signal us; we still poll on schedule
+                        self.logger.warning(f"Could not write wake file: {e}")
+
         while self.running:
             try:
                 await self._check_cycle()
             except Exception as e:
                 self.logger.error(f"Check cycle error: {e}")
 
-            # Use asyncio.sleep for proper async behavior
-            await asyncio.sleep(self.poll_interval)
-
+            next_tick += self.poll_interval
+            delay = next_tick - loop.time()
+            if delay < 0:
+                # Overran one or more ticks - start again from now rather
+                # than firing the missed ones back to back
+                self.logger.warning(f"Check cycle lagging by {-delay:.1f}s")
+                next_tick = loop.time()
+                delay = 0
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+            else:
+                # Woken early - check now and restart the cadence from here
+                self._wake.clear()
+                next_tick = loop.time()
+
+        WAKE_FILE.unlink(missing_ok=True)
         self.logger.info("Daemon stopped")
 
+    def _db_mtime(self) -> int | None:
+        """Get config.db's modification time, or None if it doesn't exist."""
+        from .tools.strategies import _get_config_db_path
+
+        try:
+            return os.stat(_get_config_db_path()).st_mtime_ns
+        except OSError:
+            return None
+
+    async def _active_targets(self) -> list[SellTarget]:
+        """Get active targets, hitting SQLite only if the DB changed or TTL expired."""
+        mtime = self._db_mtime()
+        if (
+            mtime != self._targets_db_mtime
+            or time.monotonic() - self._targets_loaded_at >= TARGETS_CACHE_TTL_SECONDS
+        ):
+            targets = await asyncio.to_thread(self._targets.get_active_targets)
+            self._targets_cache = {t.id: t for t in targets}
+            self._targets_loaded_at = time.monotonic()
+            # Stat after loading; get_active_targets may create the table
+            self._targets_db_mtime = self._db_mtime()
+        return list(self._targets_cache.values())
+
     async def _check_cycle(self) -> None:
         """Single check cycle for all targets."""
-        from .tools.targets import (
-            TargetType,
-            check_target,
-            execute_target_sell,
-            get_active_targets,
-            get_target,
-            mark_target_triggered,
-            poll_targets_batch,
-            update_trailing_peak,
-        )
-
-        targets = get_active_targets()
+        targets = await self._active_targets()
 
         if not targets:
             return
@@ -101,60 +202,146 @@ class SlopeSniperDaemon:
         self.logger.debug(f"Checking {len(targets)} active targets")
 
         # Batch fetch prices
-        price_data = await poll_targets_batch(targets)
+        price_data = await self._targets.poll_targets_batch(targets)
 
+        # Evaluate every target in memory, then commit the cycle's peak
+        # updates and trigger marks in one transaction before selling
+        peaks: list[tuple[int, float]] = []
+        triggered: list[tuple[SellTarget, float]] = []
         for target in targets:
             try:
-                data = price_data.get(target.mint, {})
-                current_price = data.get("price_usd", 0)
-                current_mcap = data.get("mcap")
-
-                if current_price <= 0:
-                    continue
-
-                # Update trailing stop peak
-                if target.target_type == TargetType.TRAILING_STOP:
-                    update_trailing_peak(target.id, current_price)
-                    # Refresh target to get updated peak
-                    refreshed = get_target(target.id)
-                    if refreshed:
-                        target = refreshed
-
-                # Check if target is met
-                if check_target(target, current_price, current_mcap):
-                    self.logger.info(
-                        f"TARGET TRIGGERED: {target.symbol} ({target.target_type.value}) "
-                        f"at ${current_price:.8g}"
-                    )
-
-                    # Mark as triggered
-                    mark_target_triggered(target.id, current_price)
-
-                    # Execute sell
-                    result = await execute_target_sell(target, current_price)
-
-                    if result.get("success") or result.get("auto_executed"):
-                        self.logger.info(
-                            f"SOLD: {target.symbol} - sig: {result.get('signature', 'N/A')}"
-                        )
-                    else:
-                        self.logger.error(
-                            f"SELL FAILED: {target.symbol} - {result.get('error')}"
-                        )
-
+                self._evaluate_target(target, price_data.get(target.mint, {}), peaks, triggered)
             except Exception as e:
                 self.logger.error(f"Error checking target {target.id}: {e}")
 
+        if peaks or triggered:
+            try:
+                await asyncio.to_thread(
+                    self._targets.apply_target_updates,
+                    peaks,
+                    [(t.id, price) for t, price in triggered],
+                )
+            except Exception:
+                # The cached targets already carry this cycle's new peaks and
+                # trigger marks; drop them so the next cycle reloads from the DB
+                self._invalidate_targets()
+                raise
+            self._own_write_done()
+
+        # Sell concurrently, so one slow sell doesn't hold up the others
+        # triggered in the same cycle
+        results = await asyncio.gather(
+            *(self._sell_target(t, price) for t, price in triggered),
+            return_exceptions=True,
+        )
+        for (target, _), result in zip(triggered, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Error selling target {target.id}: {result}")
+
+    def _invalidate_targets(self) -> None:
+        """Discard the cached targets so the next cycle reloads them."""
+        self._targets_cache = {}
+        self._targets_loaded_at = float("-inf")
+
+    def _own_write_done(self) -> None:
+        """Record the daemon's own DB write so it doesn't force a reload."""
+        self._targets_db_mtime = self._db_mtime()
+
+    def _evaluate_target(
+        self,
+        target: SellTarget,
+        data: dict[str, Any],
+        peaks: list[tuple[int, float]],
+        triggered: list[tuple[SellTarget, float]],
+    ) -> None:
+        """Check one target against its fetched price, queueing DB updates."""
+        current_price = data.get("price_usd", 0)
+        current_mcap = data.get("mcap")
+
+        if current_price <= 0:
+            return
+
+        # Record a new trailing stop high on the cached target; only new highs
+        # are queued for the DB
+        if target.target_type == self._targets.TargetType.TRAILING_STOP and current_price > (
+            target.peak_value or 0
+        ):
+            peaks.append((target.id, current_price))
+            target.peak_value = current_price
+
+        # Check if target is met
+        if self._targets.check_target(target, current_price, current_mcap):
+            self.logger.info(
+                f"TARGET TRIGGERED: {target.symbol} ({target.target_type.value}) "
+                f"at ${current_price:.8g}"
+            )
+
+            # Queue it to be marked triggered; it is no longer active
+            target.status = self._targets.TargetStatus.TRIGGERED
+            self._targets_cache.pop(target.id, None)
+            triggered.append((target, current_price))
+
+    async def _sell_target(self, target: SellTarget, current_price: float) -> None:
+        """Execute the sell for a triggered target."""
+        # Capped so a burst of triggers can't flood Jupiter
+        async with self._sell_sem:
+            result = await self._targets.execute_target_sell(target, current_price)
+
+        if result.get("success") or result.get("auto_executed"):
+            self.logger.info(f"SOLD: {target.symbol} - sig: {result.get('signature', 'N/A')}")
+        else:
+            self.logger.error(f"SELL FAILED: {target.symbol} - {result.get('error')}")
+
+    def wake(self) -> None:
+        """Run the next check cycle now rather than at the next tick. Thread-safe."""
+        if self._loop is None or self._wake is None:
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._wake.set)
+        except RuntimeError:
+            pass  # Loop already closed
+
     def stop(self) -> None:
         """Signal daemon to stop."""
         self.running = False
+        self.wake()
 
 
 def write_pid() -> None:
     """Write current PID to file."""
     SLOPESNIPER_DIR.mkdir(parents=True, exist_ok=True)
-    PID_FILE.write_text(str(os.getpid()))
-    os.chmod(PID_FILE, 0o600)
+    # Never appears half written or world-readable
+    atomic_write(PID_FILE, str(os.getpid()).encode())
+
+
+def _acquire_daemon_lock() -> int | None:
+    """
+    Take the daemon lock without blocking.
+
+    The lock is held until the returned descriptor is closed, or the
+    process holding it exits.
+
+    Returns:
+        The locked file descriptor, or None if another daemon holds the lock
+    """
+    SLOPESNIPER_DIR.mkdir(parents=True, exist_ok=True)
+    fd = os.open(LOCK_FILE, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        import fcntl
+
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except ImportError:
+        pass  # No flock (Windows) - rely on the PID file check alone
+    except OSError:
+        os.close(fd)
+        return None
+    return fd
+
+
+def _remove_pid_files() -> None:
+    """Remove the PID file and the wake marker that goes with it."""
+    PID_FILE.unlink(missing_ok=True)
+    WAKE_FILE.unlink(missing_ok=True)
 
 
 def read_pid() -> int | None:
@@ -177,8 +364,29 @@ def is_daemon_running() -> bool:
         os.kill(pid, 0)  # Signal 0 checks if process exists
         return True
     except OSError:
-        # Process doesn't exist, clean up stale PID file
-        PID_FILE.unlink(missing_ok=True)
+        # Process doesn't exist, clean up stale PID and wake files
+        _remove_pid_files()
+        return False
+
+
+def wake_daemon() -> bool:
+    """
+    Ask the running daemon to check targets now, e.g. after a target change.
+
+    Returns:
+        True if a daemon was signalled
+    """
+    # Only signal a live daemon (this also clears a stale PID and wake file)
+    if not hasattr(signal, "SIGUSR1") or not is_daemon_running():
+        return False
+    pid = read_pid()
+
+    try:
+        if int(WAKE_FILE.read_text().strip()) != pid:
+            return False  # Daemon predates SIGUSR1 handling
+        os.kill(pid, signal.SIGUSR1)
+        return True
+    except (OSError, ValueError):
         return False
 
 
@@ -190,15 +398,22 @@ def start_daemon(poll_interval: int = DEFAULT_POLL_INTERVAL) -> dict[str, Any]:
     """
     if is_daemon_running():
         return {"error": "Daemon already running", "pid": read_pid()}
+    # Taken before forking; the daemon process inherits it and holds it
+    # until it exits
+    lock_fd = _acquire_daemon_lock()
+    if lock_fd is None:
+        return {"error": "Daemon already running", "pid": read_pid()}
 
     # Fork to background
     try:
         pid = os.fork()
     except OSError as e:
+        os.close(lock_fd)
         return {"error": f"Fork failed: {e}"}
 
     if pid > 0:
         # Parent process - wait briefly to ensure child starts
+        os.close(lock_fd)
         time.sleep(0.5)
         if is_daemon_running():
             return {
@@ -226,17 +441,11 @@ def start_daemon(poll_interval: int = DEFAULT_POLL_INTERVAL) -> dict[str, Any]:
     # Write PID
     write_pid()
 
-    # Setup signal handlers
+    # SIGTERM/SIGINT handlers are installed on the loop by daemon.run()
     daemon = SlopeSniperDaemon(poll_interval=poll_interval)
 
-    def handle_sigterm(signum: int, frame: Any) -> None:
-        daemon.stop()
-
-    signal.signal(signal.SIGTERM, handle_sigterm)
-    signal.signal(signal.SIGINT, handle_sigterm)
-
     # Redirect stdout/stderr to log
-    sys.stdout = open(LOG_FILE, "a")  # noqa: SIM115
+    sys.stdout = open(LOG_FILE, "a")
     sys.stderr = sys.stdout
 
     # Run daemon
@@ -246,10 +455,79 @@ def start_daemon(poll_interval: int = DEFAULT_POLL_INTERVAL) -> dict[str, Any]:
         daemon.logger.error(f"Daemon crashed: {e}")
     finally:
         # Cleanup
-        PID_FILE.unlink(missing_ok=True)
+        _remove_pid_files()
         sys.exit(0)
 
 
+def run_foreground(poll_interval: int = DEFAULT_POLL_INTERVAL) -> dict[str, Any]:
+    """
+    Run the daemon loop in this process, logging to stdout as well.
+
+    Monitors every active target from a single process with one batched
+    price fetch per cycle. Holds the daemon lock and PID file while running,
+    so a background daemon cannot double-execute the same targets.
+
+    Returns dict with status once stopped (Ctrl+C).
+    """
+    if is_daemon_running():
+        return {"error": "Daemon already running", "pid": read_pid()}
+    lock_fd = _acquire_daemon_lock()
+    if lock_fd is None:
+        return {"error": "Daemon already running", "pid": read_pid()}
+
+    try:
+        write_pid()
+        daemon = SlopeSniperDaemon(poll_interval=poll_interval)
+
+        console = logging.StreamHandler(sys.stdout)
+        console.setFormatter(logging.Formatter("[%(asctime)s] %(message)s", datefmt="%H:%M:%S"))
+        daemon.logger.addHandler(console)
+
+        asyncio.run(daemon.run())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        # PID files go first, so the next daemon never sees ours
+        _remove_pid_files()
+        os.close(lock_fd)
+
+    return {"success": True, "message": "Daemon stopped"}
+
+
+def _wait_for_exit(pid: int, timeout: float) -> bool:
+    """
+    Block until a process exits or the timeout passes.
+
+    Uses a pidfd (Linux 5.3+) so the kernel wakes us on exit; falls back
+    to polling elsewhere.
+
+    Returns:
+        True if the process exited within the timeout
+    """
+    try:
+        pidfd = os.pidfd_open(pid)
+    except ProcessLookupError:
+        return True
+    except (AttributeError, OSError):
+        pidfd = None
+
+    if pidfd is not None:
+        import select
+
+        try:
+            readable, _, _ = select.select([pidfd], [], [], timeout)
+            return bool(readable)
+        finally:
+            os.close(pidfd)
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if not is_daemon_running():
+            return True
+        time.sleep(0.1)
+    return not is_daemon_running()
+
+
 def stop_daemon() -> dict[str, Any]:
     """Stop running daemon."""
     pid = read_pid()
@@ -258,29 +536,62 @@ def stop_daemon() -> dict[str, Any]:
         return {"error": "No daemon running (no PID file)"}
 
     if not is_daemon_running():
-        PID_FILE.unlink(missing_ok=True)
+        _remove_pid_files()
         return {"error": "Daemon not running (stale PID file cleaned up)"}
 
     try:
         os.kill(pid, signal.SIGTERM)
 
         # Wait for process to exit (up to 5 seconds)
-        for _ in range(50):
-            if not is_daemon_running():
-                PID_FILE.unlink(missing_ok=True)
-                return {"success": True, "message": "Daemon stopped"}
-            time.sleep(0.1)
+        if _wait_for_exit(pid, 5.0):
+            _remove_pid_files()
+            return {"success": True, "message": "Daemon stopped"}
 
         # Force kill if still running
         os.kill(pid, signal.SIGKILL)
-        PID_FILE.unlink(missing_ok=True)
+        _remove_pid_files()
         return {"success": True, "message": "Daemon force stopped"}
 
     except ProcessLookupError:
-        PID_FILE.unlink(missing_ok=True)
+        _remove_pid_files()
         return {"success": True, "message": "Daemon already stopped"}
 
 
+def _tail(path: Path, n: int, chunk: int = 65536) -> list[str]:
+    """
+    Get the last n lines of a file without reading all of it.
+
+    Reads a block from the end of the file, doubling it until it holds n
+    complete lines or covers the whole file.
+    """
+    with open(path, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        while True:
+            start = max(0, size - chunk)
+            f.seek(start)
+            data = f.read(size - start)
+            if start == 0:
+                lines = data.strip().split(b"\n")
+                break
+            lines = data.rstrip().split(b"\n")
+            if len(lines) > n:
+                break  # lines[0] may be cut mid-line, but it's not returned
+            chunk *= 2
+    return [line.decode(errors="replace") for line in lines[-n:]]
+
+
+def _count_lines(path: Path) -> int:
+    """Count lines in a file by scanning raw blocks (no decoding)."""
+    count = 0
+    last = b"\n"
+    with open(path, "rb") as f:
+        while block := f.read(1 << 20):
+            count += block.count(b"\n")
+            last = block[-1:]
+    # A final line without a trailing newline still counts
+    return count + (last != b"\n")
+
+
 def get_daemon_status() -> dict[str, Any]:
     """Get daemon status."""
     running = is_daemon_running()
@@ -303,8 +614,7 @@ def get_daemon_status() -> dict[str, Any]:
     # Recent log entries
     if LOG_FILE.exists():
         try:
-            lines = LOG_FILE.read_text().strip().split("\n")
-            status["recent_logs"] = lines[-5:]  # Last 5 lines
+            status["recent_logs"] = _tail(LOG_FILE, 5)  # Last 5 lines
         except Exception:
             pass
 
@@ -317,10 +627,15 @@ def get_daemon_logs(tail: int = 50) -> dict[str, Any]:
         return {"logs": [], "message": "No log file found"}
 
     try:
-        lines = LOG_FILE.read_text().strip().split("\n")
+        if tail > 0:
+            lines = _tail(LOG_FILE, tail)
+            total_lines = _count_lines(LOG_FILE)
+        else:
+            lines = LOG_FILE.read_text().strip().split("\n")
+            total_lines = len(lines)
         return {
-            "logs": lines[-tail:] if tail > 0 else lines,
-            "total_lines": len(lines),
+            "logs": lines,
+            "total_lines": total_lines,
             "showing": min(tail, len(lines)),
             "log_file": str(LOG_FILE),
         }
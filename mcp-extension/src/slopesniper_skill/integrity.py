@@ -22,10 +22,18 @@ import hashlib
 import json
 import logging
 import os
-import platform
-import uuid
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
+
+from .utils import atomic_write, http_request
+
+try:
+    import orjson
+except ImportError:  # Optional - falls back to compact stdlib json
+    orjson = None
 
 # Files to check for modifications (relative to package root)
 MONITORED_FILES = [
@@ -39,69 +47,256 @@ MONITORED_FILES = [
 # How often to check (don't spam on every import)
 CHECK_INTERVAL_HOURS = 24
 
+# Read size when hashing without mmap or file_digest; large reads amortize
+# syscalls and per-update() overhead
+_HASH_CHUNK_SIZE = 1 << 20
+
+# Files up to this size are mmapped and hashed in a single update() call
+_MMAP_MAX_SIZE = 4 * 1024 * 1024
+
+# Manifest key naming the digest algorithm; manifests without it are SHA256
+MANIFEST_ALGORITHM_KEY = "_algorithm"
+DEFAULT_HASH_ALGORITHM = "sha256"
+
+# Manifest key that may carry the callback.json config, saving its own fetch.
+# Like all "_" keys it is metadata, not a monitored file
+MANIFEST_CALLBACK_KEY = "_callback"
+
 # Where to store check results
 INTEGRITY_CACHE_FILE = Path.home() / ".slopesniper" / "integrity_cache.json"
 
+# Parsed integrity cache, reused until the file's mtime changes
+_integrity_cache: dict | None = None
+_integrity_mtime: int | None = None
+
+# Last computed digest of each monitored file and the stat signature it was
+# computed at; persisted in the integrity cache as "per_file"
+_file_digests: dict[str, dict] | None = None
+
+
+_PACKAGE_ROOT = Path(__file__).parent
+
+# (relative, absolute) path of each monitored file, resolved once
+_MONITORED_PATHS = tuple((rel_path, _PACKAGE_ROOT / rel_path) for rel_path in MONITORED_FILES)
+
 
 def _get_package_root() -> Path:
     """Get the package root directory."""
-    return Path(__file__).parent
+    return _PACKAGE_ROOT
+
 
+def _get_hasher(algorithm: str) -> Any:
+    """
+    Get the hash constructor for a manifest digest algorithm.
+
+    Raises:
+        ValueError: Unknown algorithm
+        ImportError: blake3 requested but not installed
+    """
+    if algorithm == "sha256":
+        return hashlib.sha256
+    if algorithm == "blake3":
+        from blake3 import blake3  # Optional - SIMD-accelerated
 
-def _hash_file(filepath: Path) -> str:
-    """Generate SHA256 hash of a file."""
-    if not filepath.exists():
+        return blake3
+    raise ValueError(f"Unsupported hash algorithm: {algorithm}")
+
+
+def _hash_file(filepath: Path, hasher_cls: Any = hashlib.sha256) -> str:
+    """Generate a hash of a file (SHA256 unless another hasher is given)."""
+    try:
+        # Unbuffered: both paths below read straight into their own buffers
+        f = open(filepath, "rb", buffering=0)
+    except FileNotFoundError:
         return "MISSING"
 
-    hasher = hashlib.sha256()
-    with open(filepath, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            hasher.update(chunk)
+    with f:
+        size = os.fstat(f.fileno()).st_size
+        if 0 < size <= _MMAP_MAX_SIZE:
+            import mmap
+
+            hasher = hasher_cls()
+            try:
+                # Hash the whole mapping in one update() call (zero-copy)
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    hasher.update(mm)
+                return hasher.hexdigest()[:16]
+            except (OSError, ValueError):
+                pass  # Filesystem refuses to map - read it instead
+
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+: read loop in C
+            hasher = hashlib.file_digest(f, hasher_cls)
+        else:
+            # Read into one reused buffer
+            hasher = hasher_cls()
+            buf = bytearray(_HASH_CHUNK_SIZE)
+            view = memoryview(buf)
+            f.seek(0)
+            while n := f.readinto(buf):
+                hasher.update(view[:n])
     return hasher.hexdigest()[:16]  # First 16 chars is enough
 
 
-def _get_local_hashes() -> dict[str, str]:
-    """Get hashes of all monitored files."""
-    package_root = _get_package_root()
-    hashes = {}
+def _get_local_hashes(algorithm: str = DEFAULT_HASH_ALGORITHM) -> dict[str, str]:
+    """
+    Get hashes of all monitored files.
+
+    Files whose stat signature (mtime, size, inode) hasn't changed since they
+    were last hashed reuse the cached digest.
+    """
+    from concurrent.futures import ThreadPoolExecutor
 
-    for rel_path in MONITORED_FILES:
-        filepath = package_root / rel_path
-        hashes[rel_path] = _hash_file(filepath)
+    global _file_digests
 
-    return hashes
+    hasher_cls = _get_hasher(algorithm)
+    if _file_digests is None:
+        _file_digests = dict((_load_cache() or {}).get("per_file") or {})
+
+    hashes: dict[str, str] = {}
+    stale: list[tuple[str, Path, list]] = []
+    for rel_path, filepath in _MONITORED_PATHS:
+        try:
+            st = filepath.stat()
+        except FileNotFoundError:
+            hashes[rel_path] = "MISSING"
+            continue
+        stat_key = [algorithm, st.st_mtime_ns, st.st_size, st.st_ino]
+        entry = _file_digests.get(rel_path)
+        if entry and entry.get("stat") == stat_key:
+            hashes[rel_path] = entry["digest"]
+        else:
+            stale.append((rel_path, filepath, stat_key))
+
+    if stale:
+        # Files are independent and hashlib releases the GIL, so hash them in parallel
+        with ThreadPoolExecutor(max_workers=min(8, len(stale))) as executor:
+            digests = executor.map(lambda item: _hash_file(item[1], hasher_cls), stale)
+            for (rel_path, _, stat_key), digest in zip(stale, digests):
+                hashes[rel_path] = digest
+                _file_digests[rel_path] = {"stat": stat_key, "digest": digest}
+
+    return {rel_path: hashes[rel_path] for rel_path, _ in _MONITORED_PATHS}
+
+
+def _dumps(obj: Any) -> bytes:
+    """Compact JSON encode for cache files and request bodies."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _loads(data: bytes) -> Any:
+    """JSON decode for cache files and responses (bytes in, no text decode)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _load_cache() -> dict | None:
+    """Load the integrity cache, re-parsing only when the file has changed."""
+    global _integrity_cache, _integrity_mtime
+
+    try:
+        mtime = INTEGRITY_CACHE_FILE.stat().st_mtime_ns
+    except OSError:
+        return None
+
+    if mtime != _integrity_mtime:
+        try:
+            _integrity_cache = _loads(INTEGRITY_CACHE_FILE.read_bytes())
+        except Exception:
+            return None
+        _integrity_mtime = mtime
+    return _integrity_cache
 
 
 def _should_check() -> bool:
     """Determine if we should run integrity check (rate limited)."""
-    if not INTEGRITY_CACHE_FILE.exists():
+    cache = _load_cache()
+    if cache is None:
         return True
 
     try:
-        cache = json.loads(INTEGRITY_CACHE_FILE.read_text())
-        last_check = datetime.fromisoformat(cache.get("last_check", "2000-01-01"))
-        return datetime.now() - last_check > timedelta(hours=CHECK_INTERVAL_HOURS)
+        return time.time() - cache.get("last_check_ts", 0) > CHECK_INTERVAL_HOURS * 3600
     except Exception:
         return True
 
 
-def _update_cache(result: dict) -> None:
-    """Update the integrity check cache."""
+def _update_cache(
+    result: dict,
+    manifest: dict | None = None,
+    etag: str | None = None,
+    fetched_at: float | None = None,
+) -> None:
+    """
+    Update the integrity check cache.
+
+    Args:
+        result: Check result to cache
+        manifest: Manifest the check ran against, kept for revalidation and
+            its embedded callback config
+        etag: ETag the manifest was served with
+        fetched_at: Epoch time the manifest was last fetched or revalidated
+    """
+    global _integrity_cache, _integrity_mtime
+
     try:
         INTEGRITY_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
         cache = {
             "last_check": datetime.now().isoformat(),
+            "last_check_ts": time.time(),
             "result": result,
         }
-        INTEGRITY_CACHE_FILE.write_text(json.dumps(cache, indent=2))
+        if manifest is not None:
+            # Kept for the embedded callback config, and with an ETag lets the
+            # next check send If-None-Match instead of a full GET
+            cache["manifest"] = manifest
+            if etag:
+                cache["etag"] = etag
+            if fetched_at:
+                cache["manifest_fetched_at"] = fetched_at
+        per_file = (
+            _file_digests if _file_digests is not None else (_load_cache() or {}).get("per_file")
+        )
+        if per_file:
+            cache["per_file"] = per_file
+        atomic_write(INTEGRITY_CACHE_FILE, _dumps(cache))
+        _integrity_cache = cache
+        _integrity_mtime = INTEGRITY_CACHE_FILE.stat().st_mtime_ns
     except Exception:
         pass  # Non-critical
 
 
-def _fetch_expected_hashes() -> dict[str, str] | None:
-    """Fetch expected file hashes from GitHub."""
+def _fetch_expected_hashes(
+    force: bool = False,
+) -> tuple[dict[str, str] | None, str | None, float | None]:
+    """
+    Fetch expected file hashes from GitHub.
+
+    A manifest fetched within CHECK_INTERVAL_HOURS is reused without any
+    network I/O. An older one, or any manifest on a forced check (which
+    typically follows an update, when the cached copy may describe the
+    previous release), is revalidated with a conditional GET, so an
+    unchanged manifest costs a bodyless 304.
+
+    Args:
+        force: If True, always revalidate the cached manifest
+
+    Returns:
+        Tuple of (manifest or None on failure, ETag or None, fetch time or None)
+    """
+    cache = _load_cache() or {}
+    cached_manifest = cache.get("manifest")
+    cached_etag = cache.get("etag")
+    fetched_at = cache.get("manifest_fetched_at")
+
+    if not force and cached_manifest is not None and isinstance(fetched_at, (int, float)):
+        if time.time() - fetched_at < CHECK_INTERVAL_HOURS * 3600:
+            return cached_manifest, cached_etag, fetched_at
+
+    now = time.time()
     try:
-        import urllib.request
+        import urllib.error
 
         # Fetch integrity manifest from GitHub
         url = os.environ.get(
@@ -109,11 +304,19 @@ def _fetch_expected_hashes() -> dict[str, str] | None:
             "https://raw.githubusercontent.com/BAGWATCHER/SlopeSniper/main/config/integrity.json",
         )
 
-        req = urllib.request.Request(url, headers={"User-Agent": "SlopeSniper/integrity"})
-        with urllib.request.urlopen(req, timeout=5) as resp:
-            return json.loads(resp.read().decode())
+        headers = {"User-Agent": "SlopeSniper/integrity"}
+        if cached_manifest is not None and cached_etag:
+            headers["If-None-Match"] = cached_etag
+
+        try:
+            body, resp_headers = http_request(url, headers=headers, connect_timeout=1)
+            return _loads(body), resp_headers.get("ETag"), now
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and cached_manifest is not None:
+                return cached_manifest, cached_etag, now
+            raise
     except Exception:
-        return None
+        return None, None, None
 
 
 def check_integrity(force: bool = False) -> dict:
@@ -130,11 +333,9 @@ def check_integrity(force: bool = False) -> dict:
 
     if not force and not _should_check():
         # Return cached result
-        try:
-            cache = json.loads(INTEGRITY_CACHE_FILE.read_text())
+        cache = _load_cache()
+        if cache is not None:
             return cache.get("result", {"status": "unknown"})
-        except Exception:
-            pass
 
     result = {
         "status": "ok",
@@ -144,15 +345,23 @@ def check_integrity(force: bool = False) -> dict:
     }
 
     # Get expected hashes from GitHub
-    expected = _fetch_expected_hashes()
-    if expected is None:
+    manifest, etag, fetched_at = _fetch_expected_hashes(force)
+    if manifest is None:
         result["status"] = "skip"
         result["reason"] = "Could not fetch integrity manifest"
         _update_cache(result)
         return result
 
-    # Compare with local
-    local = _get_local_hashes()
+    # Compare with local, using whichever algorithm the manifest was built with
+    expected = {path: digest for path, digest in manifest.items() if not path.startswith("_")}
+    algorithm = manifest.get(MANIFEST_ALGORITHM_KEY, DEFAULT_HASH_ALGORITHM)
+    try:
+        local = _get_local_hashes(algorithm)
+    except (ImportError, ValueError) as e:
+        result["status"] = "skip"
+        result["reason"] = f"Cannot verify {algorithm} manifest: {e}"
+        _update_cache(result, manifest, etag, fetched_at)
+        return result
 
     for filepath, expected_hash in expected.items():
         local_hash = local.get(filepath, "UNKNOWN")
@@ -179,26 +388,41 @@ def check_integrity(force: bool = False) -> dict:
     else:
         logger.debug("[IntegrityCheck] All files match expected hashes")
 
-    _update_cache(result)
+    _update_cache(result, manifest, etag, fetched_at)
     return result
 
 
-def generate_integrity_manifest() -> dict:
+def generate_integrity_manifest(
+    algorithm: str = DEFAULT_HASH_ALGORITHM, callback_config: dict | None = None
+) -> dict:
     """
     Generate integrity manifest for the current codebase.
 
     This should be run by maintainers before release to update
     the config/integrity.json file on GitHub.
 
+    Args:
+        algorithm: "sha256" (default) or "blake3". Non-default algorithms are
+            recorded in the manifest; clients without blake3 installed skip
+            the check rather than report every file as modified.
+        callback_config: Contents of config/callback.json to embed, so clients
+            get it with the manifest instead of fetching it separately. Clients
+            older than this option report the extra key as a modified file.
+
     Returns:
         Dict of file paths to hashes
     """
-    return _get_local_hashes()
+    manifest: dict[str, Any] = dict(_get_local_hashes(algorithm))
+    if algorithm != DEFAULT_HASH_ALGORITHM:
+        manifest[MANIFEST_ALGORITHM_KEY] = algorithm
+    if callback_config is not None:
+        manifest[MANIFEST_CALLBACK_KEY] = callback_config
+    return manifest
 
 
 # Run check on import (rate-limited)
 def _run_startup_check() -> None:
-    """Run integrity check on module import."""
+    """Run integrity check on module import (also run by the daemon at startup)."""
     # Only run in production-like environments
     if os.environ.get("SLOPESNIPER_SKIP_INTEGRITY_CHECK"):
         return
@@ -256,6 +480,8 @@ def _get_instance_id() -> str:
             pass
 
     # Generate new ID
+    import uuid
+
     instance_id = str(uuid.uuid4())[:8]
     try:
         id_file.parent.mkdir(parents=True, exist_ok=True)
@@ -273,50 +499,54 @@ def _get_file_diff_summary(filepath: Path) -> dict | None:
     Returns line count changes and a brief description,
     NOT the actual code (for privacy).
     """
-    if not filepath.exists():
-        return {"status": "missing"}
-
     try:
         content = filepath.read_text()
-        lines = content.split("\n")
-
-        # Extract docstring/description if present
-        description = ""
-        if '"""' in content:
-            start = content.find('"""') + 3
-            end = content.find('"""', start)
-            if end > start:
-                description = content[start:end].strip()[:100]
-
-        return {
-            "line_count": len(lines),
-            "has_async": "async def" in content,
-            "has_class": "class " in content,
-            "function_count": content.count("def "),
-            "description_preview": description,
-        }
+    except FileNotFoundError:
+        return {"status": "missing"}
     except Exception:
         return {"status": "error"}
 
+    # Extract docstring/description if present
+    description = ""
+    if '"""' in content:
+        start = content.find('"""') + 3
+        end = content.find('"""', start)
+        if end > start:
+            description = content[start:end].strip()[:100]
+
+    return {
+        "line_count": content.count("\n") + 1,  # Same as len(split("\n")), no list
+        "has_async": "async def" in content,
+        "has_class": "class " in content,
+        "function_count": content.count("def "),
+        "description_preview": description,
+    }
 
-def _should_send_callback(modified_files: list) -> bool:
-    """Check if we should send a callback (avoid duplicates)."""
-    if not modified_files:
-        return False
 
-    # Create a signature of the current modifications
-    sig = hashlib.md5(json.dumps(sorted([f["file"] for f in modified_files])).encode()).hexdigest()[
-        :8
-    ]
+def _modification_signature(modified_files: list) -> str:
+    """
+    Signature of a set of modified files, for report de-duplication.
+
+    MD5 over the sorted file names - not a security use, and kept so that
+    signatures already in callback_cache.json still match.
+    """
+    names = json.dumps(sorted([f["file"] for f in modified_files])).encode()
+    return hashlib.md5(names, usedforsecurity=False).hexdigest()[:8]
 
+
+def _should_send_callback(sig: str) -> bool:
+    """Check if we should send a callback for this signature (avoid duplicates)."""
     # Check cache
     if CALLBACK_CACHE_FILE.exists():
         try:
-            cache = json.loads(CALLBACK_CACHE_FILE.read_text())
+            cache = _loads(CALLBACK_CACHE_FILE.read_bytes())
             if cache.get("last_signature") == sig:
-                last_sent = datetime.fromisoformat(cache.get("last_sent", "2000-01-01"))
+                last_sent = cache.get("last_sent_ts")
+                if last_sent is None:
+                    # Written before epoch timestamps were stored
+                    last_sent = datetime.fromisoformat(cache["last_sent"]).timestamp()
                 # Don't re-send same modifications within 7 days
-                if datetime.now() - last_sent < timedelta(days=7):
+                if time.time() - last_sent < 7 * 24 * 3600:
                     return False
         except Exception:
             pass
@@ -331,12 +561,42 @@ def _update_callback_cache(signature: str) -> None:
         cache = {
             "last_signature": signature,
             "last_sent": datetime.now().isoformat(),
+            "last_sent_ts": time.time(),
         }
-        CALLBACK_CACHE_FILE.write_text(json.dumps(cache))
+        atomic_write(CALLBACK_CACHE_FILE, _dumps(cache))
     except Exception:
         pass
 
 
+@lru_cache(maxsize=1)
+def _fetch_callback_config() -> dict:
+    """
+    Fetch config/callback.json, once per process.
+
+    Both the callback token and the GitHub token are decoded from it, so a
+    report needs only one fetch. Uses the copy embedded in the last fetched
+    integrity manifest when there is one. Failures aren't cached.
+    """
+    url = os.environ.get("SLOPESNIPER_CONFIG_URL")
+    if url is None:
+        manifest = (_load_cache() or {}).get("manifest") or {}
+        embedded = manifest.get(MANIFEST_CALLBACK_KEY)
+        if isinstance(embedded, dict):
+            return embedded
+        url = "https://raw.githubusercontent.com/BAGWATCHER/SlopeSniper/main/config/callback.json"
+
+    body, _ = http_request(url, headers={"User-Agent": "SlopeSniper/callback"})
+    return _loads(body)
+
+
+def _xor_decode(xored: bytes, key: str) -> str:
+    """XOR-decode a config token against a repeating key, as one big-int XOR."""
+    n = len(xored)
+    key_bytes = (key.encode() * (n // len(key) + 1))[:n]
+    decoded = int.from_bytes(xored, "big") ^ int.from_bytes(key_bytes, "big")
+    return decoded.to_bytes(n, "big").decode()
+
+
 def _get_callback_token() -> str | None:
     """
     Fetch callback authentication token from config.
@@ -345,29 +605,16 @@ def _get_callback_token() -> str | None:
     and decoded at runtime for authenticated callbacks.
     """
     try:
-        import urllib.request
+        data = _fetch_callback_config()
 
-        url = os.environ.get(
-            "SLOPESNIPER_CONFIG_URL",
-            "https://raw.githubusercontent.com/BAGWATCHER/SlopeSniper/main/config/callback.json",
-        )
+        # Decode token (same pattern as Jupiter key)
+        if data.get("v") == 1 and data.get("t"):
+            import base64
 
-        req = urllib.request.Request(url, headers={"User-Agent": "SlopeSniper/callback"})
-        with urllib.request.urlopen(req, timeout=5) as resp:
-            data = json.loads(resp.read().decode())
-
-            # Decode token (same pattern as Jupiter key)
-            if data.get("v") == 1 and data.get("t"):
-                import base64
-
-                _p = "slopesniper"
-                _y = "contrib"
-                key = f"{_p}{_y}"
-                xored = base64.b64decode(data["t"])
-                key_bytes = (key * ((len(xored) // len(key)) + 1))[: len(xored)]
-                return bytes(
-                    a ^ b for a, b in zip(xored, key_bytes.encode(), strict=False)
-                ).decode()
+            _p = "slopesniper"
+            _y = "contrib"
+            key = f"{_p}{_y}"
+            return _xor_decode(base64.b64decode(data["t"]), key)
 
     except Exception:
         pass
@@ -383,29 +630,16 @@ def _get_github_token() -> str | None:
     Has minimal permissions (issues:write only).
     """
     try:
-        import urllib.request
+        data = _fetch_callback_config()
 
-        url = os.environ.get(
-            "SLOPESNIPER_CONFIG_URL",
-            "https://raw.githubusercontent.com/BAGWATCHER/SlopeSniper/main/config/callback.json",
-        )
-
-        req = urllib.request.Request(url, headers={"User-Agent": "SlopeSniper/contrib"})
-        with urllib.request.urlopen(req, timeout=5) as resp:
-            data = json.loads(resp.read().decode())
+        # Decode GitHub token (v2 format)
+        if data.get("v") == 2 and data.get("gh"):
+            import base64
 
-            # Decode GitHub token (v2 format)
-            if data.get("v") == 2 and data.get("gh"):
-                import base64
-
-                _p = "slopesniper"
-                _y = "github"
-                key = f"{_p}{_y}"
-                xored = base64.b64decode(data["gh"])
-                key_bytes = (key * ((len(xored) // len(key)) + 1))[: len(xored)]
-                return bytes(
-                    a ^ b for a, b in zip(xored, key_bytes.encode(), strict=False)
-                ).decode()
+            _p = "slopesniper"
+            _y = "github"
+            key = f"{_p}{_y}"
+            return _xor_decode(base64.b64decode(data["gh"]), key)
 
     except Exception:
         pass
@@ -413,12 +647,15 @@ def _get_github_token() -> str | None:
     return None
 
 
+@lru_cache(maxsize=1)
 def _check_gh_cli() -> bool:
-    """Check if GitHub CLI is available and authenticated."""
+    """Check if GitHub CLI is available and authenticated (once per process)."""
     try:
         import subprocess
 
-        result = subprocess.run(["gh", "auth", "status"], capture_output=True, timeout=5)
+        result = subprocess.run(
+            ["gh", "auth", "status"], stdin=subprocess.DEVNULL, capture_output=True, timeout=5
+        )
         return result.returncode == 0
     except Exception:
         return False
@@ -443,6 +680,8 @@ def submit_github_contribution(
     Returns:
         Result with issue URL or error
     """
+    import platform
+
     # Build issue body
     file_list = "\n".join([f"- `{f['file']}`" for f in modified_files])
 
@@ -468,23 +707,23 @@ If these changes are useful, please consider incorporating them into the project
 
     title = title or f"Contribution: {len(modified_files)} file(s) modified"
 
+    # Same issue payload for both methods
+    data = _dumps(
+        {
+            "title": title,
+            "body": body,
+            "labels": ["contribution", "auto-generated"],
+        }
+    )
+
     # Method 1: Try GitHub API directly (preferred - no CLI needed)
     gh_token = _get_github_token()
     if gh_token:
         try:
-            import urllib.request
-
             api_url = f"https://api.github.com/repos/{GITHUB_REPO}/issues"
-            payload = {
-                "title": title,
-                "body": body,
-                "labels": ["contribution", "auto-generated"],
-            }
-
-            data = json.dumps(payload).encode("utf-8")
-            req = urllib.request.Request(
+            resp_body, _ = http_request(
                 api_url,
-                data=data,
+                method="POST",
                 headers={
                     "Accept": "application/vnd.github+json",
                     "Authorization": f"Bearer {gh_token}",
@@ -492,18 +731,18 @@ If these changes are useful, please consider incorporating them into the project
                     "User-Agent": f"SlopeSniper/{_get_version()}",
                     "Content-Type": "application/json",
                 },
-                method="POST",
+                data=data,
+                timeout=15,
             )
 
-            with urllib.request.urlopen(req, timeout=15) as resp:
-                result = json.loads(resp.read().decode())
-                return {
-                    "submitted": True,
-                    "method": "github_api",
-                    "url": result.get("html_url"),
-                    "issue_number": result.get("number"),
-                    "message": "Contribution submitted as GitHub issue. Thank you!",
-                }
+            result = _loads(resp_body)
+            return {
+                "submitted": True,
+                "method": "github_api",
+                "url": result.get("html_url"),
+                "issue_number": result.get("number"),
+                "message": "Contribution submitted as GitHub issue. Thank you!",
+            }
 
         except Exception as e:
             logging.getLogger("SlopeSniper.Contrib").debug(f"GitHub API failed: {e}")
@@ -514,31 +753,21 @@ If these changes are useful, please consider incorporating them into the project
         try:
             import subprocess
 
+            # `gh api` posts the payload straight to the REST endpoint
             result = subprocess.run(
-                [
-                    "gh",
-                    "issue",
-                    "create",
-                    "--repo",
-                    GITHUB_REPO,
-                    "--title",
-                    title,
-                    "--body",
-                    body,
-                    "--label",
-                    "contribution,auto-generated",
-                ],
+                ["gh", "api", "--method", "POST", f"repos/{GITHUB_REPO}/issues", "--input", "-"],
+                input=data,
                 capture_output=True,
-                text=True,
                 timeout=30,
             )
 
             if result.returncode == 0:
-                url = result.stdout.strip()
+                issue = _loads(result.stdout)
                 return {
                     "submitted": True,
                     "method": "gh_cli",
-                    "url": url,
+                    "url": issue.get("html_url"),
+                    "issue_number": issue.get("number"),
                     "message": "Contribution submitted as GitHub issue. Thank you!",
                 }
         except Exception as e:
@@ -608,11 +837,14 @@ def send_contribution_callback(
     if not modified_files:
         return {"sent": False, "reason": "No modifications to report"}
 
-    if not _should_send_callback(modified_files):
+    sig = _modification_signature(modified_files)
+    if not _should_send_callback(sig):
         return {"sent": False, "reason": "Already reported recently"}
 
     url = callback_url or DEFAULT_CALLBACK_URL
 
+    import platform
+
     # Build the report payload
     package_root = _get_package_root()
 
@@ -644,8 +876,6 @@ def send_contribution_callback(
 
     # Send the report with authentication
     try:
-        import urllib.request
-
         # Get auth token for API callback
         auth_token = _get_callback_token()
 
@@ -658,29 +888,19 @@ def send_contribution_callback(
         if auth_token:
             headers["X-SlopeSniper-Token"] = auth_token
 
-        data = json.dumps(payload).encode("utf-8")
-        req = urllib.request.Request(
-            url,
-            data=data,
-            headers=headers,
-            method="POST",
-        )
-
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            response_data = resp.read().decode()
+        data = _dumps(payload)
+        body, _ = http_request(url, method="POST", headers=headers, data=data, timeout=10)
+        response_data = body.decode()
 
-            # Update cache on success
-            sig = hashlib.md5(
-                json.dumps(sorted([f["file"] for f in modified_files])).encode()
-            ).hexdigest()[:8]
-            _update_callback_cache(sig)
+        # Update cache on success
+        _update_callback_cache(sig)
 
-            logger.info("[Callback] Contribution report sent successfully")
-            return {
-                "sent": True,
-                "files_reported": len(modified_files),
-                "response": response_data[:100],
-            }
+        logger.info("[Callback] Contribution report sent successfully")
+        return {
+            "sent": True,
+            "files_reported": len(modified_files),
+            "response": response_data[:100],
+        }
 
     except Exception as e:
         logger.debug(f"[Callback] Failed to send report: {e}")
@@ -13,13 +13,33 @@ API Docs: https://docs.dexscreener.com/api/reference
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime
+import time
 from typing import Any
 
 import aiohttp
 
 from .utils import Utils
 
+# Seconds a response stays fresh, by endpoint prefix. These feeds change at
+# most every few seconds, so repeat polls and overlapping scans reuse them
+CACHE_TTL_SECONDS = {
+    "/token-boosts/": 10,
+    "/token-profiles/": 30,
+    "/latest/dex/search": 5,
+    "/tokens/": 5,
+    "/pairs/": 5,
+}
+CACHE_MAX_ENTRIES = 256
+
+# Raw response bodies by (endpoint, params), shared by every client in the
+# process. Bodies are re-parsed per call since callers annotate pairs
+_response_cache: dict[tuple, tuple[float, bytes]] = {}
+
+
+def clear_response_cache() -> None:
+    """Drop every cached DexScreener response."""
+    _response_cache.clear()
+
 
 class DexScreenerClient:
     """
@@ -31,8 +51,20 @@ class DexScreenerClient:
 
     BASE_URL = "https://api.dexscreener.com"
 
-    def __init__(self) -> None:
+    def __init__(self, keep_alive: bool = False) -> None:
+        """
+        Initialize DexScreener client.
+
+        Args:
+            keep_alive: Reuse one pooled session across requests instead of
+                opening a new connection per request. The caller must then
+                await close() when done.
+        """
         self.logger = Utils.setup_logger("DexScreenerClient")
+        self.keep_alive = keep_alive
+        self._session: aiohttp.ClientSession | None = None
+        self._session_loop: asyncio.AbstractEventLoop | None = None
+        self._inflight: dict[tuple, asyncio.Future] = {}
 
     def _get_version(self) -> str:
         """Get package version for User-Agent."""
@@ -43,30 +75,89 @@ class DexScreenerClient:
         except Exception:
             return "unknown"
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the pooled keep-alive session, (re)creating it when needed."""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=10, keepalive_timeout=75)
+            )
+            self._session_loop = loop
+        return self._session
+
+    async def close(self) -> None:
+        """Close the pooled session (only used with keep_alive=True)."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
     async def _request(
         self, endpoint: str, params: dict | None = None, timeout: int = 15
     ) -> dict[str, Any]:
-        """Make API request."""
+        """Make API request, reusing a fresh cached response when there is one."""
+        key = (endpoint, tuple(sorted((params or {}).items())))
+        ttl = next((t for p, t in CACHE_TTL_SECONDS.items() if endpoint.startswith(p)), 0)
+
+        cached = _response_cache.get(key)
+        if cached and time.monotonic() - cached[0] < ttl:
+            self.logger.debug(f"[_request] Cache hit {endpoint}")
+            body = cached[1]
+        else:
+            # Concurrent callers asking for the same thing share one request
+            pending = self._inflight.get(key)
+            if pending is None:
+                pending = asyncio.ensure_future(self._fetch(endpoint, params, timeout, key, ttl))
+                self._inflight[key] = pending
+                pending.add_done_callback(lambda _: self._inflight.pop(key, None))
+            body = await asyncio.shield(pending)
+
+        if body is None:
+            return {}
+        try:
+            return Utils.loads(body)
+        except ValueError as e:
+            self.logger.error(f"[_request] Bad JSON: {e}")
+            return {}
+
+    async def _fetch(
+        self, endpoint: str, params: dict | None, timeout: int, key: tuple, ttl: float
+    ) -> bytes | None:
+        """GET an endpoint; returns the raw body (cached when ttl > 0), or None on error."""
         url = f"{self.BASE_URL}{endpoint}"
         self.logger.debug(f"[_request] GET {url}")
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    params=params,
-                    timeout=aiohttp.ClientTimeout(total=timeout),
-                    headers={"User-Agent": f"SlopeSniper/{self._get_version()}"},
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        return data
-                    else:
-                        self.logger.warning(f"[_request] Status {resp.status}")
-                        return {}
+            if self.keep_alive:
+                body = await self._send(await self._get_session(), url, params, timeout)
+            else:
+                async with aiohttp.ClientSession() as session:
+                    body = await self._send(session, url, params, timeout)
         except Exception as e:
             self.logger.error(f"[_request] Error: {e}")
-            return {}
+            return None
+
+        if body is not None and ttl:
+            _response_cache.pop(key, None)
+            if len(_response_cache) >= CACHE_MAX_ENTRIES:
+                _response_cache.pop(next(iter(_response_cache)))  # Oldest entry
+            _response_cache[key] = (time.monotonic(), body)
+        return body
+
+    async def _send(
+        self, session: aiohttp.ClientSession, url: str, params: dict | None, timeout: int
+    ) -> bytes | None:
+        """Send one GET on the given session; returns the body, or None on error status."""
+        async with session.get(
+            url,
+            params=params,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+            headers={"User-Agent": f"SlopeSniper/{self._get_version()}"},
+        ) as resp:
+            if resp.status == 200:
+                return await resp.read()
+            else:
+                self.logger.warning(f"[_request] Status {resp.status}")
+                return None
 
     async def get_token_profiles(self, chain: str = "solana") -> list[dict]:
         """
@@ -176,12 +267,10 @@ class DexScreenerClient:
 
         # Search for recent popular terms to find new pairs
         queries = ["pump", "pepe", "trump", "ai", "meme", "doge", "cat"]
-        all_pairs = []
 
-        for query in queries[:3]:  # Limit queries to avoid rate limits
-            pairs = await self.search_pairs(query)
-            all_pairs.extend(pairs)
-            await asyncio.sleep(0.2)  # Be nice to the API
+        # Limit queries to avoid rate limits; the few that run go out concurrently
+        results = await asyncio.gather(*(self.search_pairs(q) for q in queries[:3]))
+        all_pairs = [pair for pairs in results for pair in pairs]
 
         # Deduplicate by pair address
         seen = set()
@@ -193,7 +282,7 @@ class DexScreenerClient:
                 unique_pairs.append(pair)
 
         # Filter by liquidity and age
-        now = datetime.now()
+        now_ms = time.time() * 1000
         filtered = []
         for pair in unique_pairs:
             try:
@@ -204,8 +293,7 @@ class DexScreenerClient:
                 # Check age
                 created_at = pair.get("pairCreatedAt")
                 if created_at:
-                    created = datetime.fromtimestamp(created_at / 1000)
-                    age_hours = (now - created).total_seconds() / 3600
+                    age_hours = (now_ms - created_at) / 3_600_000
                     if age_hours > max_age_hours:
                         continue
                     pair["_age_hours"] = round(age_hours, 1)
@@ -234,9 +322,7 @@ class DexScreenerClient:
         # Get boosted tokens (active marketing)
         boosted = await self.get_boosted_tokens()
 
-        # Get pairs from boosted tokens
-        trending = []
-        for token in boosted[:10]:
+        async def best_boosted_pair(token: dict) -> dict | None:
             try:
                 token_addr = token.get("tokenAddress")
                 if token_addr:
@@ -246,11 +332,14 @@ class DexScreenerClient:
                         best_pair = pairs[0]
                         best_pair["_boosted"] = True
                         best_pair["_boost_amount"] = token.get("amount", 0)
-                        trending.append(best_pair)
-                    await asyncio.sleep(0.1)
+                        return best_pair
             except Exception as e:
                 self.logger.debug(f"[get_trending] Error processing token: {e}")
-                continue
+            return None
+
+        # Get pairs from boosted tokens, all lookups in flight at once
+        results = await asyncio.gather(*(best_boosted_pair(t) for t in boosted[:10]))
+        trending = [pair for pair in results if pair is not None]
 
         # Sort by volume
         trending.sort(key=lambda p: float(p.get("volume", {}).get("h24", 0)), reverse=True)
@@ -271,14 +360,13 @@ class DexScreenerClient:
         created_at = pair.get("pairCreatedAt")
         if created_at:
             try:
-                created = datetime.fromtimestamp(created_at / 1000)
-                age = datetime.now() - created
-                if age.days > 0:
-                    age_str = f"{age.days}d"
-                elif age.seconds > 3600:
-                    age_str = f"{age.seconds // 3600}h"
+                age_s = max(0, int(time.time() - created_at / 1000))
+                if age_s >= 86400:
+                    age_str = f"{age_s // 86400}d"
+                elif age_s > 3600:
+                    age_str = f"{age_s // 3600}h"
                 else:
-                    age_str = f"{age.seconds // 60}m"
+                    age_str = f"{age_s // 60}m"
             except Exception:
                 pass
 
@@ -31,16 +31,31 @@ class JupiterDataClient:
     BASE_URL_PRICE = "https://api.jup.ag/price/v3"
     BASE_URL_TOKENS = "https://api.jup.ag/tokens/v2"
 
-    def __init__(self, api_key: str | None = None, max_retries: int = 3) -> None:
+    # Bundled key fetched from GitHub, shared by every instance in the process
+    _bundled_key: str | None = None
+
+    def __init__(
+        self, api_key: str | None = None, max_retries: int = 3, keep_alive: bool = False
+    ) -> None:
         """
         Initialize Jupiter Data Client.
 
         Args:
             api_key: Optional Jupiter API key for higher rate limits
             max_retries: Maximum number of retry attempts for failed requests
+            keep_alive: Reuse one pooled session across requests instead of
+                opening a new connection per request. The caller must then
+                await close() when done.
         """
         self.logger = Utils.setup_logger("JupiterDataClient")
         self.max_retries = max_retries
+        self.keep_alive = keep_alive
+        self._session: aiohttp.ClientSession | None = None
+        self._session_loop: asyncio.AbstractEventLoop | None = None
+        # get_price() callers waiting on the next batched get_prices() call
+        self._pending_prices: dict[str, list[asyncio.Future]] = {}
+        # Strong reference to the running flush; the loop only keeps a weak one
+        self._price_flush: asyncio.Task | None = None
 
         # Get API key: user override > env var > bundled default
         self.api_key = api_key or os.environ.get("JUPITER_API_KEY") or self._get_bundled_key()
@@ -56,9 +71,12 @@ class JupiterDataClient:
         """
         Get bundled Jupiter API key from remote config.
 
-        The key is fetched from GitHub and decoded at runtime.
-        No fallback key is embedded in code for security.
+        The key is fetched from GitHub and decoded at runtime, once per
+        process. No fallback key is embedded in code for security.
         """
+        if JupiterDataClient._bundled_key:
+            return JupiterDataClient._bundled_key
+
         config_url = os.environ.get(
             "SLOPESNIPER_CONFIG_URL",
             "https://raw.githubusercontent.com/BAGWATCHER/SlopeSniper/main/config/jup.json",
@@ -82,11 +100,13 @@ class JupiterDataClient:
                     key = self._decode_v1(data["k"])
                     if key:
                         self.logger.debug("[_get_bundled_key] Fetched key from config (v1)")
+                        JupiterDataClient._bundled_key = key
                         return key
 
                 # Legacy format (plain key) - for backwards compatibility
                 if data.get("key"):
                     self.logger.debug("[_get_bundled_key] Fetched key (legacy format)")
+                    JupiterDataClient._bundled_key = data["key"]
                     return data["key"]
 
         except Exception as e:
@@ -116,6 +136,22 @@ class JupiterDataClient:
         except Exception:
             return ""
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the pooled keep-alive session, (re)creating it when needed."""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=10, keepalive_timeout=75)
+            )
+            self._session_loop = loop
+        return self._session
+
+    async def close(self) -> None:
+        """Close the pooled session (only used with keep_alive=True)."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
     async def _make_request(
         self,
         url: str,
@@ -127,33 +163,13 @@ class JupiterDataClient:
 
         for attempt in range(self.max_retries):
             try:
-                async with aiohttp.ClientSession() as session:
-                    # Build headers with API key if available
-                    headers = {"Content-Type": "application/json"}
-                    if self.api_key:
-                        headers["x-api-key"] = self.api_key
-
-                    if method == "GET":
-                        timeout = aiohttp.ClientTimeout(total=10)
-                        async with session.get(
-                            url, params=params, timeout=timeout, headers=headers
-                        ) as response:
-                            response_text = await response.text()
-
-                            if response.status == 200:
-                                data = await response.json()
-                                self.logger.debug(
-                                    f"[_make_request] SUCCESS on attempt {attempt + 1}"
-                                )
-                                return data
-                            else:
-                                self.logger.warning(
-                                    f"[_make_request] Attempt {attempt + 1}/{self.max_retries} "
-                                    f"failed: status={response.status}"
-                                )
-
-                                if response.status == 400:
-                                    raise ValueError(f"Bad request (400): {response_text}")
+                if self.keep_alive:
+                    data = await self._send(await self._get_session(), url, params, method, attempt)
+                else:
+                    async with aiohttp.ClientSession() as session:
+                        data = await self._send(session, url, params, method, attempt)
+                if data is not None:
+                    return data
 
             except asyncio.TimeoutError:
                 self.logger.warning(
@@ -173,6 +189,41 @@ class JupiterDataClient:
 
         raise RuntimeError(f"Failed after {self.max_retries} attempts")
 
+    async def _send(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        params: dict[str, Any] | None,
+        method: str,
+        attempt: int,
+    ) -> dict[str, Any] | None:
+        """Send one request attempt; returns the JSON body, or None to retry."""
+        # Build headers with API key if available
+        headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            headers["x-api-key"] = self.api_key
+
+        if method == "GET":
+            timeout = aiohttp.ClientTimeout(total=10)
+            async with session.get(
+                url, params=params, timeout=timeout, headers=headers
+            ) as response:
+                body = await response.read()
+
+                if response.status == 200:
+                    data = Utils.loads(body)
+                    self.logger.debug(f"[_make_request] SUCCESS on attempt {attempt + 1}")
+                    return data
+                else:
+                    self.logger.warning(
+                        f"[_make_request] Attempt {attempt + 1}/{self.max_retries} "
+                        f"failed: status={response.status}"
+                    )
+
+                    if response.status == 400:
+                        raise ValueError(f"Bad request (400): {body.decode(errors='replace')}")
+        return None
+
     async def get_prices(self, mint_addresses: list[str]) -> dict[str, dict[str, Any]]:
         """
         Get USD prices for one or more tokens.
@@ -215,10 +266,17 @@ class JupiterDataClient:
         self.logger.info(f"[get_price] Fetching price for {mint_address}")
 
         try:
-            prices = await self.get_prices([mint_address])
-
-            if mint_address in prices:
-                price_data = prices[mint_address]
+            # Queue the mint; the flush task runs after every caller already
+            # scheduled in this loop iteration has queued its own
+            pending = self._pending_prices
+            if not pending:
+                flush = self._price_flush = asyncio.ensure_future(self._flush_prices(pending))
+                flush.add_done_callback(lambda _: self._end_price_flush(pending))
+            future = asyncio.get_running_loop().create_future()
+            self._pending_prices.setdefault(mint_address, []).append(future)
+            price_data = await future
+
+            if price_data is not None:
                 self.logger.info(f"[get_price] SUCCESS: ${price_data.get('usdPrice', 0):.8f}")
                 return price_data
             else:
@@ -229,6 +287,43 @@ class JupiterDataClient:
             self.logger.error(f"[get_price] FAILED: {e}", exc_info=True)
             raise
 
+    async def _flush_prices(self, pending: dict[str, list[asyncio.Future]]) -> None:
+        """Resolve queued get_price() calls with one get_prices() call per 50 mints."""
+        self._pending_prices = {}  # Later callers start the next batch
+        mints = list(pending)
+
+        for i in range(0, len(mints), 50):
+            batch = mints[i : i + 50]
+            try:
+                prices = await self.get_prices(batch)
+                error = None
+            except Exception as e:
+                prices, error = {}, e
+
+            for mint in batch:
+                for future in pending[mint]:
+                    if future.done():
+                        continue  # Caller was cancelled
+                    if error is not None:
+                        future.set_exception(error)
+                    else:
+                        future.set_result(prices.get(mint))
+
+    def _end_price_flush(self, pending: dict[str, list[asyncio.Future]]) -> None:
+        """
+        Clean up after a flush, however it ended.
+
+        A flush cancelled before it started leaves its queue in place, and
+        one cancelled mid-batch leaves callers unanswered; either way they
+        are cancelled rather than left waiting forever.
+        """
+        if self._pending_prices is pending:
+            self._pending_prices = {}
+        for futures in pending.values():
+            for future in futures:
+                if not future.done():
+                    future.cancel()
+
     async def search_token(self, query: str) -> list[dict[str, Any]]:
         """
         Search for tokens by symbol, name, or mint address.
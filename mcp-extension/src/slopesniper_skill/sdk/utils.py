@@ -1,17 +1,24 @@
 """
 Utility functions for SlopeSniper SDK.
 
-Provides logging and validation helpers.
+Provides logging, JSON and validation helpers.
 """
 
 from __future__ import annotations
 
+import json
 import logging
 import os
 import re
 from pathlib import Path
+from typing import Any
 from urllib.parse import urlparse
 
+try:
+    import orjson
+except ImportError:  # Optional - falls back to stdlib json
+    orjson = None
+
 
 class Utils:
     """Utility class with static helper methods."""
@@ -76,6 +83,21 @@ class Utils:
         env_key = key.upper().replace("-", "_").replace(".", "_")
         return os.environ.get(env_key, default)
 
+    @staticmethod
+    def loads(data: bytes) -> Any:
+        """
+        Parse a JSON response body, with orjson when it is installed.
+
+        Args:
+            data: Raw response bytes
+
+        Returns:
+            Parsed JSON value
+        """
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+
     @staticmethod
     def is_valid_solana_address(address: str) -> bool:
         """
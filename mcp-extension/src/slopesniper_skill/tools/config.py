@@ -33,6 +33,9 @@ USER_CONFIG_FILE = SLOPESNIPER_DIR / "config.enc"
 # Maximum number of wallet backups to keep
 MAX_WALLET_BACKUPS = 10
 
+# Last (ciphertext, plaintext) pair read from USER_CONFIG_FILE
+_user_config_cache: tuple[bytes, str] | None = None
+
 
 @dataclass
 class PolicyConfig:
@@ -588,12 +591,21 @@ def load_user_config() -> dict | None:
     Returns:
         Dict with user settings or None if not found
     """
+    global _user_config_cache
+
     if not USER_CONFIG_FILE.exists():
         return None
 
     try:
         encrypted = USER_CONFIG_FILE.read_bytes()
-        decrypted = _decrypt_data(encrypted)
+        # Decrypting re-derives the machine key (100k PBKDF2 rounds), and a
+        # single command can load the config several times - only do it
+        # again when the file contents have changed
+        if _user_config_cache is not None and _user_config_cache[0] == encrypted:
+            decrypted = _user_config_cache[1]
+        else:
+            decrypted = _decrypt_data(encrypted)
+            _user_config_cache = (encrypted, decrypted)
         return json.loads(decrypted)
     except Exception:
         return None
@@ -99,7 +99,8 @@ async def scan_opportunities(
     Returns:
         List of opportunities with recommendations
     """
-    dex = DexScreenerClient()
+    # One scan fans out to a dozen or more DexScreener requests - pool them
+    dex = DexScreenerClient(keep_alive=True)
     pump = PumpFunClient()
     rugcheck = RugCheckClient()
 
@@ -145,6 +146,8 @@ async def scan_opportunities(
 
     except Exception as e:
         return [{"error": f"Scan failed: {str(e)}"}]
+    finally:
+        await dex.close()
 
     # Convert to dicts
     return [_format_opportunity(o) for o in opportunities[:limit]]
@@ -201,7 +204,7 @@ async def scan_new_pairs(
     Returns:
         List of new pairs with details
     """
-    dex = DexScreenerClient()
+    dex = DexScreenerClient(keep_alive=True)
 
     try:
         pairs = await dex.get_new_pairs(
@@ -217,6 +220,8 @@ async def scan_new_pairs(
 
     except Exception as e:
         return [{"error": f"New pairs scan failed: {str(e)}"}]
+    finally:
+        await dex.close()
 
 
 async def get_token_details(mint_or_symbol: str) -> dict:
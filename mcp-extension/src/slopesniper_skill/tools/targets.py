@@ -7,6 +7,7 @@ when conditions are met (market cap, price, percentage gain, trailing stop).
 
 from __future__ import annotations
 
+import asyncio
 import sqlite3
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -482,6 +483,51 @@ def update_trailing_peak(target_id: int, current_price: float) -> None:
     conn.close()
 
 
+def apply_target_updates(
+    peaks: list[tuple[int, float]],
+    triggers: list[tuple[int, float]],
+) -> None:
+    """
+    Write a batch of peak updates and trigger marks in one transaction.
+
+    Same updates as update_trailing_peak and mark_target_triggered, for
+    callers checking many targets at once.
+
+    Args:
+        peaks: (target_id, current_price) pairs for trailing stops
+        triggers: (target_id, trigger_price) pairs for triggered targets
+    """
+    now = datetime.now(timezone.utc).isoformat()
+
+    db_path = _get_config_db_path()
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    cursor.executemany(
+        """
+        UPDATE targets SET
+            peak_value = MAX(COALESCE(peak_value, 0), ?),
+            updated_at = ?
+        WHERE id = ? AND target_type = 'trailing_stop'
+        """,
+        [(price, now, target_id) for target_id, price in peaks],
+    )
+    cursor.executemany(
+        """
+        UPDATE targets SET
+            status = 'triggered',
+            trigger_price = ?,
+            trigger_time = ?,
+            updated_at = ?
+        WHERE id = ?
+        """,
+        [(price, now, now, target_id) for target_id, price in triggers],
+    )
+
+    conn.commit()
+    conn.close()
+
+
 def check_target(
     target: SellTarget,
     current_price: float,
@@ -678,35 +724,45 @@ async def poll_targets_batch(
         for mint in mints:
             results[mint] = {"price_usd": 0, "mcap": None}
 
-    # Get token info for mcap (only for mcap targets)
-    mcap_mints = set(t.mint for t in targets if t.target_type == TargetType.MCAP)
+    # Get token info for mcap (only for mcap targets), all lookups at once
+    mcap_mints = list(set(t.mint for t in targets if t.target_type == TargetType.MCAP))
+    infos = await asyncio.gather(
+        *(client.get_token_info(mint) for mint in mcap_mints), return_exceptions=True
+    )
 
-    for mint in mcap_mints:
-        try:
-            info = await client.get_token_info(mint)
-            if info and mint in results:
-                results[mint]["mcap"] = info.get("mcap")
-        except Exception:
-            pass
+    for mint, info in zip(mcap_mints, infos):
+        if isinstance(info, Exception):
+            continue
+        if info and mint in results:
+            results[mint]["mcap"] = info.get("mcap")
 
     return results
 
 
+# Condition text per target type; only the row's own type gets formatted
+_CONDITION_FORMATS = {
+    "mcap": "mcap >= ${:,.0f}",
+    "price": "price >= ${:.8g}",
+    "pct_gain": "+{:.1f}%",
+    "trailing_stop": "-{:.1f}% from peak",
+}
+
+
 def format_target_for_display(target: SellTarget) -> dict[str, Any]:
     """Format a target for CLI display."""
-    type_desc = {
-        "mcap": f"mcap >= ${target.target_value:,.0f}",
-        "price": f"price >= ${target.target_value:.8g}",
-        "pct_gain": f"+{target.target_value:.1f}%",
-        "trailing_stop": f"-{target.target_value:.1f}% from peak",
-    }
+    target_type = target.target_type.value
+    condition_format = _CONDITION_FORMATS.get(target_type)
+    if condition_format is not None:
+        condition = condition_format.format(target.target_value)
+    else:
+        condition = str(target.target_value)
 
     result = {
         "id": target.id,
         "symbol": target.symbol or target.mint[:8],
         "mint": target.mint,
-        "type": target.target_type.value,
-        "condition": type_desc.get(target.target_type.value, str(target.target_value)),
+        "type": target_type,
+        "condition": condition,
         "sell": target.sell_amount,
         "status": target.status.value,
         "created": target.created_at.strftime("%Y-%m-%d %H:%M") if target.created_at else None,
@@ -0,0 +1,186 @@
+"""
+Shared helpers for the CLI, daemon and integrity modules.
+
+Standard library only, with the heavier imports deferred to the functions
+that need them, so importing this module stays cheap for CLI startup.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+
+def atomic_write(path: Path, data: bytes) -> None:
+    """
+    Write a file via temp file + rename, so readers never see partial data.
+
+    The temp file is unique to this call, so concurrent writers can't
+    clobber each other's, and mkstemp creates it readable by the owner only.
+    """
+    import tempfile
+
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
+
+
+# Keep-alive connections by (scheme, host). One contribution report can hit
+# raw.githubusercontent.com three times (manifest + config twice), and the
+# CLI's `update` fetches pyproject.toml then CHANGELOG.md, so later requests
+# skip the TCP/TLS handshake
+_http_connections: dict[tuple[str, str], Any] = {}
+
+# Unread bytes http_stream() drains from a response left unfinished, so its
+# connection can go back to the pool. Past this it's cheaper to reconnect
+HTTP_DRAIN_MAX_BYTES = 64 * 1024
+
+
+def _release_connection(key: tuple[str, str], conn: Any, resp: Any) -> None:
+    """Return a connection to the pool if its response was read to the end."""
+    if not resp.closed and not resp.isclosed():
+        try:
+            resp.read(HTTP_DRAIN_MAX_BYTES)
+        except Exception:
+            pass
+    # isclosed() means the body was read to the end; closed means the caller
+    # closed the response early, leaving unread bytes on the socket
+    if resp.isclosed() and not resp.closed and not resp.will_close:
+        _http_connections[key] = conn
+    else:
+        conn.close()
+
+
+@contextlib.contextmanager
+def http_stream(
+    url: str,
+    method: str = "GET",
+    headers: dict[str, str] | None = None,
+    data: bytes | None = None,
+    timeout: float = 5,
+    connect_timeout: float | None = None,
+    _redirects: int = 5,
+) -> Iterator[tuple[Any, Any]]:
+    """
+    Make an HTTP request over a pooled keep-alive connection.
+
+    Follows GET redirects, and falls back to urlopen when a proxy is
+    configured. The response is yielded unread, for callers that stop
+    reading early; on exit it is closed, or drained and its connection
+    pooled when little enough of it is left.
+
+    Args:
+        timeout: Socket timeout for the response
+        connect_timeout: Shorter timeout for opening a new connection, so an
+            unreachable host fails fast (defaults to timeout)
+
+    Yields:
+        Tuple of (response, response headers)
+
+    Raises:
+        urllib.error.HTTPError: Non-2xx response, as urlopen would
+    """
+    import http.client
+    import urllib.error
+    import urllib.request
+    from urllib.parse import urljoin, urlsplit
+
+    parts = urlsplit(url)
+    if urllib.request.getproxies() or parts.scheme not in ("http", "https"):
+        req = urllib.request.Request(url, data=data, headers=headers or {}, method=method)
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            yield resp, resp.headers
+        return
+
+    key = (parts.scheme, parts.netloc)
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+
+    while True:
+        conn = _http_connections.pop(key, None)
+        reused = conn is not None
+        if conn is None:
+            conn_cls = (
+                http.client.HTTPSConnection
+                if parts.scheme == "https"
+                else http.client.HTTPConnection
+            )
+            conn = conn_cls(parts.netloc, timeout=connect_timeout or timeout)
+
+        try:
+            if conn.sock is None:
+                conn.connect()
+            conn.sock.settimeout(timeout)
+            conn.request(method, path, body=data, headers=headers or {})
+            resp = conn.getresponse()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            conn.close()
+            # The server dropped the idle connection. Only a GET or HEAD is
+            # safe to resend on a fresh one: a POST may already have landed
+            if reused and method in ("GET", "HEAD"):
+                continue
+            raise
+        except Exception:
+            conn.close()
+            raise
+        break
+
+    if 200 <= resp.status < 300:
+        try:
+            yield resp, resp.headers
+        finally:
+            _release_connection(key, conn, resp)
+        return
+
+    try:
+        resp.read()
+    finally:
+        _release_connection(key, conn, resp)
+
+    location = resp.headers.get("Location")
+    if resp.status in (301, 302, 303, 307, 308) and location and method == "GET" and _redirects:
+        with http_stream(
+            urljoin(url, location),
+            method,
+            headers,
+            data,
+            timeout,
+            connect_timeout,
+            _redirects - 1,
+        ) as result:
+            yield result
+        return
+    raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, None)
+
+
+def http_request(
+    url: str,
+    method: str = "GET",
+    headers: dict[str, str] | None = None,
+    data: bytes | None = None,
+    timeout: float = 5,
+    connect_timeout: float | None = None,
+) -> tuple[bytes, Any]:
+    """
+    Make an HTTP request and read the whole response.
+
+    Same connection pooling, redirects and proxy fallback as http_stream().
+
+    Returns:
+        Tuple of (response body, response headers)
+
+    Raises:
+        urllib.error.HTTPError: Non-2xx response, as urlopen would
+    """
+    with http_stream(url, method, headers, data, timeout, connect_timeout) as (resp, resp_headers):
+        return resp.read(), resp_headers
@@ -0,0 +1,208 @@
+"""Tests for the CLI helpers."""
+
+import asyncio
+import io
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from slopesniper_skill import cli, tools
+
+SOL_MINT = "So11111111111111111111111111111111111111112"
+
+PAYLOAD = {"status": "ok", "checked_at": datetime(2026, 1, 2, 3, 4, 5), "tokens": ["SOL"]}
+EXPECTED = json.dumps(PAYLOAD, indent=2, default=str) + "\n"
+
+
+class TestPrintJson:
+    """Tests for writing print_json output to stdout."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_written_to_fd_in_order_with_print(
+        self, use_orjson: bool, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        if not use_orjson:
+            monkeypatch.setattr(cli, "orjson", None)
+        path = tmp_path / "stdout.txt"
+        with open(path, "w") as stdout:
+            monkeypatch.setattr(sys, "stdout", stdout)
+            print("before")
+            cli.print_json(PAYLOAD)
+            print("after")
+        assert path.read_text() == "before\n" + EXPECTED + "after\n"
+
+    def test_partial_fd_writes_completed(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        write = os.write
+        monkeypatch.setattr(os, "write", lambda fd, data: write(fd, data[:7]))
+        path = tmp_path / "stdout.txt"
+        with open(path, "w") as stdout:
+            monkeypatch.setattr(sys, "stdout", stdout)
+            cli.print_json(PAYLOAD)
+        assert path.read_text() == EXPECTED
+
+    def test_stream_without_fd(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        stdout = io.TextIOWrapper(io.BytesIO())
+        monkeypatch.setattr(sys, "stdout", stdout)
+        cli.print_json(PAYLOAD)
+        assert stdout.buffer.getvalue().decode() == EXPECTED
+
+    def test_text_only_stream(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        stdout = io.StringIO()
+        monkeypatch.setattr(sys, "stdout", stdout)
+        cli.print_json(PAYLOAD)
+        assert stdout.getvalue() == EXPECTED
+
+
+class ChunkedBody(io.BytesIO):
+    """In-memory body that records how much of it was read."""
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = super().read(size)
+        self.bytes_read = self.tell()
+        return chunk
+
+
+class TestScanVersion:
+    """Tests for finding the version line in pyproject.toml."""
+
+    def test_version_after_project_header(self) -> None:
+        data = b'[project]\nname = "slopesniper-mcp"\nversion = "0.3.41"\n'
+        assert cli._scan_version(data) == "0.3.41"
+
+    def test_version_on_first_line(self) -> None:
+        assert cli._scan_version(b'version = "1.2.3"\n') == "1.2.3"
+
+    def test_other_version_keys_ignored(self) -> None:
+        data = b'target-version = "py310"\nminimum_version = "1"\nversion = "2.0.0"\n'
+        assert cli._scan_version(data) == "2.0.0"
+
+    def test_unterminated_value(self) -> None:
+        assert cli._scan_version(b'[project]\nversion = "0.3') is None
+
+    def test_no_version(self) -> None:
+        assert cli._scan_version(b'[project]\nname = "x"\n') is None
+
+
+class TestReadVersion:
+    """Tests for reading the version from a streamed pyproject.toml."""
+
+    def test_stops_reading_after_version(self) -> None:
+        body = ChunkedBody(b'[project]\nversion = "0.3.41"\n' + b"# padding\n" * 1000)
+        assert cli._read_version(body) == "0.3.41"
+        assert body.bytes_read < 1024
+
+    def test_version_split_across_chunks(self) -> None:
+        data = b"#" * 505 + b'\nversion = "9.9.9"\n'
+        assert cli._read_version(ChunkedBody(data)) == "9.9.9"
+
+    def test_gives_up_after_size_cap(self) -> None:
+        body = ChunkedBody(b"# padding\n" * 5000 + b'version = "1.0.0"\n')
+        assert cli._read_version(body) is None
+        assert body.bytes_read == cli.VERSION_SCAN_MAX_BYTES
+
+
+class FakeJupiter:
+    """Stands in for the shared JupiterDataClient."""
+
+    async def get_prices(self, mints: list[str]) -> dict:
+        return {m: {"usdPrice": 2.0} for m in mints}
+
+    async def get_token_info(self, mint: str) -> dict:
+        return {"circSupply": 1000}
+
+
+@pytest.fixture
+def searches(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> list[str]:
+    """Empty resolver cache and fake lookups; records each symbol search."""
+    monkeypatch.setattr(cli, "RESOLVER_CACHE_FILE", tmp_path / "resolver_cache.json")
+    monkeypatch.setattr(cli, "_resolver_cache", None)
+    monkeypatch.setattr(cli, "_token_info_cache", {})
+    monkeypatch.setattr(cli, "_jupiter_client", FakeJupiter)
+    searches: list[str] = []
+
+    async def resolve(token: str) -> dict:
+        searches.append(token)
+        return {"mint": SOL_MINT, "symbol": "SOL"} if token.upper() == "SOL" else {}
+
+    monkeypatch.setattr(tools, "solana_resolve_token", resolve)
+    return searches
+
+
+class TestResolveToken:
+    """Tests for resolving tokens through the on-disk resolver cache."""
+
+    def test_resolves_mint_price_and_mcap(self, searches: list[str]) -> None:
+        assert asyncio.run(cli._resolve_token("sol")) == {
+            "mint": SOL_MINT,
+            "symbol": "SOL",
+            "price_usd": 2.0,
+            "mcap": 2000.0,
+        }
+
+    def test_repeat_lookup_skips_search(self, searches: list[str]) -> None:
+        asyncio.run(cli._resolve_token("sol"))
+        asyncio.run(cli._resolve_token("SOL"))
+        assert searches == ["sol"]
+
+    def test_cache_file_read_by_next_process(self, searches: list[str]) -> None:
+        asyncio.run(cli._resolve_token("sol"))
+        assert json.loads(cli.RESOLVER_CACHE_FILE.read_text())["SOL"]["mint"] == SOL_MINT
+
+        # A fresh CLI process starts with nothing loaded
+        cli._resolver_cache = None
+        assert asyncio.run(cli._resolve_token("sol"))["mint"] == SOL_MINT
+        assert searches == ["sol"]
+
+    def test_expired_entry_searched_again(self, searches: list[str]) -> None:
+        stale = time.time() - cli.RESOLVER_CACHE_TTL_SECONDS - 1
+        cli.RESOLVER_CACHE_FILE.write_text(
+            json.dumps({"SOL": {"mint": "old", "symbol": "SOL", "at": stale}})
+        )
+        assert asyncio.run(cli._resolve_token("sol"))["mint"] == SOL_MINT
+        assert searches == ["sol"]
+
+    def test_unknown_token_not_cached(self, searches: list[str]) -> None:
+        assert asyncio.run(cli._resolve_token("nope")) == {}
+        assert asyncio.run(cli._resolve_token("nope")) == {}
+        assert searches == ["nope", "nope"]
+        assert not cli.RESOLVER_CACHE_FILE.exists()
+
+
+class TestTargetOptions:
+    """Tests for parsing `target add` and `watch` arguments."""
+
+    def test_parses_condition_and_sell(self) -> None:
+        opts = cli._target_options(["BONK", "--mcap", "5e6", "--sell", "50%", "--unknown"])
+        assert (opts.token, opts.mcap, opts.sell) == ("BONK", 5e6, "50%")
+
+    @pytest.mark.parametrize(
+        "argv, error",
+        [
+            (["watch", "--mcap", "5"], "the following arguments are required: token"),
+            (["target", "add", "--mcap", "5"], "the following arguments are required: token"),
+            (["watch", "BONK", "--mcap", "big"], "argument --mcap: invalid float value: 'big'"),
+            (["target", "add", "BONK", "--price"], "argument --price: expected one argument"),
+        ],
+    )
+    def test_errors_reported_as_json(
+        self,
+        argv: list[str],
+        error: str,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        monkeypatch.setattr("sys.argv", ["slopesniper", *argv])
+        with pytest.raises(SystemExit) as exc_info:
+            cli.main()
+
+        out, err = capsys.readouterr()
+        assert exc_info.value.code == 1
+        assert json.loads(out) == {"error": error}
+        assert err == ""
@@ -0,0 +1,282 @@
+"""Tests for the target daemon."""
+
+import asyncio
+import logging
+import os
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from slopesniper_skill import daemon
+from slopesniper_skill.tools import targets
+from slopesniper_skill.tools.targets import SellTarget, TargetStatus, TargetType
+
+
+def make_target(target_id: int, **kwargs) -> SellTarget:
+    """Build a pending price target, overridable per field."""
+    fields = dict(
+        id=target_id,
+        mint=f"mint{target_id}",
+        symbol=f"TOK{target_id}",
+        target_type=TargetType.PRICE,
+        target_value=2.0,
+        sell_amount="all",
+        status=TargetStatus.PENDING,
+        entry_price=1.0,
+        entry_mcap=None,
+        peak_value=None,
+        trigger_price=None,
+        trigger_time=None,
+        execution_signature=None,
+        created_at=datetime.now(timezone.utc),
+        notes=None,
+    )
+    fields.update(kwargs)
+    return SellTarget(**fields)
+
+
+class FakeTargetsDB:
+    """Stands in for the targets table behind the daemon's cache."""
+
+    def __init__(self, rows: list[dict]) -> None:
+        self.rows = rows
+        self.loads = 0
+        self.updates: list[tuple] = []
+        self.sells: list[tuple[int, float]] = []
+        self.fail_updates = False
+        self.prices: dict[str, float] = {}
+
+    def get_active_targets(self) -> list[SellTarget]:
+        # Fresh objects per load, as rows read from SQLite would be
+        self.loads += 1
+        return [make_target(**row) for row in self.rows]
+
+    def apply_target_updates(self, peaks: list, triggers: list) -> None:
+        if self.fail_updates:
+            raise RuntimeError("database is locked")
+        self.updates.append((peaks, triggers))
+
+    async def poll_targets_batch(self, active: list[SellTarget]) -> dict:
+        return {t.mint: {"price_usd": self.prices.get(t.mint, 1.0)} for t in active}
+
+    async def execute_target_sell(self, target: SellTarget, price: float) -> dict:
+        self.sells.append((target.id, price))
+        return {"success": True}
+
+
+@pytest.fixture
+def db(monkeypatch: pytest.MonkeyPatch) -> FakeTargetsDB:
+    db = FakeTargetsDB(
+        [
+            {"target_id": 1},
+            {"target_id": 2, "target_type": TargetType.TRAILING_STOP, "target_value": 10.0},
+        ]
+    )
+    for name in (
+        "get_active_targets",
+        "apply_target_updates",
+        "poll_targets_batch",
+        "execute_target_sell",
+    ):
+        monkeypatch.setattr(targets, name, getattr(db, name))
+    return db
+
+
+@pytest.fixture
+def target_daemon(monkeypatch: pytest.MonkeyPatch, db: FakeTargetsDB) -> daemon.SlopeSniperDaemon:
+    """Daemon with a console-only logger and a config.db mtime the test controls."""
+    monkeypatch.setattr(daemon, "_setup_logger", lambda: logging.getLogger("test_daemon"))
+    d = daemon.SlopeSniperDaemon()
+    d.db_mtime = 1
+    monkeypatch.setattr(d, "_db_mtime", lambda: d.db_mtime)
+    return d
+
+
+class TestTargetCache:
+    """Tests for the daemon's in-memory active target cache."""
+
+    def test_targets_loaded_once_within_ttl(
+        self, target_daemon: daemon.SlopeSniperDaemon, db: FakeTargetsDB
+    ) -> None:
+        async def run() -> None:
+            for _ in range(3):
+                await target_daemon._active_targets()
+
+        asyncio.run(run())
+        assert db.loads == 1
+
+    def test_reload_when_db_changes(
+        self, target_daemon: daemon.SlopeSniperDaemon, db: FakeTargetsDB
+    ) -> None:
+        asyncio.run(target_daemon._active_targets())
+        target_daemon.db_mtime = 2
+        asyncio.run(target_daemon._active_targets())
+        assert db.loads == 2
+
+    def test_reload_after_ttl(
+        self, target_daemon: daemon.SlopeSniperDaemon, db: FakeTargetsDB
+    ) -> None:
+        asyncio.run(target_daemon._active_targets())
+        target_daemon._targets_loaded_at -= daemon.TARGETS_CACHE_TTL_SECONDS
+        asyncio.run(target_daemon._active_targets())
+        assert db.loads == 2
+
+    def test_cycle_updates_cache_without_reload(
+        self, target_daemon: daemon.SlopeSniperDaemon, db: FakeTargetsDB
+    ) -> None:
+        db.prices = {"mint1": 2.5, "mint2": 1.5}
+        asyncio.run(target_daemon._check_cycle())
+
+        # Target 1 triggered and sold; target 2's new peak was recorded
+        assert db.sells == [(1, 2.5)]
+        assert db.updates == [([(2, 1.5)], [(1, 2.5)])]
+        assert list(target_daemon._targets_cache) == [2]
+        assert target_daemon._targets_cache[2].peak_value == 1.5
+
+        # The daemon's own writes don't force a reload
+        asyncio.run(target_daemon._check_cycle())
+        assert db.loads == 1
+
+    def test_failed_write_reloads_targets(
+        self, target_daemon: daemon.SlopeSniperDaemon, db: FakeTargetsDB
+    ) -> None:
+        db.prices = {"mint1": 2.5, "mint2": 1.5}
+        db.fail_updates = True
+        with pytest.raises(RuntimeError):
+            asyncio.run(target_daemon._check_cycle())
+        assert db.sells == []
+
+        # Nothing was written, so the next cycle reloads both targets from
+        # the DB and evaluates them again
+        db.fail_updates = False
+        asyncio.run(target_daemon._check_cycle())
+        assert db.loads == 2
+        assert db.sells == [(1, 2.5)]
+        assert db.updates == [([(2, 1.5)], [(1, 2.5)])]
+
+
+class TestTail:
+    """Tests for reading the last lines of the daemon log."""
+
+    def write_lines(self, path: Path, count: int, width: int = 0) -> list[str]:
+        lines = [f"line {i}".ljust(width, "x") for i in range(count)]
+        path.write_text("\n".join(lines) + "\n")
+        return lines
+
+    def test_last_lines_across_blocks(self, tmp_path: Path) -> None:
+        log = tmp_path / "daemon.log"
+        lines = self.write_lines(log, 1000)
+        assert daemon._tail(log, 10, chunk=64) == lines[-10:]
+
+    def test_fewer_lines_than_requested(self, tmp_path: Path) -> None:
+        log = tmp_path / "daemon.log"
+        lines = self.write_lines(log, 3)
+        assert daemon._tail(log, 50) == lines
+
+    def test_lines_longer_than_block(self, tmp_path: Path) -> None:
+        log = tmp_path / "daemon.log"
+        lines = self.write_lines(log, 20, width=300)
+        assert daemon._tail(log, 5, chunk=64) == lines[-5:]
+
+    def test_no_trailing_newline(self, tmp_path: Path) -> None:
+        log = tmp_path / "daemon.log"
+        log.write_text("first\nsecond\nthird")
+        assert daemon._tail(log, 2, chunk=4) == ["second", "third"]
+
+    def test_undecodable_bytes_replaced(self, tmp_path: Path) -> None:
+        log = tmp_path / "daemon.log"
+        log.write_bytes(b"ok\n\xff\xfe\n")
+        assert daemon._tail(log, 2) == ["ok", "\ufffd\ufffd"]
+
+
+class TestWakeDaemon:
+    """Tests for signalling the daemon to check targets early."""
+
+    @pytest.fixture(autouse=True)
+    def state_files(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        monkeypatch.setattr(daemon, "PID_FILE", tmp_path / "daemon.pid")
+        monkeypatch.setattr(daemon, "WAKE_FILE", tmp_path / "daemon.wake")
+
+    def test_no_pid_file(self) -> None:
+        assert daemon.wake_daemon() is False
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="no SIGUSR1")
+    def test_stale_pid_not_signalled_and_cleaned_up(self) -> None:
+        proc = subprocess.Popen([sys.executable, "-c", "pass"])
+        proc.wait()
+        daemon.PID_FILE.write_text(str(proc.pid))
+        daemon.WAKE_FILE.write_text(str(proc.pid))
+
+        assert daemon.wake_daemon() is False
+        assert not daemon.PID_FILE.exists()
+        assert not daemon.WAKE_FILE.exists()
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="no SIGUSR1")
+    def test_daemon_without_wake_file_not_signalled(self) -> None:
+        # A live process that never registered the SIGUSR1 handler
+        proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        try:
+            daemon.PID_FILE.write_text(str(proc.pid))
+            assert daemon.wake_daemon() is False
+            assert proc.poll() is None
+        finally:
+            proc.kill()
+            proc.wait()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="no flock")
+class TestDaemonLock:
+    """Tests for the lock that keeps a second daemon from starting."""
+
+    @pytest.fixture(autouse=True)
+    def state_files(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        monkeypatch.setattr(daemon, "SLOPESNIPER_DIR", tmp_path)
+        monkeypatch.setattr(daemon, "PID_FILE", tmp_path / "daemon.pid")
+        monkeypatch.setattr(daemon, "WAKE_FILE", tmp_path / "daemon.wake")
+        monkeypatch.setattr(daemon, "LOCK_FILE", tmp_path / "daemon.lock")
+
+    def test_lock_is_exclusive(self) -> None:
+        fd = daemon._acquire_daemon_lock()
+        assert fd is not None
+        try:
+            assert daemon._acquire_daemon_lock() is None
+        finally:
+            os.close(fd)
+
+        fd = daemon._acquire_daemon_lock()
+        assert fd is not None
+        os.close(fd)
+
+    def test_run_foreground_refused_while_locked(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        def start(poll_interval: int) -> None:
+            raise AssertionError("second daemon started")
+
+        monkeypatch.setattr(daemon, "SlopeSniperDaemon", start)
+        fd = daemon._acquire_daemon_lock()
+        try:
+            result = daemon.run_foreground()
+        finally:
+            os.close(fd)
+
+        assert result["error"] == "Daemon already running"
+        assert not daemon.PID_FILE.exists()
+
+    def test_run_foreground_releases_lock(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        class StubDaemon:
+            def __init__(self, poll_interval: int) -> None:
+                self.logger = logging.Logger("stub_daemon")
+
+            async def run(self) -> None:
+                assert daemon.PID_FILE.read_text() == str(os.getpid())
+                assert daemon._acquire_daemon_lock() is None
+
+        monkeypatch.setattr(daemon, "SlopeSniperDaemon", StubDaemon)
+        assert daemon.run_foreground()["success"] is True
+
+        assert not daemon.PID_FILE.exists()
+        fd = daemon._acquire_daemon_lock()
+        assert fd is not None
+        os.close(fd)
@@ -0,0 +1,135 @@
+"""Tests for DexScreener response caching and request sharing."""
+
+import asyncio
+from collections.abc import Iterator
+
+import pytest
+
+from slopesniper_skill.sdk import dexscreener_client
+from slopesniper_skill.sdk.dexscreener_client import DexScreenerClient
+
+
+@pytest.fixture
+def client(monkeypatch: pytest.MonkeyPatch) -> Iterator[DexScreenerClient]:
+    """Client with an empty response cache and a fake transport counting sends."""
+    dexscreener_client.clear_response_cache()
+    client = DexScreenerClient()
+    client.sends = []
+    client.body = b'{"pairs": []}'
+
+    async def send(session, url: str, params: dict | None, timeout: int) -> bytes | None:
+        client.sends.append((url, params))
+        await asyncio.sleep(0.01)
+        return client.body
+
+    monkeypatch.setattr(client, "_send", send)
+    yield client
+    dexscreener_client.clear_response_cache()
+
+
+class TestResponseCache:
+    """Tests for the per-endpoint TTL cache."""
+
+    def test_repeat_request_within_ttl_is_cached(self, client: DexScreenerClient) -> None:
+        async def run() -> list:
+            return [await client._request("/tokens/v1/solana/abc") for _ in range(3)]
+
+        results = asyncio.run(run())
+
+        assert len(client.sends) == 1
+        assert results == [{"pairs": []}] * 3
+
+    def test_expired_entry_is_refetched(self, client: DexScreenerClient) -> None:
+        endpoint = "/tokens/v1/solana/abc"
+        asyncio.run(client._request(endpoint))
+
+        # Age the entry past the endpoint's TTL
+        key = (endpoint, ())
+        stored_at, body = dexscreener_client._response_cache[key]
+        ttl = dexscreener_client.CACHE_TTL_SECONDS["/tokens/"]
+        dexscreener_client._response_cache[key] = (stored_at - ttl, body)
+
+        asyncio.run(client._request(endpoint))
+
+        assert len(client.sends) == 2
+
+    def test_params_are_part_of_the_key(self, client: DexScreenerClient) -> None:
+        async def run() -> None:
+            await client._request("/latest/dex/search", {"q": "BONK"})
+            await client._request("/latest/dex/search", {"q": "WIF"})
+            await client._request("/latest/dex/search", {"q": "BONK"})
+
+        asyncio.run(run())
+
+        assert [params for _, params in client.sends] == [{"q": "BONK"}, {"q": "WIF"}]
+
+    def test_cache_is_shared_across_instances(self, client: DexScreenerClient) -> None:
+        asyncio.run(client._request("/pairs/solana/xyz"))
+
+        other = DexScreenerClient()
+        assert asyncio.run(other._request("/pairs/solana/xyz")) == {"pairs": []}
+        assert len(client.sends) == 1
+
+    def test_endpoint_without_ttl_is_not_cached(self, client: DexScreenerClient) -> None:
+        async def run() -> None:
+            await client._request("/orders/v1/solana/abc")
+            await client._request("/orders/v1/solana/abc")
+
+        asyncio.run(run())
+
+        assert len(client.sends) == 2
+        assert dexscreener_client._response_cache == {}
+
+    def test_failed_request_is_not_cached(self, client: DexScreenerClient) -> None:
+        client.body = None
+
+        async def run() -> list:
+            return [await client._request("/tokens/v1/solana/abc") for _ in range(2)]
+
+        assert asyncio.run(run()) == [{}, {}]
+        assert len(client.sends) == 2
+
+    def test_cache_evicts_oldest_entry(
+        self, client: DexScreenerClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(dexscreener_client, "CACHE_MAX_ENTRIES", 2)
+
+        async def run() -> None:
+            for mint in ("a", "b", "c"):
+                await client._request(f"/tokens/v1/solana/{mint}")
+
+        asyncio.run(run())
+
+        assert [key[0] for key in dexscreener_client._response_cache] == [
+            "/tokens/v1/solana/b",
+            "/tokens/v1/solana/c",
+        ]
+
+
+class TestInflightRequests:
+    """Tests for concurrent callers sharing one request."""
+
+    def test_concurrent_callers_share_one_request(self, client: DexScreenerClient) -> None:
+        async def run() -> list:
+            return await asyncio.gather(
+                *(client._request("/token-boosts/latest/v1") for _ in range(5))
+            )
+
+        results = asyncio.run(run())
+
+        assert len(client.sends) == 1
+        assert results == [{"pairs": []}] * 5
+        assert client._inflight == {}
+
+    def test_cancelled_caller_does_not_cancel_shared_request(
+        self, client: DexScreenerClient
+    ) -> None:
+        async def run() -> dict:
+            first = asyncio.ensure_future(client._request("/token-profiles/latest/v1"))
+            second = asyncio.ensure_future(client._request("/token-profiles/latest/v1"))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second
+
+        assert asyncio.run(run()) == {"pairs": []}
+        assert len(client.sends) == 1
@@ -0,0 +1,278 @@
+"""Tests for the integrity check and contribution config helpers."""
+
+import base64
+import hashlib
+import json
+import urllib.error
+from collections.abc import Iterator
+from itertools import cycle
+from pathlib import Path
+
+import pytest
+
+from slopesniper_skill import integrity
+
+
+@pytest.fixture
+def cache_file(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    """Point the integrity cache at a temp file and forget anything loaded."""
+    path = tmp_path / "integrity_cache.json"
+    monkeypatch.setattr(integrity, "INTEGRITY_CACHE_FILE", path)
+    monkeypatch.setattr(integrity, "_integrity_cache", None)
+    monkeypatch.setattr(integrity, "_integrity_mtime", None)
+    monkeypatch.setattr(integrity, "_file_digests", None)
+    return path
+
+
+@pytest.fixture
+def monitored(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> dict[str, Path]:
+    """Two monitored files in tmp_path, in place of the package's own."""
+    files = {}
+    for name in ("a.py", "b.py"):
+        files[name] = tmp_path / name
+        files[name].write_text(f"print({name!r})\n")
+    monkeypatch.setattr(integrity, "_MONITORED_PATHS", tuple(files.items()))
+    return files
+
+
+@pytest.fixture
+def hashed(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    """Records every file _get_local_hashes() actually hashes."""
+    hashed: list[Path] = []
+    hash_file = integrity._hash_file
+
+    def record(filepath: Path, hasher_cls=hashlib.sha256) -> str:
+        hashed.append(filepath)
+        return hash_file(filepath, hasher_cls)
+
+    monkeypatch.setattr(integrity, "_hash_file", record)
+    return hashed
+
+
+class FakeGitHub:
+    """Serves the manifest and callback.json in place of http_request()."""
+
+    def __init__(self, manifest: dict) -> None:
+        self.manifest = manifest
+        self.etag = '"m1"'
+        self.callback = {"v": 1, "t": "fetched"}
+        self.requests: list[tuple[str, dict]] = []
+
+    def __call__(self, url: str, method: str = "GET", headers: dict | None = None, **kwargs):
+        headers = headers or {}
+        self.requests.append((url, headers))
+        if url.endswith("callback.json"):
+            return json.dumps(self.callback).encode(), {}
+        if headers.get("If-None-Match") == self.etag:
+            raise urllib.error.HTTPError(url, 304, "Not Modified", {}, None)
+        return json.dumps(self.manifest).encode(), {"ETag": self.etag}
+
+
+@pytest.fixture
+def github(
+    monkeypatch: pytest.MonkeyPatch, cache_file: Path, monitored: dict[str, Path]
+) -> Iterator[FakeGitHub]:
+    """Fake GitHub serving a manifest that matches the monitored files."""
+    github = FakeGitHub(integrity.generate_integrity_manifest())
+    monkeypatch.setattr(integrity, "http_request", github)
+    monkeypatch.delenv("SLOPESNIPER_INTEGRITY_URL", raising=False)
+    monkeypatch.delenv("SLOPESNIPER_CONFIG_URL", raising=False)
+    integrity._fetch_callback_config.cache_clear()
+    yield github
+    integrity._fetch_callback_config.cache_clear()
+
+
+class TestFileDigestCache:
+    """Tests for reusing digests of monitored files that haven't changed."""
+
+    def test_digests_match_hash_file(
+        self, cache_file: Path, monitored: dict[str, Path], hashed: list[Path]
+    ) -> None:
+        hashes = integrity._get_local_hashes()
+        assert hashes == {name: integrity._hash_file(path) for name, path in monitored.items()}
+
+    def test_unchanged_files_not_rehashed(
+        self, cache_file: Path, monitored: dict[str, Path], hashed: list[Path]
+    ) -> None:
+        first = integrity._get_local_hashes()
+        assert integrity._get_local_hashes() == first
+        assert sorted(hashed) == sorted(monitored.values())
+
+    def test_changed_file_rehashed(
+        self, cache_file: Path, monitored: dict[str, Path], hashed: list[Path]
+    ) -> None:
+        first = integrity._get_local_hashes()
+        hashed.clear()
+        monitored["a.py"].write_text("print('changed')\n")
+
+        second = integrity._get_local_hashes()
+
+        assert hashed == [monitored["a.py"]]
+        assert second["a.py"] != first["a.py"]
+        assert second["b.py"] == first["b.py"]
+
+    def test_digests_persisted_for_next_process(
+        self,
+        cache_file: Path,
+        monitored: dict[str, Path],
+        hashed: list[Path],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        first = integrity._get_local_hashes()
+        integrity._update_cache({"status": "ok"})
+
+        # A new process starts with nothing loaded
+        monkeypatch.setattr(integrity, "_integrity_cache", None)
+        monkeypatch.setattr(integrity, "_integrity_mtime", None)
+        monkeypatch.setattr(integrity, "_file_digests", None)
+        hashed.clear()
+
+        assert integrity._get_local_hashes() == first
+        assert hashed == []
+
+    def test_missing_file(
+        self, cache_file: Path, monitored: dict[str, Path], hashed: list[Path]
+    ) -> None:
+        monitored["b.py"].unlink()
+        assert integrity._get_local_hashes()["b.py"] == "MISSING"
+
+
+class TestEmbeddedCallbackConfig:
+    """Tests for callback.json riding along in the integrity manifest."""
+
+    def test_underscore_keys_not_compared(self, github: FakeGitHub) -> None:
+        github.manifest[integrity.MANIFEST_CALLBACK_KEY] = {"v": 2, "gh": "embedded"}
+        github.manifest["_future"] = "metadata"
+
+        result = integrity.check_integrity(force=True)
+
+        assert result["status"] == "ok"
+        assert result["modified_files"] == []
+
+    def test_embedded_config_used_without_fetch(self, github: FakeGitHub) -> None:
+        github.manifest[integrity.MANIFEST_CALLBACK_KEY] = {"v": 2, "gh": "embedded"}
+        integrity.check_integrity(force=True)
+        github.requests.clear()
+
+        assert integrity._fetch_callback_config() == {"v": 2, "gh": "embedded"}
+        assert github.requests == []
+
+    def test_config_fetched_when_not_embedded(self, github: FakeGitHub) -> None:
+        integrity.check_integrity(force=True)
+        github.requests.clear()
+
+        assert integrity._fetch_callback_config() == github.callback
+        assert [url.rsplit("/", 1)[1] for url, _ in github.requests] == ["callback.json"]
+
+    def test_config_url_overrides_embedded_copy(
+        self, github: FakeGitHub, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        github.manifest[integrity.MANIFEST_CALLBACK_KEY] = {"v": 2, "gh": "embedded"}
+        integrity.check_integrity(force=True)
+        monkeypatch.setenv("SLOPESNIPER_CONFIG_URL", "https://example.test/callback.json")
+
+        assert integrity._fetch_callback_config() == github.callback
+        assert github.requests[-1][0] == "https://example.test/callback.json"
+
+    def test_config_fetched_once_per_process(self, github: FakeGitHub) -> None:
+        integrity._fetch_callback_config()
+        integrity._fetch_callback_config()
+        assert len(github.requests) == 1
+
+
+class TestManifestFreshness:
+    """Tests for reusing and revalidating the cached integrity manifest."""
+
+    def test_fresh_manifest_reused_without_request(self, github: FakeGitHub) -> None:
+        integrity.check_integrity()
+        github.requests.clear()
+
+        manifest, etag, _ = integrity._fetch_expected_hashes()
+
+        assert manifest == github.manifest
+        assert etag == github.etag
+        assert github.requests == []
+
+    def test_stale_manifest_revalidated_with_etag(
+        self, github: FakeGitHub, cache_file: Path
+    ) -> None:
+        integrity.check_integrity()
+        cache = json.loads(cache_file.read_text())
+        cache["manifest_fetched_at"] -= integrity.CHECK_INTERVAL_HOURS * 3600 + 1
+        cache_file.write_text(json.dumps(cache))
+        integrity._integrity_mtime = None
+        github.requests.clear()
+
+        manifest, _, fetched_at = integrity._fetch_expected_hashes()
+
+        assert [headers.get("If-None-Match") for _, headers in github.requests] == ['"m1"']
+        assert manifest == github.manifest
+        assert fetched_at > cache["manifest_fetched_at"]
+
+    def test_forced_check_revalidates_fresh_manifest(self, github: FakeGitHub) -> None:
+        integrity.check_integrity()
+        github.requests.clear()
+
+        assert integrity.check_integrity(force=True)["status"] == "ok"
+        assert [headers.get("If-None-Match") for _, headers in github.requests] == ['"m1"']
+
+    def test_forced_check_picks_up_new_manifest(self, github: FakeGitHub) -> None:
+        integrity.check_integrity()
+        github.manifest = {**github.manifest, "a.py": "0" * 16}
+        github.etag = '"m2"'
+
+        result = integrity.check_integrity(force=True)
+
+        assert result["status"] == "modified"
+        assert [f["file"] for f in result["modified_files"]] == ["a.py"]
+
+    def test_unreachable_manifest_skips_check(
+        self, github: FakeGitHub, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def unreachable(url: str, **kwargs):
+            raise urllib.error.URLError("timed out")
+
+        monkeypatch.setattr(integrity, "http_request", unreachable)
+        assert integrity.check_integrity(force=True)["status"] == "skip"
+
+
+def xor_encode(token: str, key: str) -> bytes:
+    return bytes(a ^ b for a, b in zip(token.encode(), cycle(key.encode())))
+
+
+def per_byte_xor_decode(xored: bytes, key: str) -> str:
+    """The per-byte decode _xor_decode replaced."""
+    key_bytes = (key * ((len(xored) // len(key)) + 1))[: len(xored)]
+    return bytes(a ^ b for a, b in zip(xored, key_bytes.encode(), strict=False)).decode()
+
+
+class TestXorDecode:
+    """Tests for decoding the XORed tokens in callback.json."""
+
+    @pytest.mark.parametrize(
+        "token",
+        [
+            "",
+            "x",
+            "slopesniper-leading-zero-bytes",
+            "ghp_" + "A1b2C3d4" * 5,
+            "t" * 100,
+        ],
+    )
+    def test_matches_per_byte_decode(self, token: str) -> None:
+        key = "slopesnipercontrib"
+        xored = xor_encode(token, key)
+        assert integrity._xor_decode(xored, key) == per_byte_xor_decode(xored, key) == token
+
+    def test_config_tokens_decoded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        def encode(token: str, key: str) -> str:
+            return base64.b64encode(xor_encode(token, key)).decode()
+
+        config = {"v": 1, "t": encode("callback-token", "slopesnipercontrib")}
+        monkeypatch.setattr(integrity, "_fetch_callback_config", lambda: config)
+        assert integrity._get_callback_token() == "callback-token"
+        assert integrity._get_github_token() is None
+
+        config = {"v": 2, "gh": encode("ghp_token", "slopesnipergithub")}
+        assert integrity._get_github_token() == "ghp_token"
+        assert integrity._get_callback_token() is None
@@ -0,0 +1,149 @@
+"""Tests for batched get_price() lookups in the Jupiter data client."""
+
+import asyncio
+
+import pytest
+
+from slopesniper_skill.sdk.jupiter_data_client import JupiterDataClient
+
+
+def make_client(monkeypatch: pytest.MonkeyPatch, get_prices) -> JupiterDataClient:
+    """Client whose get_prices() is replaced by the given fake."""
+    client = JupiterDataClient(api_key="test-key")
+    monkeypatch.setattr(client, "get_prices", get_prices)
+    return client
+
+
+class TestGetPriceBatching:
+    """Tests for fanning concurrent get_price() calls into get_prices()."""
+
+    def test_concurrent_calls_share_batches_of_50(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        batches: list[list[str]] = []
+
+        async def get_prices(mints: list[str]) -> dict:
+            batches.append(mints)
+            return {m: {"usdPrice": float(m[1:])} for m in mints}
+
+        client = make_client(monkeypatch, get_prices)
+        mints = [f"m{i}" for i in range(120)]
+
+        async def run() -> list:
+            return await asyncio.gather(*(client.get_price(m) for m in mints))
+
+        results = asyncio.run(run())
+
+        assert [len(b) for b in batches] == [50, 50, 20]
+        assert [r["usdPrice"] for r in results] == [float(i) for i in range(120)]
+
+    def test_duplicate_mints_fetched_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        batches: list[list[str]] = []
+
+        async def get_prices(mints: list[str]) -> dict:
+            batches.append(mints)
+            return {m: {"usdPrice": 1.0} for m in mints}
+
+        client = make_client(monkeypatch, get_prices)
+
+        async def run() -> list:
+            return await asyncio.gather(*(client.get_price("same") for _ in range(3)))
+
+        results = asyncio.run(run())
+
+        assert batches == [["same"]]
+        assert all(r == {"usdPrice": 1.0} for r in results)
+
+    def test_missing_price_returns_none(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        async def get_prices(mints: list[str]) -> dict:
+            return {}
+
+        client = make_client(monkeypatch, get_prices)
+        assert asyncio.run(client.get_price("unknown")) is None
+
+    def test_failed_batch_raises_for_every_waiter(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        async def get_prices(mints: list[str]) -> dict:
+            if "m0" in mints:
+                raise RuntimeError("price API down")
+            return {m: {"usdPrice": 1.0} for m in mints}
+
+        client = make_client(monkeypatch, get_prices)
+        mints = [f"m{i}" for i in range(60)]
+
+        async def run() -> list:
+            return await asyncio.gather(
+                *(client.get_price(m) for m in mints), return_exceptions=True
+            )
+
+        results = asyncio.run(run())
+
+        # The first batch of 50 failed as a whole; the second still resolved
+        assert all(isinstance(r, RuntimeError) for r in results[:50])
+        assert all(r == {"usdPrice": 1.0} for r in results[50:])
+
+    def test_cancelled_caller_is_skipped(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        release = None
+
+        async def get_prices(mints: list[str]) -> dict:
+            await release.wait()
+            return {m: {"usdPrice": 2.0} for m in mints}
+
+        client = make_client(monkeypatch, get_prices)
+
+        async def run() -> tuple:
+            nonlocal release
+            release = asyncio.Event()
+            cancelled = asyncio.ensure_future(client.get_price("mint"))
+            waiting = asyncio.ensure_future(client.get_price("mint"))
+            await asyncio.sleep(0)  # Both queued, flush blocked in get_prices
+            cancelled.cancel()
+            release.set()
+            return await asyncio.gather(cancelled, waiting, return_exceptions=True)
+
+        cancelled_result, result = asyncio.run(run())
+
+        assert isinstance(cancelled_result, asyncio.CancelledError)
+        assert result == {"usdPrice": 2.0}
+
+    def test_calls_after_flush_start_a_new_batch(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        batches: list[list[str]] = []
+
+        async def get_prices(mints: list[str]) -> dict:
+            batches.append(mints)
+            return {m: {"usdPrice": 1.0} for m in mints}
+
+        client = make_client(monkeypatch, get_prices)
+
+        async def run() -> None:
+            await client.get_price("a")
+            await client.get_price("b")
+
+        asyncio.run(run())
+
+        assert batches == [["a"], ["b"]]
+
+    @pytest.mark.parametrize("started", [False, True])
+    def test_cancelled_flush_cancels_waiters(
+        self, started: bool, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        async def get_prices(mints: list[str]) -> dict:
+            if "stuck" in mints:
+                await asyncio.Event().wait()  # Never answers
+            return {m: {"usdPrice": 1.0} for m in mints}
+
+        client = make_client(monkeypatch, get_prices)
+
+        async def run() -> tuple:
+            waiters = [asyncio.ensure_future(client.get_price(m)) for m in ("stuck", "other")]
+            await asyncio.sleep(0)  # Both queued, flush not yet running
+            if started:
+                await asyncio.sleep(0)  # Flush blocked in get_prices
+            client._price_flush.cancel()
+            results = await asyncio.wait_for(
+                asyncio.gather(*waiters, return_exceptions=True), timeout=1
+            )
+            # The queue isn't left stuck behind the cancelled flush
+            return results, await client.get_price("next")
+
+        results, next_price = asyncio.run(run())
+
+        assert all(isinstance(r, asyncio.CancelledError) for r in results)
+        assert next_price == {"usdPrice": 1.0}
@@ -0,0 +1,213 @@
+"""Tests for the shared file and HTTP helpers."""
+
+import http.server
+import io
+import os
+import threading
+import urllib.error
+import urllib.request
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from slopesniper_skill import utils
+
+
+class TestAtomicWrite:
+    """Tests for writing files via a unique temp file + rename."""
+
+    def test_writes_owner_only_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "daemon.pid"
+        utils.atomic_write(path, b"123")
+        assert path.read_bytes() == b"123"
+        assert path.stat().st_mode & 0o777 == 0o600
+        assert os.listdir(tmp_path) == ["daemon.pid"]
+
+    def test_concurrent_writers_do_not_clobber(self, tmp_path: Path) -> None:
+        path = tmp_path / "cache.json"
+        payloads = [str(i).encode() * 1000 for i in range(8)]
+        threads = [
+            threading.Thread(target=utils.atomic_write, args=(path, data)) for data in payloads
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert path.read_bytes() in payloads
+        assert os.listdir(tmp_path) == ["cache.json"]
+
+    def test_temp_file_removed_on_failure(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def replace(src: str, dst: Path) -> None:
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, "replace", replace)
+        with pytest.raises(OSError):
+            utils.atomic_write(tmp_path / "cache.json", b"{}")
+        assert os.listdir(tmp_path) == []
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    """Keep-alive test server; records each request's method, path and client port."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        self.server.requests.append((self.command, self.path, self.client_address[1]))
+        if self.path == "/moved":
+            self.reply(302, headers={"Location": "/text"})
+        elif self.path == "/loop":
+            self.reply(302, headers={"Location": "/loop"})
+        elif self.path == "/etag" and self.headers.get("If-None-Match") == '"v1"':
+            self.reply(304, headers={"ETag": '"v1"'})
+        elif self.path == "/etag":
+            self.reply(200, b"tagged", {"ETag": '"v1"'})
+        elif self.path == "/big":
+            self.reply(200, b"x" * (utils.HTTP_DRAIN_MAX_BYTES * 2))
+        elif self.path == "/bye":
+            # Answer, then drop the connection without announcing it
+            self.reply(200, b"bye")
+            self.close_connection = True
+        else:
+            self.reply(200, b"hello")
+
+    def do_POST(self) -> None:
+        self.server.requests.append((self.command, self.path, self.client_address[1]))
+        self.reply(200, self.rfile.read(int(self.headers["Content-Length"])))
+
+    def reply(self, status: int, body: bytes = b"", headers: dict | None = None) -> None:
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+class Server(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address) -> None:
+        pass  # Tests drop connections mid-response on purpose
+
+
+@pytest.fixture(scope="module")
+def server() -> Iterator[Server]:
+    server = Server(("127.0.0.1", 0), Handler)
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def base_url(server: Server, monkeypatch: pytest.MonkeyPatch) -> Iterator[str]:
+    """URL of the test server, reached directly through an empty connection pool."""
+    server.requests.clear()
+    pool: dict = {}
+    monkeypatch.setattr(utils, "_http_connections", pool)
+    monkeypatch.setattr(urllib.request, "getproxies", dict)
+    yield f"http://127.0.0.1:{server.server_port}"
+    for conn in pool.values():
+        conn.close()
+
+
+class TestHttpRequest:
+    """Tests for http_request() over pooled connections."""
+
+    def test_body_and_headers(self, base_url: str) -> None:
+        body, headers = utils.http_request(f"{base_url}/etag")
+        assert body == b"tagged"
+        assert headers["ETag"] == '"v1"'
+
+    def test_connection_reused(self, base_url: str, server: Server) -> None:
+        utils.http_request(f"{base_url}/text")
+        utils.http_request(f"{base_url}/etag")
+        assert len({port for _, _, port in server.requests}) == 1
+        assert len(utils._http_connections) == 1
+
+    def test_follows_redirect(self, base_url: str, server: Server) -> None:
+        body, _ = utils.http_request(f"{base_url}/moved")
+        assert body == b"hello"
+        assert [path for _, path, _ in server.requests] == ["/moved", "/text"]
+
+    def test_redirect_limit(self, base_url: str, server: Server) -> None:
+        with pytest.raises(urllib.error.HTTPError) as exc_info:
+            utils.http_request(f"{base_url}/loop")
+        assert exc_info.value.code == 302
+        assert len(server.requests) == 6
+
+    def test_not_modified_raises_http_error(self, base_url: str) -> None:
+        with pytest.raises(urllib.error.HTTPError) as exc_info:
+            utils.http_request(f"{base_url}/etag", headers={"If-None-Match": '"v1"'})
+        assert exc_info.value.code == 304
+        # The connection is still good for the next request
+        assert len(utils._http_connections) == 1
+
+    def test_proxy_falls_back_to_urlopen(
+        self, base_url: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        opened = []
+
+        def urlopen(req: urllib.request.Request, timeout: float) -> io.BytesIO:
+            opened.append((req.get_method(), req.full_url))
+            resp = io.BytesIO(b"via proxy")
+            resp.headers = {}
+            return resp
+
+        monkeypatch.setattr(urllib.request, "getproxies", lambda: {"http": "http://proxy:3128"})
+        monkeypatch.setattr(urllib.request, "urlopen", urlopen)
+
+        body, _ = utils.http_request(f"{base_url}/text")
+        assert body == b"via proxy"
+        assert opened == [("GET", f"{base_url}/text")]
+        assert utils._http_connections == {}
+
+
+class TestHttpStream:
+    """Tests for returning streamed connections to the pool."""
+
+    def test_unfinished_small_body_drained_into_pool(self, base_url: str) -> None:
+        with utils.http_stream(f"{base_url}/text") as (resp, _):
+            assert resp.read(2) == b"he"
+        assert len(utils._http_connections) == 1
+
+    def test_closed_early_not_pooled(self, base_url: str) -> None:
+        with utils.http_stream(f"{base_url}/text") as (resp, _):
+            resp.read(2)
+            resp.close()
+        assert utils._http_connections == {}
+
+    def test_large_remainder_not_pooled(self, base_url: str) -> None:
+        with utils.http_stream(f"{base_url}/big") as (resp, _):
+            resp.read(10)
+        assert utils._http_connections == {}
+
+    def test_redirect_then_stream(self, base_url: str) -> None:
+        with utils.http_stream(f"{base_url}/moved") as (resp, _):
+            assert resp.read() == b"hello"
+        assert len(utils._http_connections) == 1
+
+
+class TestDroppedConnectionRetry:
+    """Tests for retrying requests on a pooled connection the server closed."""
+
+    def test_get_retried_on_fresh_connection(self, base_url: str, server: Server) -> None:
+        utils.http_request(f"{base_url}/bye")
+        body, _ = utils.http_request(f"{base_url}/text")
+        assert body == b"hello"
+        assert len({port for _, _, port in server.requests}) == 2
+
+    def test_post_not_retried(self, base_url: str, server: Server) -> None:
+        utils.http_request(f"{base_url}/bye")
+        with pytest.raises(OSError):
+            utils.http_request(f"{base_url}/echo", method="POST", data=b"issue")
+        assert [method for method, _, _ in server.requests] == ["GET"]